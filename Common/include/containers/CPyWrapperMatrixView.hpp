@@ -64,6 +64,13 @@
     for (unsigned long j = 0; j < cols_; ++j) vals[j] = Get(row, j);                                             \
     return vals;                                                                                                 \
   }                                                                                                              \
+  /*! \brief Gets all the values of the matrix, row by row (rows * cols). */                                     \
+  std::vector<passivedouble> Get() const {                                                                       \
+    std::vector<passivedouble> vals(rows_ * cols_);                                                              \
+    for (unsigned long i = 0; i < rows_; ++i)                                                                    \
+      for (unsigned long j = 0; j < cols_; ++j) vals[i * cols_ + j] = Get(i, j);                                 \
+    return vals;                                                                                                 \
+  }                                                                                                              \
   /*! \brief Sets the value for a (row, column) pair. This clears derivative information. */                     \
   void Set(unsigned long row, unsigned long col, passivedouble val) { Access(row, col) = val; }                  \
                                                                                                                  \
@@ -71,6 +78,13 @@
   void Set(unsigned long row, std::vector<passivedouble> vals) {                                                 \
     unsigned long j = 0;                                                                                         \
     for (const auto& val : vals) Set(row, j++, val);                                                             \
+  }                                                                                                              \
+                                                                                                                 \
+  /*! \brief Sets all the values of the matrix, row by row (rows * cols). */                                     \
+  void Set(std::vector<passivedouble> vals) {                                                                    \
+    if (vals.size() != rows_ * cols_) SU2_MPI::Error(name_ + " size mismatch", "PY_WRAPPER_MATRIX_INTERFACE");   \
+    for (unsigned long i = 0; i < rows_; ++i)                                                                    \
+      for (unsigned long j = 0; j < cols_; ++j) Set(i, j, vals[i * cols_ + j]);                                  \
   }
 
 /*!
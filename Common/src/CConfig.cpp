@@ -2800,6 +2800,15 @@ void CConfig::SetConfig_Options() {
   /* DESCRIPTION: Finite different step for gradient estimation */
   addPythonOption("FIN_DIFF_STEP");
 
+  /* DESCRIPTION: Finite difference scheme for gradient estimation (FORWARD, CENTRAL) */
+  addPythonOption("FIN_DIFF_SCHEME");
+
+  /* DESCRIPTION: Number of finite difference steps run simultaneously */
+  addPythonOption("FIN_DIFF_JOBS");
+
+  /* DESCRIPTION: Restart finite difference steps from the baseline solution */
+  addPythonOption("FIN_DIFF_WARM_START");
+
   /* DESCRIPTION: Verbosity of the python scripts to Stdout */
   addPythonOption("CONSOLE");
 
@@ -2878,6 +2887,18 @@ void CConfig::SetConfig_Options() {
   /* DESCRIPTION: Multipoint mesh filenames, if using different meshes for each point */
   addPythonOption("MULTIPOINT_MESH_FILENAME");
 
+  /* DESCRIPTION: Number of multipoint points evaluated simultaneously after the first */
+  addPythonOption("MULTIPOINT_JOBS");
+
+  /* DESCRIPTION: Folder of the cache of design evaluation results */
+  addPythonOption("RESULT_CACHE");
+
+  /* DESCRIPTION: Size limit of the result cache in MB */
+  addPythonOption("RESULT_CACHE_SIZE");
+
+  /* DESCRIPTION: Merging of the partitioned solution by the python scripts */
+  addPythonOption("MERGE_ENGINE");
+
   /*--- options that are used for the output ---*/
   /*!\par CONFIG_CATEGORY:Output Options\ingroup Config*/
 
@@ -344,6 +344,36 @@ class CDriverBase {
    */
   unsigned long GetMarkerNode(unsigned short iMarker, unsigned long iVertex) const;
 
+  /*!
+   * \brief Get the global node indices of all the vertices of a marker.
+   * \param[in] iMarker - Marker index.
+   * \return Global node indices (nVertex).
+   */
+  inline vector<unsigned long> GetMarkerNodeGlobalIndices(unsigned short iMarker) const {
+    const auto nVertex = GetNumberMarkerNodes(iMarker);
+    vector<unsigned long> values(nVertex);
+
+    for (auto iVertex = 0ul; iVertex < nVertex; ++iVertex) {
+      values[iVertex] = main_geometry->nodes->GetGlobalIndex(main_geometry->vertex[iMarker][iVertex]->GetNode());
+    }
+    return values;
+  }
+
+  /*!
+   * \brief Get the halo flags of all the vertices of a marker.
+   * \param[in] iMarker - Marker index.
+   * \return Node domain flags (nVertex), false for halo nodes.
+   */
+  inline vector<bool> GetMarkerNodeDomains(unsigned short iMarker) const {
+    const auto nVertex = GetNumberMarkerNodes(iMarker);
+    vector<bool> values(nVertex);
+
+    for (auto iVertex = 0ul; iVertex < nVertex; ++iVertex) {
+      values[iVertex] = main_geometry->nodes->GetDomain(main_geometry->vertex[iMarker][iVertex]->GetNode());
+    }
+    return values;
+  }
+
   /*!
    * \brief Get the normal vector of a marker vertex.
    * \param[in] iMarker - Marker index.
@@ -387,6 +417,28 @@ class CDriverBase {
     }
   }
 
+  /*!
+   * \brief Set the mesh displacements of all the vertices of a marker.
+   * \note This is the bulk version of SetMarkerCustomDisplacement, with a single call from Python.
+   * \param[in] iMarker - Marker index.
+   * \param[in] values - Node displacements, vertex by vertex (nVertex * nDim).
+   */
+  inline void SetMarkerCustomDisplacements(unsigned short iMarker, vector<passivedouble> values) {
+    const auto nVertex = GetNumberMarkerNodes(iMarker);
+    const auto nDim = GetNumberDimensions();
+    if (values.size() != nVertex * nDim) {
+      SU2_MPI::Error("Size of the displacements does not match the marker.", CURRENT_FUNCTION);
+    }
+    auto* nodes = GetSolverAndCheckMarker(MESH_SOL)->GetNodes();
+
+    for (auto iVertex = 0ul; iVertex < nVertex; ++iVertex) {
+      const auto iPoint = main_geometry->vertex[iMarker][iVertex]->GetNode();
+      for (auto iDim = 0u; iDim < nDim; iDim++) {
+        nodes->SetBound_Disp(iPoint, iDim, values[iVertex * nDim + iDim]);
+      }
+    }
+  }
+
   /*!
    * \brief Get the mesh velocities currently imposed on a marker vertex.
    * \param[in] iMarker - Marker index.
@@ -614,6 +666,28 @@ class CDriverBase {
     return FlowLoad;
   }
 
+  /*!
+   * \brief Get the fluid forces at all the vertices of a solid wall marker of the flow solver.
+   * \note This is the bulk version of GetMarkerFlowLoad, with a single call from Python.
+   * \param[in] iMarker - Marker identifier.
+   * \return Vector of loads, vertex by vertex (nVertex * nDim).
+   */
+  inline vector<passivedouble> GetMarkerFlowLoads(unsigned short iMarker) const {
+    const auto nVertex = GetNumberMarkerNodes(iMarker);
+    const auto nDim = GetNumberDimensions();
+    vector<passivedouble> FlowLoads(nVertex * nDim, 0.0);
+    const auto* solver = GetSolverAndCheckMarker(FLOW_SOL, iMarker);
+
+    if (main_config->GetSolid_Wall(iMarker)) {
+      for (auto iVertex = 0ul; iVertex < nVertex; ++iVertex) {
+        for (auto iDim = 0u; iDim < nDim; ++iDim) {
+          FlowLoads[iVertex * nDim + iDim] = SU2_TYPE::GetValue(solver->GetVertexTractions(iMarker, iVertex, iDim));
+        }
+      }
+    }
+    return FlowLoads;
+  }
+
   /*!
    * \brief Set the adjoint of the flow tractions of the flow solver.
    * \note This can be the input of the flow solver in an adjoint FSI setting.
@@ -31,10 +31,12 @@
 
 import os
 import csv
+import shutil
+import hashlib
 import numpy as np
-import scipy.spatial.distance as spdist
+from scipy.spatial import cKDTree
+from scipy.linalg import lu_factor, lu_solve
 from math import *
-from rtree import index
 from petsc4py import PETSc
 
 # ----------------------------------------------------------------------
@@ -155,6 +157,18 @@ class Interface:
             self.MappingMatrixA_T = None
             self.MappingMatrixB = None
             self.MappingMatrixB_T = None
+            self.interpolationSolver = (
+                None  # persistent iterative solver of the interpolation system
+            )
+            self.interpolationSolver_T = (
+                None  # persistent iterative solver of the transposed system
+            )
+            self.interpolationLU = (
+                None  # LU factorization of the kernel block, for the direct solver
+            )
+            self.maxDirectInterpolationSize = (
+                2000  # largest system factorized with MAPPING_SOLVER = AUTO
+            )
             self.d_RBF = self.nDim + 1
         else:
             self.MappingMatrix = (
@@ -399,14 +413,30 @@ class Interface:
 
         self.MPIBarrier()
         # --- Calculate the total number of nodes at the fluid interface (sum over all the partitions) ---
-        # Calculate the number of halo nodes on each partition
-        self.nLocalFluidInterfaceHaloNode = 0
-        for iVertex in range(self.nLocalFluidInterfaceNodes):
-            iPoint = FluidSolver.GetMarkerNode(self.fluidInterfaceIdentifier, iVertex)
-            if not FluidSolver.GetNodeDomain(iPoint):
-                GlobalIndex = FluidSolver.GetNodeGlobalIndex(iPoint)
-                self.FluidHaloNodeList[GlobalIndex] = iVertex
-                self.nLocalFluidInterfaceHaloNode += 1
+        # Calculate the number of halo nodes on each partition, the global indices and halo flags
+        # of the whole marker are kept to exchange the interface data in bulk
+        if self.nLocalFluidInterfaceNodes != 0:
+            fluidGlobalIndices = np.array(
+                FluidSolver.GetMarkerNodeGlobalIndices(self.fluidInterfaceIdentifier),
+                dtype=int,
+            )
+            fluidDomains = np.array(
+                FluidSolver.GetMarkerNodeDomains(self.fluidInterfaceIdentifier),
+                dtype=bool,
+            )
+        else:
+            fluidGlobalIndices = np.zeros(0, dtype=int)
+            fluidDomains = np.zeros(0, dtype=bool)
+        self.localFluidInterfacePhysicalVertices = np.flatnonzero(fluidDomains)
+        self.localFluidInterfacePhysicalIndices = fluidGlobalIndices[fluidDomains]
+        self.localFluidInterfaceHaloVertices = np.flatnonzero(~fluidDomains)
+        self.localFluidInterfaceHaloIndices = fluidGlobalIndices[~fluidDomains]
+        for GlobalIndex, iVertex in zip(
+            self.localFluidInterfaceHaloIndices.tolist(),
+            self.localFluidInterfaceHaloVertices.tolist(),
+        ):
+            self.FluidHaloNodeList[GlobalIndex] = iVertex
+        self.nLocalFluidInterfaceHaloNode = self.localFluidInterfaceHaloVertices.size
         # Calculate the number of physical (= not halo) nodes on each partition
         self.nLocalFluidInterfacePhysicalNodes = (
             self.nLocalFluidInterfaceNodes - self.nLocalFluidInterfaceHaloNode
@@ -417,14 +447,25 @@ class Interface:
             self.FluidHaloNodeList = [{}]
 
         # Same thing for the solid part
-        self.nLocalSolidInterfaceHaloNode = 0
-        for iVertex in range(self.nLocalSolidInterfaceNodes):
-            if SolidSolver.IsAHaloNode(self.solidInterfaceIdentifier, iVertex):
-                GlobalIndex = SolidSolver.getVertexGlobalIndex(
-                    self.solidInterfaceIdentifier, iVertex
-                )
-                self.SolidHaloNodeList[GlobalIndex] = iVertex
-                self.nLocalSolidInterfaceHaloNode += 1
+        if self.nLocalSolidInterfaceNodes != 0:
+            solidGlobalIndices = np.array(
+                SolidSolver.getVertexGlobalIndices(self.solidInterfaceIdentifier),
+                dtype=int,
+            )
+            solidHalos = np.array(
+                SolidSolver.AreHaloNodes(self.solidInterfaceIdentifier), dtype=bool
+            )
+        else:
+            solidGlobalIndices = np.zeros(0, dtype=int)
+            solidHalos = np.zeros(0, dtype=bool)
+        self.localSolidInterfacePhysicalVertices = np.flatnonzero(~solidHalos)
+        self.localSolidInterfacePhysicalIndices = solidGlobalIndices[~solidHalos]
+        for GlobalIndex, iVertex in zip(
+            solidGlobalIndices[solidHalos].tolist(),
+            np.flatnonzero(solidHalos).tolist(),
+        ):
+            self.SolidHaloNodeList[GlobalIndex] = iVertex
+        self.nLocalSolidInterfaceHaloNode = int(np.count_nonzero(solidHalos))
         self.nLocalSolidInterfacePhysicalNodes = (
             self.nLocalSolidInterfaceNodes - self.nLocalSolidInterfaceHaloNode
         )
@@ -539,6 +580,14 @@ class Interface:
             self.solidGlobalIndexRange = list()
             self.solidGlobalIndexRange.append(temp)
 
+        # --- Indices of the local physical interface nodes in the PETSc vectors ---
+        self.localFluidInterfacePETScIndices = self.__getGlobalIndex(
+            "fluid", myid, 0
+        ) + np.arange(self.nLocalFluidInterfacePhysicalNodes, dtype=PETSc.IntType)
+        self.localSolidInterfacePETScIndices = self.__getGlobalIndex(
+            "solid", myid, 0
+        ) + np.arange(self.nLocalSolidInterfacePhysicalNodes, dtype=PETSc.IntType)
+
         self.MPIPrint(
             "Total number of fluid interface nodes (halo nodes included) : {}".format(
                 self.nFluidInterfaceNodes
@@ -721,9 +770,9 @@ class Interface:
             MPIsize = 1
 
         # --- Get the fluid interface from fluid solver on each partition ---
-        GlobalIndex = int()
-        localIndex = 0
-        fluidIndexing_temp = {}
+        # Note that the fluid solver is separated in more processors outside the python script
+        # thus when, from a core, we request for the vertices on the interface, we only obtain
+        # those in that core
         self.localFluidInterface_array_X_init = np.zeros(
             (self.nLocalFluidInterfacePhysicalNodes)
         )
@@ -733,25 +782,24 @@ class Interface:
         self.localFluidInterface_array_Z_init = np.zeros(
             (self.nLocalFluidInterfacePhysicalNodes)
         )
-        for iVertex in range(self.nLocalFluidInterfaceNodes):
-            # Note that the fluid solver is separated in more processors outside the python script
-            # thus when, from a core, we request for the vertices on the interface, we only obtain
-            # those in that core
-            iPoint = FluidSolver.GetMarkerNode(self.fluidInterfaceIdentifier, iVertex)
-            GlobalIndex = FluidSolver.GetNodeGlobalIndex(iPoint)
-            if self.nDim == 2:
-                posx, posy = FluidSolver.InitialCoordinates().Get(iPoint)
-                posz = 0
-            else:
-                posx, posy, posz = FluidSolver.InitialCoordinates().Get(iPoint)
-            if GlobalIndex not in self.FluidHaloNodeList[myid].keys():
-                fluidIndexing_temp[GlobalIndex] = self.__getGlobalIndex(
-                    "fluid", myid, localIndex
-                )
-                self.localFluidInterface_array_X_init[localIndex] = posx
-                self.localFluidInterface_array_Y_init[localIndex] = posy
-                self.localFluidInterface_array_Z_init[localIndex] = posz
-                localIndex += 1
+        if self.nLocalFluidInterfaceNodes != 0:
+            fluidInitialCoordinates = np.array(
+                FluidSolver.MarkerInitialCoordinates(
+                    self.fluidInterfaceIdentifier
+                ).Get()
+            ).reshape(self.nLocalFluidInterfaceNodes, -1)[
+                self.localFluidInterfacePhysicalVertices
+            ]
+            self.localFluidInterface_array_X_init[:] = fluidInitialCoordinates[:, 0]
+            self.localFluidInterface_array_Y_init[:] = fluidInitialCoordinates[:, 1]
+            if self.nDim == 3:
+                self.localFluidInterface_array_Z_init[:] = fluidInitialCoordinates[:, 2]
+        fluidIndexing_temp = dict(
+            zip(
+                self.localFluidInterfacePhysicalIndices.tolist(),
+                self.localFluidInterfacePETScIndices.tolist(),
+            )
+        )
         if self.have_MPI:
             fluidIndexing_temp = self.comm.allgather(fluidIndexing_temp)
             for ii in range(len(fluidIndexing_temp)):
@@ -763,26 +811,29 @@ class Interface:
         del fluidIndexing_temp
 
         # --- Get the solid interface from solid solver on each partition ---
-        localIndex = 0
-        solidIndexing_temp = {}
         self.localSolidInterface_array_X_init = np.zeros(self.nLocalSolidInterfaceNodes)
         self.localSolidInterface_array_Y_init = np.zeros(self.nLocalSolidInterfaceNodes)
         self.localSolidInterface_array_Z_init = np.zeros(self.nLocalSolidInterfaceNodes)
-        for iVertex in range(self.nLocalSolidInterfaceNodes):
-            GlobalIndex = SolidSolver.getVertexGlobalIndex(
-                self.solidInterfaceIdentifier, iVertex
-            )
-            posx, posy, posz = SolidSolver.getInterfaceNodePosInit(
-                self.solidInterfaceIdentifier, iVertex
+        if self.nLocalSolidInterfaceNodes != 0:
+            solidInitialCoordinates = SolidSolver.getInterfaceNodesPosInit(
+                self.solidInterfaceIdentifier
+            )[self.localSolidInterfacePhysicalVertices]
+            nPhysical = self.nLocalSolidInterfacePhysicalNodes
+            self.localSolidInterface_array_X_init[:nPhysical] = solidInitialCoordinates[
+                :, 0
+            ]
+            self.localSolidInterface_array_Y_init[:nPhysical] = solidInitialCoordinates[
+                :, 1
+            ]
+            self.localSolidInterface_array_Z_init[:nPhysical] = solidInitialCoordinates[
+                :, 2
+            ]
+        solidIndexing_temp = dict(
+            zip(
+                self.localSolidInterfacePhysicalIndices.tolist(),
+                self.localSolidInterfacePETScIndices.tolist(),
             )
-            if GlobalIndex not in self.SolidHaloNodeList[myid].keys():
-                solidIndexing_temp[GlobalIndex] = self.__getGlobalIndex(
-                    "solid", myid, localIndex
-                )
-                self.localSolidInterface_array_X_init[localIndex] = posx
-                self.localSolidInterface_array_Y_init[localIndex] = posy
-                self.localSolidInterface_array_Z_init[localIndex] = posz
-                localIndex += 1
+        )
         if self.have_MPI:
             solidIndexing_temp = self.comm.allgather(solidIndexing_temp)
             for ii in range(len(solidIndexing_temp)):
@@ -792,6 +843,10 @@ class Interface:
             self.solidIndexing = solidIndexing_temp.copy()
         del solidIndexing_temp
 
+        # --- Look for matrices of the same interfaces and settings in the cache ---
+        mappingKey = self.__getMappingKey(FSI_config)
+        mappingCached = self.__isMappingCached(FSI_config, mappingKey)
+
         # --- Create the PETSc parallel interpolation matrix ---
         if FSI_config["MATCHING_MESH"] == "NO" and (
             FSI_config["MESH_INTERP_METHOD"] == "RBF"
@@ -833,6 +888,8 @@ class Interface:
                     self.nSolidInterfacePhysicalNodes + self.d_RBF,
                 )
             )
+            if FSI_config["MESH_INTERP_METHOD"] == "TPS" and not mappingCached:
+                self.__preallocateDense(self.MappingMatrixA)
             self.MappingMatrixA.setUp()
             self.MappingMatrixA.setOption(
                 PETSc.Mat().Option.NEW_NONZERO_ALLOCATION_ERR, False
@@ -843,6 +900,8 @@ class Interface:
                     self.nSolidInterfacePhysicalNodes + self.d_RBF,
                 )
             )
+            if FSI_config["MESH_INTERP_METHOD"] == "TPS" and not mappingCached:
+                self.__preallocateDense(self.MappingMatrixB)
             self.MappingMatrixB.setUp()
             self.MappingMatrixB.setOption(
                 PETSc.Mat().Option.NEW_NONZERO_ALLOCATION_ERR, False
@@ -853,6 +912,8 @@ class Interface:
                     self.nSolidInterfacePhysicalNodes + self.d_RBF,
                 )
             )
+            if FSI_config["MESH_INTERP_METHOD"] == "TPS" and not mappingCached:
+                self.__preallocateDense(self.MappingMatrixA_T)
             self.MappingMatrixA_T.setUp()
             self.MappingMatrixA_T.setOption(
                 PETSc.Mat().Option.NEW_NONZERO_ALLOCATION_ERR, False
@@ -863,6 +924,8 @@ class Interface:
                     self.nFluidInterfacePhysicalNodes,
                 )
             )
+            if FSI_config["MESH_INTERP_METHOD"] == "TPS" and not mappingCached:
+                self.__preallocateDense(self.MappingMatrixB_T)
             self.MappingMatrixB_T.setUp()
             self.MappingMatrixB_T.setOption(
                 PETSc.Mat().Option.NEW_NONZERO_ALLOCATION_ERR, False
@@ -893,16 +956,113 @@ class Interface:
                 PETSc.Mat().Option.NEW_NONZERO_ALLOCATION_ERR, False
             )
 
-        # --- Fill the interpolation matrix in parallel (working in serial too) ---
-        if FSI_config["MATCHING_MESH"] == "NO" and (
-            FSI_config["MESH_INTERP_METHOD"] == "RBF"
-            or FSI_config["MESH_INTERP_METHOD"] == "TPS"
-        ):
-            self.MPIPrint("Building interpolation matrices...")
+        # --- Reload the matrices of the same interfaces and settings from the cache ---
+        if mappingCached:
+            self.__loadMapping(FSI_config, mappingKey)
+            self.MPIPrint("Interpolation matrices are loaded from the cache.")
+        else:
+            # --- Fill the interpolation matrix in parallel (working in serial too) ---
+            if FSI_config["MATCHING_MESH"] == "NO" and (
+                FSI_config["MESH_INTERP_METHOD"] == "RBF"
+                or FSI_config["MESH_INTERP_METHOD"] == "TPS"
+            ):
+                self.MPIPrint("Building interpolation matrices...")
+                if self.have_MPI:
+                    for iProc in self.solidInterfaceProcessors:
+                        if myid == iProc:
+                            for jProc in self.solidInterfaceProcessors:
+                                if jProc != iProc:
+                                    self.comm.Send(
+                                        self.localSolidInterface_array_X_init,
+                                        dest=jProc,
+                                        tag=1,
+                                    )
+                                    self.comm.Send(
+                                        self.localSolidInterface_array_Y_init,
+                                        dest=jProc,
+                                        tag=2,
+                                    )
+                                    self.comm.Send(
+                                        self.localSolidInterface_array_Z_init,
+                                        dest=jProc,
+                                        tag=3,
+                                    )
+                                else:
+                                    solidInterfaceBuffRcv_X = np.copy(
+                                        self.localSolidInterface_array_X_init
+                                    )
+                                    solidInterfaceBuffRcv_Y = np.copy(
+                                        self.localSolidInterface_array_Y_init
+                                    )
+                                    solidInterfaceBuffRcv_Z = np.copy(
+                                        self.localSolidInterface_array_Z_init
+                                    )
+                        if myid in self.solidInterfaceProcessors:
+                            if myid != iProc:
+                                sizeOfBuff = (
+                                    self.solidPhysicalInterfaceNodesDistribution[iProc]
+                                )
+                                solidInterfaceBuffRcv_X = np.empty(
+                                    sizeOfBuff, dtype=np.float64
+                                )
+                                solidInterfaceBuffRcv_Y = np.empty(
+                                    sizeOfBuff, dtype=np.float64
+                                )
+                                solidInterfaceBuffRcv_Z = np.empty(
+                                    sizeOfBuff, dtype=np.float64
+                                )
+                                self.comm.Recv(
+                                    solidInterfaceBuffRcv_X, source=iProc, tag=1
+                                )
+                                self.comm.Recv(
+                                    solidInterfaceBuffRcv_Y, source=iProc, tag=2
+                                )
+                                self.comm.Recv(
+                                    solidInterfaceBuffRcv_Z, source=iProc, tag=3
+                                )
+                            if FSI_config["MESH_INTERP_METHOD"] == "RBF":
+                                self.RBFMeshMapping_A(
+                                    solidInterfaceBuffRcv_X,
+                                    solidInterfaceBuffRcv_Y,
+                                    solidInterfaceBuffRcv_Z,
+                                    iProc,
+                                    self.RBF_rad,
+                                )
+                            else:
+                                self.TPSMeshMapping_A(
+                                    solidInterfaceBuffRcv_X,
+                                    solidInterfaceBuffRcv_Y,
+                                    solidInterfaceBuffRcv_Z,
+                                    iProc,
+                                )
+                else:
+                    if FSI_config["MESH_INTERP_METHOD"] == "RBF":
+                        self.RBFMeshMapping_A(
+                            self.localSolidInterface_array_X_init,
+                            self.localSolidInterface_array_Y_init,
+                            self.localSolidInterface_array_Z_init,
+                            0,
+                            self.RBF_rad,
+                        )
+                    else:
+                        self.TPSMeshMapping_A(
+                            self.localSolidInterface_array_X_init,
+                            self.localSolidInterface_array_Y_init,
+                            self.localSolidInterface_array_Z_init,
+                            0,
+                        )
+                self.MappingMatrixA.assemblyBegin()
+                self.MappingMatrixA.assemblyEnd()
+                self.MappingMatrixA_T.assemblyBegin()
+                self.MappingMatrixA_T.assemblyEnd()
+                self.MPIPrint("Matrix A is built.")
+            else:
+                self.MPIPrint("Building interpolation matrix...")
+            self.MPIBarrier()
             if self.have_MPI:
                 for iProc in self.solidInterfaceProcessors:
                     if myid == iProc:
-                        for jProc in self.solidInterfaceProcessors:
+                        for jProc in self.fluidInterfaceProcessors:
                             if jProc != iProc:
                                 self.comm.Send(
                                     self.localSolidInterface_array_X_init,
@@ -929,7 +1089,7 @@ class Interface:
                                 solidInterfaceBuffRcv_Z = np.copy(
                                     self.localSolidInterface_array_Z_init
                                 )
-                    if myid in self.solidInterfaceProcessors:
+                    if myid in self.fluidInterfaceProcessors:
                         if myid != iProc:
                             sizeOfBuff = self.solidPhysicalInterfaceNodesDistribution[
                                 iProc
@@ -946,155 +1106,92 @@ class Interface:
                             self.comm.Recv(solidInterfaceBuffRcv_X, source=iProc, tag=1)
                             self.comm.Recv(solidInterfaceBuffRcv_Y, source=iProc, tag=2)
                             self.comm.Recv(solidInterfaceBuffRcv_Z, source=iProc, tag=3)
-                        if FSI_config["MESH_INTERP_METHOD"] == "RBF":
-                            self.RBFMeshMapping_A(
-                                solidInterfaceBuffRcv_X,
-                                solidInterfaceBuffRcv_Y,
-                                solidInterfaceBuffRcv_Z,
-                                iProc,
-                                self.RBF_rad,
-                            )
+                        if FSI_config["MATCHING_MESH"] == "NO":
+                            if FSI_config["MESH_INTERP_METHOD"] == "RBF":
+                                self.RBFMeshMapping_B(
+                                    solidInterfaceBuffRcv_X,
+                                    solidInterfaceBuffRcv_Y,
+                                    solidInterfaceBuffRcv_Z,
+                                    iProc,
+                                    self.RBF_rad,
+                                )
+                            elif FSI_config["MESH_INTERP_METHOD"] == "TPS":
+                                self.TPSMeshMapping_B(
+                                    solidInterfaceBuffRcv_X,
+                                    solidInterfaceBuffRcv_Y,
+                                    solidInterfaceBuffRcv_Z,
+                                    iProc,
+                                )
+                            else:
+                                self.NearestNeighboorMeshMapping(
+                                    solidInterfaceBuffRcv_X,
+                                    solidInterfaceBuffRcv_Y,
+                                    solidInterfaceBuffRcv_Z,
+                                    iProc,
+                                )
                         else:
-                            self.TPSMeshMapping_A(
+                            self.matchingMeshMapping(
                                 solidInterfaceBuffRcv_X,
                                 solidInterfaceBuffRcv_Y,
                                 solidInterfaceBuffRcv_Z,
                                 iProc,
                             )
             else:
-                if FSI_config["MESH_INTERP_METHOD"] == "RBF":
-                    self.RBFMeshMapping_A(
-                        self.localSolidInterface_array_X_init,
-                        self.localSolidInterface_array_Y_init,
-                        self.localSolidInterface_array_Z_init,
-                        0,
-                        self.RBF_rad,
-                    )
-                else:
-                    self.TPSMeshMapping_A(
-                        self.localSolidInterface_array_X_init,
-                        self.localSolidInterface_array_Y_init,
-                        self.localSolidInterface_array_Z_init,
-                        0,
-                    )
-            self.MappingMatrixA.assemblyBegin()
-            self.MappingMatrixA.assemblyEnd()
-            self.MappingMatrixA_T.assemblyBegin()
-            self.MappingMatrixA_T.assemblyEnd()
-            self.MPIPrint("Matrix A is built.")
-        else:
-            self.MPIPrint("Building interpolation matrix...")
-        self.MPIBarrier()
-        if self.have_MPI:
-            for iProc in self.solidInterfaceProcessors:
-                if myid == iProc:
-                    for jProc in self.fluidInterfaceProcessors:
-                        if jProc != iProc:
-                            self.comm.Send(
-                                self.localSolidInterface_array_X_init, dest=jProc, tag=1
-                            )
-                            self.comm.Send(
-                                self.localSolidInterface_array_Y_init, dest=jProc, tag=2
-                            )
-                            self.comm.Send(
-                                self.localSolidInterface_array_Z_init, dest=jProc, tag=3
-                            )
-                        else:
-                            solidInterfaceBuffRcv_X = np.copy(
-                                self.localSolidInterface_array_X_init
-                            )
-                            solidInterfaceBuffRcv_Y = np.copy(
-                                self.localSolidInterface_array_Y_init
-                            )
-                            solidInterfaceBuffRcv_Z = np.copy(
-                                self.localSolidInterface_array_Z_init
-                            )
-                if myid in self.fluidInterfaceProcessors:
-                    if myid != iProc:
-                        sizeOfBuff = self.solidPhysicalInterfaceNodesDistribution[iProc]
-                        solidInterfaceBuffRcv_X = np.empty(sizeOfBuff, dtype=np.float64)
-                        solidInterfaceBuffRcv_Y = np.empty(sizeOfBuff, dtype=np.float64)
-                        solidInterfaceBuffRcv_Z = np.empty(sizeOfBuff, dtype=np.float64)
-                        self.comm.Recv(solidInterfaceBuffRcv_X, source=iProc, tag=1)
-                        self.comm.Recv(solidInterfaceBuffRcv_Y, source=iProc, tag=2)
-                        self.comm.Recv(solidInterfaceBuffRcv_Z, source=iProc, tag=3)
-                    if FSI_config["MATCHING_MESH"] == "NO":
-                        if FSI_config["MESH_INTERP_METHOD"] == "RBF":
-                            self.RBFMeshMapping_B(
-                                solidInterfaceBuffRcv_X,
-                                solidInterfaceBuffRcv_Y,
-                                solidInterfaceBuffRcv_Z,
-                                iProc,
-                                self.RBF_rad,
-                            )
-                        elif FSI_config["MESH_INTERP_METHOD"] == "TPS":
-                            self.TPSMeshMapping_B(
-                                solidInterfaceBuffRcv_X,
-                                solidInterfaceBuffRcv_Y,
-                                solidInterfaceBuffRcv_Z,
-                                iProc,
-                            )
-                        else:
-                            self.NearestNeighboorMeshMapping(
-                                solidInterfaceBuffRcv_X,
-                                solidInterfaceBuffRcv_Y,
-                                solidInterfaceBuffRcv_Z,
-                                iProc,
-                            )
+                if FSI_config["MATCHING_MESH"] == "NO":
+                    if FSI_config["MESH_INTERP_METHOD"] == "RBF":
+                        self.RBFMeshMapping_B(
+                            self.localSolidInterface_array_X_init,
+                            self.localSolidInterface_array_Y_init,
+                            self.localSolidInterface_array_Z_init,
+                            0,
+                            self.RBF_rad,
+                        )
+                    elif FSI_config["MESH_INTERP_METHOD"] == "TPS":
+                        self.TPSMeshMapping_B(
+                            self.localSolidInterface_array_X_init,
+                            self.localSolidInterface_array_Y_init,
+                            self.localSolidInterface_array_Z_init,
+                            0,
+                        )
                     else:
-                        self.matchingMeshMapping(
-                            solidInterfaceBuffRcv_X,
-                            solidInterfaceBuffRcv_Y,
-                            solidInterfaceBuffRcv_Z,
-                            iProc,
+                        self.NearestNeighboorMeshMapping(
+                            self.localSolidInterface_array_X_init,
+                            self.localSolidInterface_array_Y_init,
+                            self.localSolidInterface_array_Z_init,
+                            0,
                         )
-        else:
-            if FSI_config["MATCHING_MESH"] == "NO":
-                if FSI_config["MESH_INTERP_METHOD"] == "RBF":
-                    self.RBFMeshMapping_B(
-                        self.localSolidInterface_array_X_init,
-                        self.localSolidInterface_array_Y_init,
-                        self.localSolidInterface_array_Z_init,
-                        0,
-                        self.RBF_rad,
-                    )
-                elif FSI_config["MESH_INTERP_METHOD"] == "TPS":
-                    self.TPSMeshMapping_B(
-                        self.localSolidInterface_array_X_init,
-                        self.localSolidInterface_array_Y_init,
-                        self.localSolidInterface_array_Z_init,
-                        0,
-                    )
                 else:
-                    self.NearestNeighboorMeshMapping(
+                    self.matchingMeshMapping(
                         self.localSolidInterface_array_X_init,
                         self.localSolidInterface_array_Y_init,
                         self.localSolidInterface_array_Z_init,
                         0,
                     )
+
+            if FSI_config["MATCHING_MESH"] == "NO" and (
+                FSI_config["MESH_INTERP_METHOD"] == "RBF"
+                or FSI_config["MESH_INTERP_METHOD"] == "TPS"
+            ):
+                self.MappingMatrixB.assemblyBegin()
+                self.MappingMatrixB.assemblyEnd()
+                self.MappingMatrixB_T.assemblyBegin()
+                self.MappingMatrixB_T.assemblyEnd()
+                self.MPIPrint("Matrix B is built.")
             else:
-                self.matchingMeshMapping(
-                    self.localSolidInterface_array_X_init,
-                    self.localSolidInterface_array_Y_init,
-                    self.localSolidInterface_array_Z_init,
-                    0,
-                )
+                self.MappingMatrix.assemblyBegin()
+                self.MappingMatrix.assemblyEnd()
+                self.MappingMatrix_T.assemblyBegin()
+                self.MappingMatrix_T.assemblyEnd()
+                self.MPIPrint("Interpolation matrix is built.")
 
+            self.__storeMapping(FSI_config, mappingKey)
+
+        # --- Set up the interpolation solvers once, the mapping matrices are constant ---
         if FSI_config["MATCHING_MESH"] == "NO" and (
             FSI_config["MESH_INTERP_METHOD"] == "RBF"
             or FSI_config["MESH_INTERP_METHOD"] == "TPS"
         ):
-            self.MappingMatrixB.assemblyBegin()
-            self.MappingMatrixB.assemblyEnd()
-            self.MappingMatrixB_T.assemblyBegin()
-            self.MappingMatrixB_T.assemblyEnd()
-            self.MPIPrint("Matrix B is built.")
-        else:
-            self.MappingMatrix.assemblyBegin()
-            self.MappingMatrix.assemblyEnd()
-            self.MappingMatrix_T.assemblyBegin()
-            self.MappingMatrix_T.assemblyEnd()
-            self.MPIPrint("Interpolation matrix is built.")
+            self.__setUpInterpolationSolvers(FSI_config)
 
         self.MPIBarrier()
 
@@ -1105,6 +1202,250 @@ class Interface:
         del self.localFluidInterface_array_Y_init
         del self.localFluidInterface_array_Z_init
 
+    def __mappingMatrixNames(self, FSI_config):
+        """
+        Names of the mapping matrices used with the interpolation method of FSI_config.
+        """
+        if FSI_config["MATCHING_MESH"] == "NO" and (
+            FSI_config["MESH_INTERP_METHOD"] == "RBF"
+            or FSI_config["MESH_INTERP_METHOD"] == "TPS"
+        ):
+            return [
+                "MappingMatrixA",
+                "MappingMatrixA_T",
+                "MappingMatrixB",
+                "MappingMatrixB_T",
+            ]
+        else:
+            return ["MappingMatrix", "MappingMatrix_T"]
+
+    def __getMappingKey(self, FSI_config):
+        """
+        Returns the key of the mapping matrices in the cache, a hash of the initial
+        interface nodes and global indexing of both sides, of their partitioning and
+        of the mapping settings. None if the cache is disabled.
+        """
+        if FSI_config["MAPPING_CACHE"] == "NONE":
+            return None
+
+        # --- Hash of the local interface nodes, gathered in the order of the partitions ---
+        localHash = hashlib.sha1()
+        for nodes in (
+            self.localFluidInterface_array_X_init,
+            self.localFluidInterface_array_Y_init,
+            self.localFluidInterface_array_Z_init,
+            self.localSolidInterface_array_X_init,
+            self.localSolidInterface_array_Y_init,
+            self.localSolidInterface_array_Z_init,
+        ):
+            localHash.update(np.ascontiguousarray(nodes, dtype=np.float64).tobytes())
+        if self.have_MPI:
+            localHashes = self.comm.allgather(localHash.hexdigest())
+        else:
+            localHashes = [localHash.hexdigest()]
+
+        mappingHash = hashlib.sha1()
+        for digest in localHashes:
+            mappingHash.update(digest.encode())
+        for indexing in (self.fluidIndexing, self.solidIndexing):
+            mappingHash.update(
+                np.array(sorted(indexing.items()), dtype=np.int64).tobytes()
+            )
+        settings = [
+            self.nDim,
+            FSI_config["MATCHING_MESH"],
+            FSI_config["MESH_INTERP_METHOD"],
+        ]
+        if FSI_config["MESH_INTERP_METHOD"] == "RBF":
+            settings.append(repr(self.RBF_rad))
+        mappingHash.update(repr(settings).encode())
+
+        return mappingHash.hexdigest()
+
+    def __isMappingCached(self, FSI_config, mappingKey):
+        """
+        True if the mapping matrices of mappingKey are in the cache, on all the ranks.
+        """
+        if mappingKey is None:
+            return False
+
+        cacheFolder = os.path.join(FSI_config["MAPPING_CACHE"], mappingKey)
+        cached = os.path.isdir(cacheFolder)
+        if self.have_MPI:
+            cached = self.comm.bcast(cached, root=self.rootProcess)
+
+        return cached
+
+    def __loadMapping(self, FSI_config, mappingKey):
+        """
+        Replaces the mapping matrices by those stored in the cache under mappingKey,
+        read in parallel from PETSc binary files.
+        """
+        cacheFolder = os.path.join(FSI_config["MAPPING_CACHE"], mappingKey)
+
+        for name in self.__mappingMatrixNames(FSI_config):
+            matrix = getattr(self, name)
+            if self.have_MPI:
+                viewer = PETSc.Viewer().createBinary(
+                    os.path.join(cacheFolder, name + ".dat"), "r", comm=self.comm
+                )
+                cached = PETSc.Mat().create(self.comm)
+            else:
+                viewer = PETSc.Viewer().createBinary(
+                    os.path.join(cacheFolder, name + ".dat"), "r"
+                )
+                cached = PETSc.Mat().create()
+            cached.setType(matrix.getType())
+            cached.setSizes(matrix.getSizes())
+            cached.load(viewer)
+            viewer.destroy()
+            matrix.destroy()
+            setattr(self, name, cached)
+
+    def __storeMapping(self, FSI_config, mappingKey):
+        """
+        Writes the assembled mapping matrices to the cache under mappingKey, in PETSc
+        binary files. They are written to a temporary folder, which is renamed once
+        complete so that other runs never read partial files.
+        """
+        if mappingKey is None:
+            return
+
+        if self.have_MPI:
+            myid = self.comm.Get_rank()
+        else:
+            myid = 0
+
+        cacheFolder = os.path.join(FSI_config["MAPPING_CACHE"], mappingKey)
+        tempFolder = cacheFolder + ".tmp"
+        if myid == self.rootProcess:
+            if os.path.isdir(tempFolder):
+                shutil.rmtree(tempFolder)
+            os.makedirs(tempFolder)
+        self.MPIBarrier()
+
+        for name in self.__mappingMatrixNames(FSI_config):
+            if self.have_MPI:
+                viewer = PETSc.Viewer().createBinary(
+                    os.path.join(tempFolder, name + ".dat"), "w", comm=self.comm
+                )
+            else:
+                viewer = PETSc.Viewer().createBinary(
+                    os.path.join(tempFolder, name + ".dat"), "w"
+                )
+            getattr(self, name).view(viewer)
+            viewer.destroy()
+
+        self.MPIBarrier()
+        if myid == self.rootProcess:
+            if os.path.isdir(cacheFolder):
+                shutil.rmtree(tempFolder)
+            else:
+                os.rename(tempFolder, cacheFolder)
+            self.MPIPrint("Interpolation matrices are stored in {}".format(cacheFolder))
+        self.MPIBarrier()
+
+    def __setUpInterpolationSolvers(self, FSI_config):
+        """
+        Creates the solvers of the RBF/TPS interpolation systems and their work vectors.
+        They are kept for the whole simulation, so the preconditioners, or the LU
+        factorization of a direct solve, are computed only once. The iterative solves
+        start from zero at each call, as before.
+        """
+        if self.have_MPI:
+            MPIsize = self.comm.Get_size()
+        else:
+            MPIsize = 1
+
+        solverType = FSI_config["MAPPING_SOLVER"]
+        if solverType == "AUTO":
+            if (
+                MPIsize == 1
+                and self.nSolidInterfacePhysicalNodes <= self.maxDirectInterpolationSize
+            ):
+                solverType = "DIRECT"
+            else:
+                solverType = "ITERATIVE"
+        elif solverType == "DIRECT" and MPIsize > 1:
+            self.MPIPrint(
+                "The direct interpolation solver is serial, using the iterative one."
+            )
+            solverType = "ITERATIVE"
+
+        # --- Persistent work vectors of the interpolation coefficients ---
+        self.gamma_array_DispX = self.MappingMatrixA.createVecRight()
+        self.gamma_array_DispY = self.MappingMatrixA.createVecRight()
+        self.gamma_array_DispZ = self.MappingMatrixA.createVecRight()
+        self.gamma_array_LoadX = self.MappingMatrixA.createVecRight()
+        self.gamma_array_LoadY = self.MappingMatrixA.createVecRight()
+        self.gamma_array_LoadZ = self.MappingMatrixA.createVecRight()
+        for gamma in (
+            self.gamma_array_DispX,
+            self.gamma_array_DispY,
+            self.gamma_array_DispZ,
+            self.gamma_array_LoadX,
+            self.gamma_array_LoadY,
+            self.gamma_array_LoadZ,
+        ):
+            gamma.set(0.0)
+
+        if solverType == "DIRECT":
+            # The rows of the polynomial terms are empty, the iterative solves started from zero
+            # leave their coefficients to zero and solve the kernel block only. The same is done
+            # here with the LU factorization (with pivoting, the TPS kernel has a zero diagonal)
+            # of the dense kernel block, for all the components at once.
+            nSolidNodes = self.nSolidInterfacePhysicalNodes
+            denseMatrix = self.MappingMatrixA.convert("dense")
+            kernelMatrix = np.array(
+                denseMatrix.getDenseArray()[:nSolidNodes, :nSolidNodes]
+            )
+            denseMatrix.destroy()
+            self.interpolationLU = lu_factor(kernelMatrix, check_finite=False)
+            del kernelMatrix
+            self.MPIPrint("Interpolation matrix is factorized.")
+        else:
+            if self.have_MPI:
+                self.interpolationSolver = PETSc.KSP().create(self.comm)
+                self.interpolationSolver_T = PETSc.KSP().create(self.comm)
+            else:
+                self.interpolationSolver = PETSc.KSP().create()
+                self.interpolationSolver_T = PETSc.KSP().create()
+            for KSP_solver, matrix in (
+                (self.interpolationSolver, self.MappingMatrixA),
+                (self.interpolationSolver_T, self.MappingMatrixA_T),
+            ):
+                KSP_solver.setType("fgmres")
+                KSP_solver.getPC().setType("jacobi")
+                KSP_solver.setOperators(matrix)
+                KSP_solver.setFromOptions()
+                KSP_solver.setUp()
+            self.MPIPrint("Interpolation solvers are set up.")
+
+    def __solveInterpolation(self, rhsVecs, solVecs, transpose=False):
+        """
+        Solves the interpolation system (or its transpose) for all the components,
+        at once with the factorized kernel block in case of the direct solver.
+        """
+        if self.interpolationLU is None:
+            if transpose:
+                KSP_solver = self.interpolationSolver_T
+            else:
+                KSP_solver = self.interpolationSolver
+            for rhs, sol in zip(rhsVecs, solVecs):
+                KSP_solver.solve(rhs, sol)
+        else:
+            nSolidNodes = self.nSolidInterfacePhysicalNodes
+            rhsArray = np.column_stack(
+                [rhs.getArray()[:nSolidNodes] for rhs in rhsVecs]
+            )
+            solArray = lu_solve(
+                self.interpolationLU, rhsArray, trans=int(transpose), check_finite=False
+            )
+            for iDim, sol in enumerate(solVecs):
+                solValues = sol.getArray()
+                solValues[:nSolidNodes] = solArray[:, iDim]
+                solValues[nSolidNodes:] = 0.0
+
     def matchingMeshMapping(
         self,
         solidInterfaceBuffRcv_X,
@@ -1120,65 +1461,51 @@ class Interface:
         else:
             myid = 0
 
-        # --- Instantiate the spatial indexing ---
-        prop_index = index.Property()
-        prop_index.dimension = self.nDim
-        SolidSpatialTree = index.Index(properties=prop_index)
-
-        nSolidNodes = solidInterfaceBuffRcv_X.shape[0]
-
-        for jVertex in range(nSolidNodes):
-            posX = solidInterfaceBuffRcv_X[jVertex]
-            posY = solidInterfaceBuffRcv_Y[jVertex]
-            posZ = solidInterfaceBuffRcv_Z[jVertex]
-            if self.nDim == 2:
-                SolidSpatialTree.add(jVertex, (posX, posY))
-            else:
-                SolidSpatialTree.add(jVertex, (posX, posY, posZ))
-
         if self.nFluidInterfacePhysicalNodes != self.nSolidInterfacePhysicalNodes:
             raise Exception(
                 "Fluid and solid interface must have the same number of nodes for matching meshes ! "
             )
 
+        solidNodes = np.column_stack(
+            (solidInterfaceBuffRcv_X, solidInterfaceBuffRcv_Y, solidInterfaceBuffRcv_Z)
+        )
+        fluidNodes = self.__localInterfaceNodes("fluid")
+        if solidNodes.shape[0] == 0 or fluidNodes.shape[0] == 0:
+            return
+
         # --- For each fluid interface node, find the nearest solid interface node and fill the boolean mapping matrix ---
-        for iVertexFluid in range(self.nLocalFluidInterfacePhysicalNodes):
-            posX = self.localFluidInterface_array_X_init[iVertexFluid]
-            posY = self.localFluidInterface_array_Y_init[iVertexFluid]
-            posZ = self.localFluidInterface_array_Z_init[iVertexFluid]
-            if self.nDim == 2:
-                neighboors = list(SolidSpatialTree.nearest((posX, posY), 1))
-            elif self.nDim == 3:
-                neighboors = list(SolidSpatialTree.nearest((posX, posY, posZ), 1))
-            jVertexSolid = neighboors[0]
-            # Check if the distance is small enough to ensure coincidence
-            NodeA = np.array([posX, posY, posZ])
-            NodeB = np.array(
-                [
-                    solidInterfaceBuffRcv_X[jVertexSolid],
-                    solidInterfaceBuffRcv_Y[jVertexSolid],
-                    solidInterfaceBuffRcv_Z[jVertexSolid],
-                ]
-            )
-            distance = spdist.euclidean(NodeA, NodeB)
-            iGlobalVertexFluid = self.__getGlobalIndex("fluid", myid, iVertexFluid)
-            jGlobalVertexSolid = self.__getGlobalIndex("solid", iProc, jVertexSolid)
-            if distance > 1e-6:
-                print(
-                    "WARNING : Tolerance for matching meshes is not matched between node F{} and S{} : ({}, {}, {})<-->({}, {}, {}) , DISTANCE : {} !".format(
-                        iGlobalVertexFluid,
-                        jGlobalVertexSolid,
-                        posX,
-                        posY,
-                        posZ,
-                        solidInterfaceBuffRcv_X[jVertexSolid],
-                        solidInterfaceBuffRcv_Y[jVertexSolid],
-                        solidInterfaceBuffRcv_Z[jVertexSolid],
-                        distance,
-                    )
+        SolidSpatialTree = cKDTree(solidNodes)
+        distance, jVertexSolid = SolidSpatialTree.query(fluidNodes)
+        iGlobalVertexFluid = self.__getGlobalIndex(
+            "fluid", myid, np.arange(fluidNodes.shape[0])
+        )
+        jGlobalVertexSolid = self.__getGlobalIndex("solid", iProc, jVertexSolid)
+
+        # Check if the distance is small enough to ensure coincidence
+        for iVertexFluid in np.flatnonzero(distance > 1e-6):
+            posX, posY, posZ = fluidNodes[iVertexFluid]
+            solidX, solidY, solidZ = solidNodes[jVertexSolid[iVertexFluid]]
+            print(
+                "WARNING : Tolerance for matching meshes is not matched between node F{} and S{} : ({}, {}, {})<-->({}, {}, {}) , DISTANCE : {} !".format(
+                    iGlobalVertexFluid[iVertexFluid],
+                    jGlobalVertexSolid[iVertexFluid],
+                    posX,
+                    posY,
+                    posZ,
+                    solidX,
+                    solidY,
+                    solidZ,
+                    distance[iVertexFluid],
                 )
-            self.MappingMatrix.setValue(iGlobalVertexFluid, jGlobalVertexSolid, 1.0)
-            self.MappingMatrix_T.setValue(jGlobalVertexSolid, iGlobalVertexFluid, 1.0)
+            )
+
+        self.__setMappingValues(
+            self.MappingMatrix,
+            self.MappingMatrix_T,
+            iGlobalVertexFluid,
+            jGlobalVertexSolid[:, np.newaxis],
+            np.ones((fluidNodes.shape[0], 1)),
+        )
 
     def NearestNeighboorMeshMapping(
         self,
@@ -1198,36 +1525,28 @@ class Interface:
         else:
             myid = 0
 
-        # --- Instantiate the spatial indexing ---
-        prop_index = index.Property()
-        prop_index.dimension = self.nDim
-        SolidSpatialTree = index.Index(properties=prop_index)
-
-        nSolidNodes = solidInterfaceBuffRcv_X.shape[0]
-
-        for jVertex in range(nSolidNodes):
-            posX = solidInterfaceBuffRcv_X[jVertex]
-            posY = solidInterfaceBuffRcv_Y[jVertex]
-            posZ = solidInterfaceBuffRcv_Z[jVertex]
-            if self.nDim == 2:
-                SolidSpatialTree.add(jVertex, (posX, posY))
-            else:
-                SolidSpatialTree.add(jVertex, (posX, posY, posZ))
+        solidNodes = np.column_stack(
+            (solidInterfaceBuffRcv_X, solidInterfaceBuffRcv_Y, solidInterfaceBuffRcv_Z)
+        )
+        fluidNodes = self.__localInterfaceNodes("fluid")
+        if solidNodes.shape[0] == 0 or fluidNodes.shape[0] == 0:
+            return
 
         # --- For each fluid interface node, find the nearest solid interface node and fill the boolean mapping matrix ---
-        for iVertexFluid in range(self.nLocalFluidInterfacePhysicalNodes):
-            posX = self.localFluidInterface_array_X_init[iVertexFluid]
-            posY = self.localFluidInterface_array_Y_init[iVertexFluid]
-            posZ = self.localFluidInterface_array_Z_init[iVertexFluid]
-            if self.nDim == 2:
-                neighboors = list(SolidSpatialTree.nearest((posX, posY), 1))
-            elif self.nDim == 3:
-                neighboors = list(SolidSpatialTree.nearest((posX, posY, posZ), 1))
-            jVertexSolid = neighboors[0]
-            iGlobalVertexFluid = self.__getGlobalIndex("fluid", myid, iVertexFluid)
-            jGlobalVertexSolid = self.__getGlobalIndex("solid", iProc, jVertexSolid)
-            self.MappingMatrix.setValue(iGlobalVertexFluid, jGlobalVertexSolid, 1.0)
-            self.MappingMatrix_T.setValue(jGlobalVertexSolid, iGlobalVertexFluid, 1.0)
+        SolidSpatialTree = cKDTree(solidNodes)
+        distance, jVertexSolid = SolidSpatialTree.query(fluidNodes)
+        iGlobalVertexFluid = self.__getGlobalIndex(
+            "fluid", myid, np.arange(fluidNodes.shape[0])
+        )
+        jGlobalVertexSolid = self.__getGlobalIndex("solid", iProc, jVertexSolid)
+
+        self.__setMappingValues(
+            self.MappingMatrix,
+            self.MappingMatrix_T,
+            iGlobalVertexFluid,
+            jGlobalVertexSolid[:, np.newaxis],
+            np.ones((fluidNodes.shape[0], 1)),
+        )
 
     def RBFMeshMapping_A(
         self,
@@ -1248,76 +1567,20 @@ class Interface:
         else:
             myid = 0
 
-        # --- Instantiate the spatial indexing ---
-        prop_index = index.Property()
-        prop_index.dimension = self.nDim
-        SolidSpatialTree = index.Index(properties=prop_index)
-
-        nSolidNodes = solidInterfaceBuffRcv_X.shape[0]
-
-        for jVertex in range(nSolidNodes):
-            posX = solidInterfaceBuffRcv_X[jVertex]
-            posY = solidInterfaceBuffRcv_Y[jVertex]
-            posZ = solidInterfaceBuffRcv_Z[jVertex]
-            if self.nDim == 2:
-                SolidSpatialTree.add(jVertex, (posX, posY))
-            else:
-                SolidSpatialTree.add(jVertex, (posX, posY, posZ))
-
-        for iVertexSolid in range(self.nLocalSolidInterfacePhysicalNodes):
-            posX = self.localSolidInterface_array_X_init[iVertexSolid]
-            posY = self.localSolidInterface_array_Y_init[iVertexSolid]
-            posZ = self.localSolidInterface_array_Z_init[iVertexSolid]
-            NodeA = np.array([posX, posY, posZ])
-            iGlobalVertexSolid = self.__getGlobalIndex("solid", myid, iVertexSolid)
-            if self.nDim == 2:
-                neighboors = list(
-                    SolidSpatialTree.intersection(
-                        (posX - rad, posY - rad, posX + rad, posY + rad)
-                    )
-                )
-            elif self.nDim == 3:
-                neighboors = list(
-                    SolidSpatialTree.intersection(
-                        (
-                            posX - rad,
-                            posY - rad,
-                            posZ - rad,
-                            posX + rad,
-                            posY + rad,
-                            posZ + rad,
-                        )
-                    )
-                )
-            for jVertexSolid in neighboors:
-                NodeB = np.array(
-                    [
-                        solidInterfaceBuffRcv_X[jVertexSolid],
-                        solidInterfaceBuffRcv_Y[jVertexSolid],
-                        solidInterfaceBuffRcv_Z[jVertexSolid],
-                    ]
-                )
-                distance = spdist.euclidean(NodeA, NodeB)
-                phi = self.__CPC2(distance, rad)
-                jGlobalVertexSolid = self.__getGlobalIndex("solid", iProc, jVertexSolid)
-                self.MappingMatrixA.setValue(
-                    iGlobalVertexSolid, jGlobalVertexSolid, phi
-                )
-                self.MappingMatrixA_T.setValue(
-                    jGlobalVertexSolid, iGlobalVertexSolid, phi
-                )
-            self.MappingMatrixA.setValue(iGlobalVertexSolid, nSolidNodes, 1.0)
-            self.MappingMatrixA.setValue(iGlobalVertexSolid, nSolidNodes + 1, posX)
-            self.MappingMatrixA.setValue(iGlobalVertexSolid, nSolidNodes + 2, posY)
-            if self.nDim == 3:
-                self.MappingMatrixA.setValue(iGlobalVertexSolid, nSolidNodes + 3, posZ)
-            self.MappingMatrixA_T.setValue(nSolidNodes, iGlobalVertexSolid, 1.0)
-            self.MappingMatrixA_T.setValue(nSolidNodes + 1, iGlobalVertexSolid, posX)
-            self.MappingMatrixA_T.setValue(nSolidNodes + 2, iGlobalVertexSolid, posY)
-            if self.nDim == 3:
-                self.MappingMatrixA_T.setValue(
-                    nSolidNodes + 3, iGlobalVertexSolid, posZ
-                )
+        solidNodes = np.column_stack(
+            (solidInterfaceBuffRcv_X, solidInterfaceBuffRcv_Y, solidInterfaceBuffRcv_Z)
+        )
+        localNodes = self.__localInterfaceNodes("solid")
+
+        self.__fillKernelMapping(
+            self.MappingMatrixA,
+            self.MappingMatrixA_T,
+            localNodes,
+            solidNodes,
+            self.__getGlobalIndex("solid", myid, 0),
+            self.__getGlobalIndex("solid", iProc, 0),
+            rad,
+        )
 
     def RBFMeshMapping_B(
         self,
@@ -1337,76 +1600,20 @@ class Interface:
         else:
             myid = 0
 
-        # --- Instantiate the spatial indexing ---
-        prop_index = index.Property()
-        prop_index.dimension = self.nDim
-        SolidSpatialTree = index.Index(properties=prop_index)
-
-        nSolidNodes = solidInterfaceBuffRcv_X.shape[0]
-
-        for jVertex in range(nSolidNodes):
-            posX = solidInterfaceBuffRcv_X[jVertex]
-            posY = solidInterfaceBuffRcv_Y[jVertex]
-            posZ = solidInterfaceBuffRcv_Z[jVertex]
-            if self.nDim == 2:
-                SolidSpatialTree.add(jVertex, (posX, posY))
-            else:
-                SolidSpatialTree.add(jVertex, (posX, posY, posZ))
-
-        for iVertexFluid in range(self.nLocalFluidInterfacePhysicalNodes):
-            posX = self.localFluidInterface_array_X_init[iVertexFluid]
-            posY = self.localFluidInterface_array_Y_init[iVertexFluid]
-            posZ = self.localFluidInterface_array_Z_init[iVertexFluid]
-            NodeA = np.array([posX, posY, posZ])
-            iGlobalVertexFluid = self.__getGlobalIndex("fluid", myid, iVertexFluid)
-            if self.nDim == 2:
-                neighboors = list(
-                    SolidSpatialTree.intersection(
-                        (posX - rad, posY - rad, posX + rad, posY + rad)
-                    )
-                )
-            elif self.nDim == 3:
-                neighboors = list(
-                    SolidSpatialTree.intersection(
-                        (
-                            posX - rad,
-                            posY - rad,
-                            posZ - rad,
-                            posX + rad,
-                            posY + rad,
-                            posZ + rad,
-                        )
-                    )
-                )
-            for jVertexSolid in neighboors:
-                NodeB = np.array(
-                    [
-                        solidInterfaceBuffRcv_X[jVertexSolid],
-                        solidInterfaceBuffRcv_Y[jVertexSolid],
-                        solidInterfaceBuffRcv_Z[jVertexSolid],
-                    ]
-                )
-                distance = spdist.euclidean(NodeA, NodeB)
-                phi = self.__CPC2(distance, rad)
-                jGlobalVertexSolid = self.__getGlobalIndex("solid", iProc, jVertexSolid)
-                self.MappingMatrixB.setValue(
-                    iGlobalVertexFluid, jGlobalVertexSolid, phi
-                )
-                self.MappingMatrixB_T.setValue(
-                    jGlobalVertexSolid, iGlobalVertexFluid, phi
-                )
-            self.MappingMatrixB.setValue(iGlobalVertexFluid, nSolidNodes, 1.0)
-            self.MappingMatrixB.setValue(iGlobalVertexFluid, nSolidNodes + 1, posX)
-            self.MappingMatrixB.setValue(iGlobalVertexFluid, nSolidNodes + 2, posY)
-            if self.nDim == 3:
-                self.MappingMatrixB.setValue(iGlobalVertexFluid, nSolidNodes + 3, posZ)
-            self.MappingMatrixB_T.setValue(nSolidNodes, iGlobalVertexFluid, 1.0)
-            self.MappingMatrixB_T.setValue(nSolidNodes + 1, iGlobalVertexFluid, posX)
-            self.MappingMatrixB_T.setValue(nSolidNodes + 2, iGlobalVertexFluid, posY)
-            if self.nDim == 3:
-                self.MappingMatrixB_T.setValue(
-                    nSolidNodes + 3, iGlobalVertexFluid, posZ
-                )
+        solidNodes = np.column_stack(
+            (solidInterfaceBuffRcv_X, solidInterfaceBuffRcv_Y, solidInterfaceBuffRcv_Z)
+        )
+        localNodes = self.__localInterfaceNodes("fluid")
+
+        self.__fillKernelMapping(
+            self.MappingMatrixB,
+            self.MappingMatrixB_T,
+            localNodes,
+            solidNodes,
+            self.__getGlobalIndex("fluid", myid, 0),
+            self.__getGlobalIndex("solid", iProc, 0),
+            rad,
+        )
 
     def TPSMeshMapping_A(
         self,
@@ -1426,43 +1633,19 @@ class Interface:
         else:
             myid = 0
 
-        nSolidNodes = solidInterfaceBuffRcv_X.shape[0]
-
-        for iVertexSolid in range(self.nLocalSolidInterfacePhysicalNodes):
-            posX = self.localSolidInterface_array_X_init[iVertexSolid]
-            posY = self.localSolidInterface_array_Y_init[iVertexSolid]
-            posZ = self.localSolidInterface_array_Z_init[iVertexSolid]
-            NodeA = np.array([posX, posY, posZ])
-            iGlobalVertexSolid = self.__getGlobalIndex("solid", myid, iVertexSolid)
-            for jVertexSolid in range(nSolidNodes):
-                NodeB = np.array(
-                    [
-                        solidInterfaceBuffRcv_X[jVertexSolid],
-                        solidInterfaceBuffRcv_Y[jVertexSolid],
-                        solidInterfaceBuffRcv_Z[jVertexSolid],
-                    ]
-                )
-                distance = spdist.euclidean(NodeA, NodeB)
-                phi = self.__TPS(distance)
-                jGlobalVertexSolid = self.__getGlobalIndex("solid", iProc, jVertexSolid)
-                self.MappingMatrixA.setValue(
-                    iGlobalVertexSolid, jGlobalVertexSolid, phi
-                )
-                self.MappingMatrixA_T.setValue(
-                    jGlobalVertexSolid, iGlobalVertexSolid, phi
-                )
-            self.MappingMatrixA.setValue(iGlobalVertexSolid, nSolidNodes, 1.0)
-            self.MappingMatrixA.setValue(iGlobalVertexSolid, nSolidNodes + 1, posX)
-            self.MappingMatrixA.setValue(iGlobalVertexSolid, nSolidNodes + 2, posY)
-            if self.nDim == 3:
-                self.MappingMatrixA.setValue(iGlobalVertexSolid, nSolidNodes + 3, posZ)
-            self.MappingMatrixA_T.setValue(nSolidNodes, iGlobalVertexSolid, 1.0)
-            self.MappingMatrixA_T.setValue(nSolidNodes + 1, iGlobalVertexSolid, posX)
-            self.MappingMatrixA_T.setValue(nSolidNodes + 2, iGlobalVertexSolid, posY)
-            if self.nDim == 3:
-                self.MappingMatrixA_T.setValue(
-                    nSolidNodes + 3, iGlobalVertexSolid, posZ
-                )
+        solidNodes = np.column_stack(
+            (solidInterfaceBuffRcv_X, solidInterfaceBuffRcv_Y, solidInterfaceBuffRcv_Z)
+        )
+        localNodes = self.__localInterfaceNodes("solid")
+
+        self.__fillKernelMapping(
+            self.MappingMatrixA,
+            self.MappingMatrixA_T,
+            localNodes,
+            solidNodes,
+            self.__getGlobalIndex("solid", myid, 0),
+            self.__getGlobalIndex("solid", iProc, 0),
+        )
 
     def TPSMeshMapping_B(
         self,
@@ -1481,56 +1664,141 @@ class Interface:
         else:
             myid = 0
 
-        nSolidNodes = solidInterfaceBuffRcv_X.shape[0]
-
-        for iVertexFluid in range(self.nLocalFluidInterfacePhysicalNodes):
-            posX = self.localFluidInterface_array_X_init[iVertexFluid]
-            posY = self.localFluidInterface_array_Y_init[iVertexFluid]
-            posZ = self.localFluidInterface_array_Z_init[iVertexFluid]
-            NodeA = np.array([posX, posY, posZ])
-            iGlobalVertexFluid = self.__getGlobalIndex("fluid", myid, iVertexFluid)
-            for jVertexSolid in range(nSolidNodes):
-                NodeB = np.array(
-                    [
-                        solidInterfaceBuffRcv_X[jVertexSolid],
-                        solidInterfaceBuffRcv_Y[jVertexSolid],
-                        solidInterfaceBuffRcv_Z[jVertexSolid],
-                    ]
-                )
-                distance = spdist.euclidean(NodeA, NodeB)
-                phi = self.__TPS(distance)
-                jGlobalVertexSolid = self.__getGlobalIndex("solid", iProc, jVertexSolid)
-                self.MappingMatrixB.setValue(
-                    iGlobalVertexFluid, jGlobalVertexSolid, phi
+        solidNodes = np.column_stack(
+            (solidInterfaceBuffRcv_X, solidInterfaceBuffRcv_Y, solidInterfaceBuffRcv_Z)
+        )
+        localNodes = self.__localInterfaceNodes("fluid")
+
+        self.__fillKernelMapping(
+            self.MappingMatrixB,
+            self.MappingMatrixB_T,
+            localNodes,
+            solidNodes,
+            self.__getGlobalIndex("fluid", myid, 0),
+            self.__getGlobalIndex("solid", iProc, 0),
+        )
+
+    def __localInterfaceNodes(self, physics):
+        """
+        Returns the initial coordinates of the physical interface nodes of this
+        partition as a (nNodes, 3) array.
+        """
+        if physics == "fluid":
+            return np.column_stack(
+                (
+                    self.localFluidInterface_array_X_init,
+                    self.localFluidInterface_array_Y_init,
+                    self.localFluidInterface_array_Z_init,
                 )
-                self.MappingMatrixB_T.setValue(
-                    jGlobalVertexSolid, iGlobalVertexFluid, phi
+            )[: self.nLocalFluidInterfacePhysicalNodes]
+        else:
+            return np.column_stack(
+                (
+                    self.localSolidInterface_array_X_init,
+                    self.localSolidInterface_array_Y_init,
+                    self.localSolidInterface_array_Z_init,
                 )
-            self.MappingMatrixB.setValue(iGlobalVertexFluid, nSolidNodes, 1.0)
-            self.MappingMatrixB.setValue(iGlobalVertexFluid, nSolidNodes + 1, posX)
-            self.MappingMatrixB.setValue(iGlobalVertexFluid, nSolidNodes + 2, posY)
-            if self.nDim == 3:
-                self.MappingMatrixB.setValue(iGlobalVertexFluid, nSolidNodes + 3, posZ)
-            self.MappingMatrixB_T.setValue(nSolidNodes, iGlobalVertexFluid, 1.0)
-            self.MappingMatrixB_T.setValue(nSolidNodes + 1, iGlobalVertexFluid, posX)
-            self.MappingMatrixB_T.setValue(nSolidNodes + 2, iGlobalVertexFluid, posY)
-            if self.nDim == 3:
-                self.MappingMatrixB_T.setValue(
-                    nSolidNodes + 3, iGlobalVertexFluid, posZ
+            )[: self.nLocalSolidInterfacePhysicalNodes]
+
+    def __fillKernelMapping(
+        self, matrix, matrix_T, localNodes, solidNodes, rowStart, colStart, rad=None
+    ):
+        """
+        Fills the rows of the local nodes of an RBF (if rad is given, compactly
+        supported) or TPS (otherwise) mapping matrix and the columns of its transpose.
+        The kernel is evaluated on blocks of node pairs at once: the pairs closer than
+        rad, found with a kd-tree, for RBF and a block of rows of all pairs for TPS.
+        The polynomial terms of the local rows are set as well.
+        """
+
+        nLocalNodes = localNodes.shape[0]
+        nSolidNodes = solidNodes.shape[0]
+        rows = rowStart + np.arange(nLocalNodes)
+
+        if nLocalNodes and nSolidNodes:
+            if rad is not None:
+                # --- Compact support, only the pairs within the radius ---
+                neighboors = cKDTree(solidNodes).query_ball_point(localNodes, rad)
+                nNeighboors = np.array([len(n) for n in neighboors], dtype=int)
+                rowPtr = np.concatenate(([0], np.cumsum(nNeighboors)))
+                iVertex = np.repeat(np.arange(nLocalNodes), nNeighboors)
+                jVertex = np.concatenate([np.asarray(n, dtype=int) for n in neighboors])
+                distance = np.linalg.norm(
+                    localNodes[iVertex] - solidNodes[jVertex], axis=1
                 )
+                phi = self.__CPC2(distance, rad)
+                cols = colStart + jVertex
+                for iVertexLocal in np.flatnonzero(nNeighboors):
+                    block = slice(rowPtr[iVertexLocal], rowPtr[iVertexLocal + 1])
+                    self.__setMappingValues(
+                        matrix,
+                        matrix_T,
+                        rows[iVertexLocal : iVertexLocal + 1],
+                        cols[block][np.newaxis, :],
+                        phi[block][np.newaxis, :],
+                    )
+            else:
+                # --- Dense kernel, a block of rows at a time to bound the memory ---
+                cols = colStart + np.arange(nSolidNodes)
+                blockSize = max(1, 1000000 // nSolidNodes)
+                for start in range(0, nLocalNodes, blockSize):
+                    block = slice(start, start + blockSize)
+                    distance = np.sqrt(
+                        (
+                            (localNodes[block, np.newaxis, :] - solidNodes[np.newaxis])
+                            ** 2
+                        ).sum(axis=2)
+                    )
+                    phi = self.__TPS(distance)
+                    self.__setMappingValues(
+                        matrix, matrix_T, rows[block], cols, phi, dense=True
+                    )
+
+        # --- Polynomial terms, in the last d_RBF columns ---
+        if nLocalNodes:
+            nSolidNodes = self.nSolidInterfacePhysicalNodes
+            poly = np.column_stack((np.ones(nLocalNodes), localNodes[:, : self.nDim]))
+            polyCols = nSolidNodes + np.arange(self.d_RBF)
+            self.__setMappingValues(matrix, matrix_T, rows, polyCols, poly, dense=True)
+
+    def __preallocateDense(self, matrix):
+        """
+        Preallocates full rows of a dense mapping matrix, as the TPS ones, so that
+        filling it does not reallocate the storage.
+        """
+        nCols = matrix.getSize()[1]
+        if self.have_MPI:
+            # Capped by PETSc to the columns of the on- and off-process blocks
+            matrix.setPreallocationNNZ((nCols, nCols))
+        else:
+            matrix.setPreallocationNNZ(nCols)
+
+    def __setMappingValues(self, matrix, matrix_T, rows, cols, values, dense=False):
+        """
+        Inserts values in the rows of a mapping matrix and in the columns of its
+        transpose. If dense, values is a (len(rows), len(cols)) block, otherwise
+        cols and values hold the columns and values of each row, one row per line.
+        """
+        values = np.asarray(values, dtype=PETSc.ScalarType)
+        rows = np.asarray(rows, dtype=PETSc.IntType)
+        cols = np.asarray(cols, dtype=PETSc.IntType)
+        if dense:
+            matrix.setValues(rows, cols, values)
+            matrix_T.setValues(cols, rows, np.ascontiguousarray(values.T))
+        else:
+            for iRow in range(rows.shape[0]):
+                matrix.setValues(rows[iRow : iRow + 1], cols[iRow], values[iRow])
+                matrix_T.setValues(cols[iRow], rows[iRow : iRow + 1], values[iRow])
 
     def __CPC2(self, distance, rad):
         """
         This method provides the value of the kernel function given the euclidean
         distance. The kernel function is the one used for RBF.
+        Works element-wise on arrays of distances.
         """
-        phi = 0.0
-        eps = distance / rad
+        eps = np.asarray(distance, dtype=float) / rad
 
-        if eps < 1:
-            phi = ((1.0 - eps) ** 4) * (4.0 * eps + 1.0)
-        else:
-            phi = 0.0
+        phi = np.where(eps < 1, ((1.0 - eps) ** 4) * (4.0 * eps + 1.0), 0.0)
 
         return phi
 
@@ -1538,13 +1806,13 @@ class Interface:
         """
         This method provides the value of the kernel function given the euclidean
         distance. The kernel function is the one used for TPS.
+        Works element-wise on arrays of distances.
         """
-        phi = 0.0
+        distance = np.asarray(distance, dtype=float)
 
-        if distance > 0.0:
-            phi = (distance**2) * np.log10(distance)
-        else:
-            phi = 0.0
+        phi = np.zeros_like(distance)
+        positive = distance > 0.0
+        phi[positive] = (distance[positive] ** 2) * np.log10(distance[positive])
 
         return phi
 
@@ -1564,51 +1832,24 @@ class Interface:
             FSI_config["MESH_INTERP_METHOD"] == "RBF"
             or FSI_config["MESH_INTERP_METHOD"] == "TPS"
         ):
-            if self.have_MPI:
-                gamma_array_DispX = PETSc.Vec().create(self.comm)
-                gamma_array_DispY = PETSc.Vec().create(self.comm)
-                gamma_array_DispZ = PETSc.Vec().create(self.comm)
-                gamma_array_DispX.setType("mpi")
-                gamma_array_DispY.setType("mpi")
-                gamma_array_DispZ.setType("mpi")
-                KSP_solver = PETSc.KSP().create(self.comm)
-            else:
-                gamma_array_DispX = PETSc.Vec().create()
-                gamma_array_DispY = PETSc.Vec().create()
-                gamma_array_DispZ = PETSc.Vec().create()
-                gamma_array_DispX.setType("seq")
-                gamma_array_DispY.setType("seq")
-                gamma_array_DispZ.setType("seq")
-                KSP_solver = PETSc.KSP().create()
-            gamma_array_DispX.setSizes(self.nSolidInterfacePhysicalNodes + self.d_RBF)
-            gamma_array_DispY.setSizes(self.nSolidInterfacePhysicalNodes + self.d_RBF)
-            gamma_array_DispZ.setSizes(self.nSolidInterfacePhysicalNodes + self.d_RBF)
-            gamma_array_DispX.set(0.0)
-            gamma_array_DispY.set(0.0)
-            gamma_array_DispZ.set(0.0)
-            KSP_solver.setType("fgmres")
-            KSP_solver.getPC().setType("jacobi")
-            KSP_solver.setOperators(self.MappingMatrixA)
-            KSP_solver.setFromOptions()
-            KSP_solver.setInitialGuessNonzero(True)
-            KSP_solver.solve(self.solidInterface_array_DispX, gamma_array_DispX)
-            KSP_solver.solve(self.solidInterface_array_DispY, gamma_array_DispY)
-            if self.nDim == 3:
-                KSP_solver.solve(self.solidInterface_array_DispZ, gamma_array_DispZ)
-            self.MappingMatrixB.mult(gamma_array_DispX, self.fluidInterface_array_DispX)
-            self.MappingMatrixB.mult(gamma_array_DispY, self.fluidInterface_array_DispY)
-            if self.nDim == 3:
-                self.MappingMatrixB.mult(
-                    gamma_array_DispZ, self.fluidInterface_array_DispZ
-                )
-            gamma_array_DispX.destroy()
-            gamma_array_DispY.destroy()
-            gamma_array_DispZ.destroy()
-            KSP_solver.destroy()
-            del gamma_array_DispX
-            del gamma_array_DispY
-            del gamma_array_DispZ
-            del KSP_solver
+            solidDisp = [
+                self.solidInterface_array_DispX,
+                self.solidInterface_array_DispY,
+                self.solidInterface_array_DispZ,
+            ][: self.nDim]
+            gammaDisp = [
+                self.gamma_array_DispX,
+                self.gamma_array_DispY,
+                self.gamma_array_DispZ,
+            ][: self.nDim]
+            fluidDisp = [
+                self.fluidInterface_array_DispX,
+                self.fluidInterface_array_DispY,
+                self.fluidInterface_array_DispZ,
+            ][: self.nDim]
+            self.__solveInterpolation(solidDisp, gammaDisp)
+            for gamma, disp in zip(gammaDisp, fluidDisp):
+                self.MappingMatrixB.mult(gamma, disp)
         else:
             self.MappingMatrix.mult(
                 self.solidInterface_array_DispX, self.fluidInterface_array_DispX
@@ -1689,32 +1930,17 @@ class Interface:
             # Send the partitioned interface to the right fluid partitions
             if myid == self.rootProcess:
                 for iProc in self.fluidInterfaceProcessors:
-                    sendBuff_X = np.empty(
-                        self.fluidPhysicalInterfaceNodesDistribution[iProc],
-                        dtype=np.float64,
-                    )
-                    sendBuff_Y = np.empty(
-                        self.fluidPhysicalInterfaceNodesDistribution[iProc],
-                        dtype=np.float64,
-                    )
-                    sendBuff_Z = np.empty(
-                        self.fluidPhysicalInterfaceNodesDistribution[iProc],
-                        dtype=np.float64,
-                    )
                     globalIndex = self.__getGlobalIndex("fluid", iProc, 0)
-                    for iVertex in range(
-                        self.fluidPhysicalInterfaceNodesDistribution[iProc]
-                    ):
-                        sendBuff_X[iVertex] = self.fluidInterface_array_DispX_recon[
-                            globalIndex
-                        ]
-                        sendBuff_Y[iVertex] = self.fluidInterface_array_DispY_recon[
-                            globalIndex
-                        ]
-                        sendBuff_Z[iVertex] = self.fluidInterface_array_DispZ_recon[
-                            globalIndex
-                        ]
-                        globalIndex += 1
+                    nPhysical = self.fluidPhysicalInterfaceNodesDistribution[iProc]
+                    sendBuff_X = self.fluidInterface_array_DispX_recon[
+                        globalIndex : globalIndex + nPhysical
+                    ].copy()
+                    sendBuff_Y = self.fluidInterface_array_DispY_recon[
+                        globalIndex : globalIndex + nPhysical
+                    ].copy()
+                    sendBuff_Z = self.fluidInterface_array_DispZ_recon[
+                        globalIndex : globalIndex + nPhysical
+                    ].copy()
                     if iProc == self.rootProcess:
                         self.localFluidInterface_array_DispX = np.copy(sendBuff_X)
                         self.localFluidInterface_array_DispY = np.copy(sendBuff_Y)
@@ -1813,48 +2039,24 @@ class Interface:
             FSI_config["MESH_INTERP_METHOD"] == "RBF"
             or FSI_config["MESH_INTERP_METHOD"] == "TPS"
         ):
-            if self.have_MPI:
-                gamma_array_LoadX = PETSc.Vec().create(self.comm)
-                gamma_array_LoadY = PETSc.Vec().create(self.comm)
-                gamma_array_LoadZ = PETSc.Vec().create(self.comm)
-                gamma_array_LoadX.setType("mpi")
-                gamma_array_LoadY.setType("mpi")
-                gamma_array_LoadZ.setType("mpi")
-                KSP_solver = PETSc.KSP().create(self.comm)
-            else:
-                gamma_array_LoadX = PETSc.Vec().create()
-                gamma_array_LoadY = PETSc.Vec().create()
-                gamma_array_LoadZ = PETSc.Vec().create()
-                gamma_array_LoadX.setType("seq")
-                gamma_array_LoadY.setType("seq")
-                gamma_array_LoadZ.setType("seq")
-                KSP_solver = PETSc.KSP().create()
-            gamma_array_LoadX.setSizes(self.nSolidInterfacePhysicalNodes + self.d_RBF)
-            gamma_array_LoadY.setSizes(self.nSolidInterfacePhysicalNodes + self.d_RBF)
-            gamma_array_LoadZ.setSizes(self.nSolidInterfacePhysicalNodes + self.d_RBF)
-            gamma_array_LoadX.set(0.0)
-            gamma_array_LoadY.set(0.0)
-            gamma_array_LoadZ.set(0.0)
-            KSP_solver.setType("fgmres")
-            KSP_solver.getPC().setType("jacobi")
-            KSP_solver.setOperators(self.MappingMatrixA_T)
-            KSP_solver.setFromOptions()
-            self.MappingMatrixB_T.mult(self.fluidLoads_array_X, gamma_array_LoadX)
-            self.MappingMatrixB_T.mult(self.fluidLoads_array_Y, gamma_array_LoadY)
-            if self.nDim == 3:
-                self.MappingMatrixB_T.mult(self.fluidLoads_array_Z, gamma_array_LoadZ)
-            KSP_solver.solve(gamma_array_LoadX, self.solidLoads_array_X)
-            KSP_solver.solve(gamma_array_LoadY, self.solidLoads_array_Y)
-            if self.nDim == 3:
-                KSP_solver.solve(gamma_array_LoadZ, self.solidLoads_array_Z)
-            gamma_array_LoadX.destroy()
-            gamma_array_LoadY.destroy()
-            gamma_array_LoadZ.destroy()
-            KSP_solver.destroy()
-            del gamma_array_LoadX
-            del gamma_array_LoadY
-            del gamma_array_LoadZ
-            del KSP_solver
+            fluidLoads = [
+                self.fluidLoads_array_X,
+                self.fluidLoads_array_Y,
+                self.fluidLoads_array_Z,
+            ][: self.nDim]
+            gammaLoads = [
+                self.gamma_array_LoadX,
+                self.gamma_array_LoadY,
+                self.gamma_array_LoadZ,
+            ][: self.nDim]
+            solidLoads = [
+                self.solidLoads_array_X,
+                self.solidLoads_array_Y,
+                self.solidLoads_array_Z,
+            ][: self.nDim]
+            for loads, gamma in zip(fluidLoads, gammaLoads):
+                self.MappingMatrixB_T.mult(loads, gamma)
+            self.__solveInterpolation(gammaLoads, solidLoads, transpose=True)
         else:
             self.MappingMatrix_T.mult(self.fluidLoads_array_X, self.solidLoads_array_X)
             self.MappingMatrix_T.mult(self.fluidLoads_array_Y, self.solidLoads_array_Y)
@@ -1914,26 +2116,17 @@ class Interface:
             # Send the partitioned loads to the right solid partitions
             if myid == self.rootProcess:
                 for iProc in self.solidInterfaceProcessors:
-                    sendBuff_X = np.empty(
-                        self.solidPhysicalInterfaceNodesDistribution[iProc],
-                        dtype=np.float64,
-                    )
-                    sendBuff_Y = np.empty(
-                        self.solidPhysicalInterfaceNodesDistribution[iProc],
-                        dtype=np.float64,
-                    )
-                    sendBuff_Z = np.empty(
-                        self.solidPhysicalInterfaceNodesDistribution[iProc],
-                        dtype=np.float64,
-                    )
                     globalIndex = self.__getGlobalIndex("solid", iProc, 0)
-                    for iVertex in range(
-                        self.solidPhysicalInterfaceNodesDistribution[iProc]
-                    ):
-                        sendBuff_X[iVertex] = self.solidLoads_array_X_recon[globalIndex]
-                        sendBuff_Y[iVertex] = self.solidLoads_array_Y_recon[globalIndex]
-                        sendBuff_Z[iVertex] = self.solidLoads_array_Z_recon[globalIndex]
-                        globalIndex += 1
+                    nPhysical = self.solidPhysicalInterfaceNodesDistribution[iProc]
+                    sendBuff_X = self.solidLoads_array_X_recon[
+                        globalIndex : globalIndex + nPhysical
+                    ].copy()
+                    sendBuff_Y = self.solidLoads_array_Y_recon[
+                        globalIndex : globalIndex + nPhysical
+                    ].copy()
+                    sendBuff_Z = self.solidLoads_array_Z_recon[
+                        globalIndex : globalIndex + nPhysical
+                    ].copy()
                     if iProc != myid:
                         self.comm.Send(sendBuff_X, dest=iProc, tag=1)
                         self.comm.Send(sendBuff_Y, dest=iProc, tag=2)
@@ -2001,27 +2194,20 @@ class Interface:
         """
         Gets the current solid interface position from the solid solver.
         """
-        if self.have_MPI:
-            myid = self.comm.Get_rank()
-        else:
-            myid = 0
-
         # --- Get the solid interface position from the solid solver and directly fill the corresponding PETSc vector ---
-        GlobalIndex = int()
-        localIndex = 0
-        for iVertex in range(self.nLocalSolidInterfaceNodes):
-            GlobalIndex = SolidSolver.getVertexGlobalIndex(
-                self.solidInterfaceIdentifier, iVertex
-            )
-            if GlobalIndex not in self.SolidHaloNodeList[myid].keys():
-                newDispx, newDispy, newDispz = SolidSolver.getInterfaceNodeDisp(
-                    self.solidInterfaceIdentifier, iVertex
-                )
-                iGlobalVertex = self.__getGlobalIndex("solid", myid, localIndex)
-                self.solidInterface_array_DispX.setValues([iGlobalVertex], newDispx)
-                self.solidInterface_array_DispY.setValues([iGlobalVertex], newDispy)
-                self.solidInterface_array_DispZ.setValues([iGlobalVertex], newDispz)
-                localIndex += 1
+        if self.nLocalSolidInterfaceNodes != 0:
+            newDisp = SolidSolver.getInterfaceNodesDisp(self.solidInterfaceIdentifier)[
+                self.localSolidInterfacePhysicalVertices
+            ]
+            self.solidInterface_array_DispX.setValues(
+                self.localSolidInterfacePETScIndices, newDisp[:, 0]
+            )
+            self.solidInterface_array_DispY.setValues(
+                self.localSolidInterfacePETScIndices, newDisp[:, 1]
+            )
+            self.solidInterface_array_DispZ.setValues(
+                self.localSolidInterfacePETScIndices, newDisp[:, 2]
+            )
 
         self.solidInterface_array_DispX.assemblyBegin()
         self.solidInterface_array_DispX.assemblyEnd()
@@ -2034,30 +2220,23 @@ class Interface:
         """
         Gets the fluid interface loads from the fluid solver.
         """
-        if self.have_MPI:
-            myid = self.comm.Get_rank()
-        else:
-            myid = 0
-
-        GlobalIndex = int()
-        localIndex = 0
-
         # --- Get the fluid interface loads from the fluid solver and directly fill the corresponding PETSc vector ---
-        for iVertex in range(self.nLocalFluidInterfaceNodes):
-            GlobalIndex = FluidSolver.GetNodeGlobalIndex(
-                FluidSolver.GetMarkerNode(self.fluidInterfaceIdentifier, iVertex)
+        if self.nLocalFluidInterfaceNodes != 0:
+            load = np.array(
+                FluidSolver.GetMarkerFlowLoads(self.fluidInterfaceIdentifier)
+            ).reshape(self.nLocalFluidInterfaceNodes, -1)[
+                self.localFluidInterfacePhysicalVertices
+            ]
+            self.fluidLoads_array_X.setValues(
+                self.localFluidInterfacePETScIndices, load[:, 0]
+            )
+            self.fluidLoads_array_Y.setValues(
+                self.localFluidInterfacePETScIndices, load[:, 1]
+            )
+            self.fluidLoads_array_Z.setValues(
+                self.localFluidInterfacePETScIndices,
+                load[:, 2] if load.shape[1] == 3 else 0.0,
             )
-            if GlobalIndex not in self.FluidHaloNodeList[myid].keys():
-                load = FluidSolver.GetMarkerFlowLoad(
-                    self.fluidInterfaceIdentifier, iVertex
-                )
-                iGlobalVertex = self.__getGlobalIndex("fluid", myid, localIndex)
-                self.fluidLoads_array_X.setValues([iGlobalVertex], load[0])
-                self.fluidLoads_array_Y.setValues([iGlobalVertex], load[1])
-                self.fluidLoads_array_Z.setValues(
-                    [iGlobalVertex], load[2] if len(load) == 3 else 0.0
-                )
-                localIndex += 1
 
         self.fluidLoads_array_X.assemblyBegin()
         self.fluidLoads_array_X.assemblyEnd()
@@ -2071,45 +2250,32 @@ class Interface:
         Communicate the change of coordinates of the fluid interface to the fluid solver.
         Prepare the fluid solver for mesh deformation.
         """
-        if self.have_MPI:
-            myid = self.comm.Get_rank()
-        else:
-            myid = 0
-
         # --- Send the new fluid interface position to the fluid solver (on each partition, halo nodes included) ---
-        localIndex = 0
-        for iVertex in range(self.nLocalFluidInterfaceNodes):
-            GlobalIndex = FluidSolver.GetNodeGlobalIndex(
-                FluidSolver.GetMarkerNode(self.fluidInterfaceIdentifier, iVertex)
+        if self.nLocalFluidInterfaceNodes != 0:
+            Disp = np.zeros((self.nLocalFluidInterfaceNodes, 3))
+            Disp[
+                self.localFluidInterfacePhysicalVertices, 0
+            ] = self.localFluidInterface_array_DispX
+            Disp[
+                self.localFluidInterfacePhysicalVertices, 1
+            ] = self.localFluidInterface_array_DispY
+            Disp[
+                self.localFluidInterfacePhysicalVertices, 2
+            ] = self.localFluidInterface_array_DispZ
+            if self.localFluidInterfaceHaloVertices.size:
+                Disp[self.localFluidInterfaceHaloVertices] = [
+                    self.haloNodesDisplacements[GlobalIndex]
+                    for GlobalIndex in self.localFluidInterfaceHaloIndices.tolist()
+                ]
+            FluidSolver.SetMarkerCustomDisplacements(
+                self.fluidInterfaceIdentifier, Disp[:, : self.nDim].ravel()
             )
-            if GlobalIndex in self.FluidHaloNodeList[myid].keys():
-                DispX, DispY, DispZ = self.haloNodesDisplacements[GlobalIndex]
-                FluidSolver.SetMarkerCustomDisplacement(
-                    self.fluidInterfaceIdentifier,
-                    int(iVertex),
-                    np.array([DispX, DispY, DispZ]),
-                )
-            else:
-                DispX = self.localFluidInterface_array_DispX[localIndex]
-                DispY = self.localFluidInterface_array_DispY[localIndex]
-                DispZ = self.localFluidInterface_array_DispZ[localIndex]
-                FluidSolver.SetMarkerCustomDisplacement(
-                    self.fluidInterfaceIdentifier,
-                    int(iVertex),
-                    np.array([DispX, DispY, DispZ]),
-                )
-                localIndex += 1
 
     def setSolidInterfaceLoads(self, SolidSolver, FSI_config):
         """
         Communicates the new solid interface loads to the solid solver.
         Calculates the new resultant forces (lift, drag, ...).
         """
-        if self.have_MPI:
-            myid = self.comm.Get_rank()
-        else:
-            myid = 0
-
         FX = np.array(0.0, dtype=np.float64)
         FY = np.array(0.0, dtype=np.float64)  # solid-side resultant forces
         FZ = np.array(0.0, dtype=np.float64)
@@ -2125,10 +2291,16 @@ class Interface:
         FFY = self.fluidLoads_array_Y.sum()
         FFZ = self.fluidLoads_array_Z.sum()
 
-        for iVertex in range(self.nLocalSolidInterfacePhysicalNodes):
-            FXSendBuff += self.localSolidLoads_array_X[iVertex]
-            FYSendBuff += self.localSolidLoads_array_Y[iVertex]
-            FZSendBuff += self.localSolidLoads_array_Z[iVertex]
+        if self.nLocalSolidInterfacePhysicalNodes != 0:
+            FXSendBuff += self.localSolidLoads_array_X[
+                : self.nLocalSolidInterfacePhysicalNodes
+            ].sum()
+            FYSendBuff += self.localSolidLoads_array_Y[
+                : self.nLocalSolidInterfacePhysicalNodes
+            ].sum()
+            FZSendBuff += self.localSolidLoads_array_Z[
+                : self.nLocalSolidInterfacePhysicalNodes
+            ].sum()
 
         if self.have_MPI:
             self.comm.Allreduce(FXSendBuff, FX, op=self.MPI.SUM)
@@ -2148,20 +2320,19 @@ class Interface:
         self.MPIPrint("Fluid side (Fx, Fy, Fz) = ({}, {}, {})".format(FFX, FFY, FFZ))
 
         # --- Send the new solid interface loads to the solid solver (on each partition, halo nodes included) ---
-        GlobalIndex = int()
-        localIndex = 0
-        for iVertex in range(self.nLocalSolidInterfaceNodes):
-            GlobalIndex = SolidSolver.getVertexGlobalIndex(
-                self.solidInterfaceIdentifier, iVertex
-            )
-            if GlobalIndex in self.SolidHaloNodeList[myid].keys():
-                pass  # TODO here, when the solid solver will run in parallel, we will need to pass the halo loads
-            else:
-                Fx = self.localSolidLoads_array_X[localIndex]
-                Fy = self.localSolidLoads_array_Y[localIndex]
-                Fz = self.localSolidLoads_array_Z[localIndex]
-                SolidSolver.applyload(iVertex, Fx, Fy, Fz)
-                localIndex += 1
+        # TODO here, when the solid solver will run in parallel, we will need to pass the halo loads
+        if self.nLocalSolidInterfaceNodes != 0:
+            nPhysical = self.nLocalSolidInterfacePhysicalNodes
+            SolidSolver.applyloads(
+                self.localSolidInterfacePhysicalVertices,
+                np.column_stack(
+                    (
+                        self.localSolidLoads_array_X[:nPhysical],
+                        self.localSolidLoads_array_Y[:nPhysical],
+                        self.localSolidLoads_array_Z[:nPhysical],
+                    )
+                ),
+            )
 
     def computeSolidInterfaceResidual(self, SolidSolver):
         """
@@ -2197,14 +2368,14 @@ class Interface:
         predDisp_array_Y.set(0.0)
         predDisp_array_Z.set(0.0)
 
-        for iVertex in range(self.nLocalSolidInterfaceNodes):
-            predDispx, predDispy, predDispz = SolidSolver.getInterfaceNodeDisp(
-                self.solidInterfaceIdentifier, iVertex
+        if self.nLocalSolidInterfaceNodes != 0:
+            predDisp = SolidSolver.getInterfaceNodesDisp(self.solidInterfaceIdentifier)
+            iGlobalVertices = self.__getGlobalIndex("solid", myid, 0) + np.arange(
+                self.nLocalSolidInterfaceNodes, dtype=PETSc.IntType
             )
-            iGlobalVertex = self.__getGlobalIndex("solid", myid, iVertex)
-            predDisp_array_X.setValues([iGlobalVertex], predDispx)
-            predDisp_array_Y.setValues([iGlobalVertex], predDispy)
-            predDisp_array_Z.setValues([iGlobalVertex], predDispz)
+            predDisp_array_X.setValues(iGlobalVertices, predDisp[:, 0])
+            predDisp_array_Y.setValues(iGlobalVertices, predDisp[:, 1])
+            predDisp_array_Z.setValues(iGlobalVertices, predDisp[:, 2])
 
         predDisp_array_X.assemblyBegin()
         predDisp_array_X.assemblyEnd()
@@ -2362,11 +2533,6 @@ class Interface:
         Calculates a prediciton for the solid interface position for the next time step.
         """
 
-        if self.have_MPI:
-            myid = self.comm.Get_rank()
-        else:
-            myid = 0
-
         if FSI_config["DISP_PRED"] == "FIRST_ORDER":
             self.MPIPrint("First order predictor")
             alpha_0 = 1.0
@@ -2421,27 +2587,19 @@ class Interface:
         VelnM1_array_Z.set(0.0)
 
         # --- Fill the PETSc vectors ---
-        GlobalIndex = int()
-        localIndex = 0
-        for iVertex in range(self.nLocalSolidInterfaceNodes):
-            GlobalIndex = SolidSolver.getVertexGlobalIndex(
-                self.solidInterfaceIdentifier, iVertex
-            )
-            if GlobalIndex not in self.SolidHaloNodeList[myid].keys():
-                iGlobalVertex = self.__getGlobalIndex("solid", myid, localIndex)
-                velx, vely, velz = SolidSolver.getInterfaceNodeVel(
-                    self.solidInterfaceIdentifier, iVertex
-                )
-                velxNm1, velyNm1, velzNm1 = SolidSolver.getInterfaceNodeVelNm1(
-                    self.solidInterfaceIdentifier, iVertex
-                )
-                Vel_array_X.setValues([iGlobalVertex], velx)
-                Vel_array_Y.setValues([iGlobalVertex], vely)
-                Vel_array_Z.setValues([iGlobalVertex], velz)
-                VelnM1_array_X.setValues([iGlobalVertex], velxNm1)
-                VelnM1_array_Y.setValues([iGlobalVertex], velyNm1)
-                VelnM1_array_Z.setValues([iGlobalVertex], velzNm1)
-                localIndex += 1
+        if self.nLocalSolidInterfaceNodes != 0:
+            vel = SolidSolver.getInterfaceNodesVel(self.solidInterfaceIdentifier)[
+                self.localSolidInterfacePhysicalVertices
+            ]
+            velNm1 = SolidSolver.getInterfaceNodesVelNm1(self.solidInterfaceIdentifier)[
+                self.localSolidInterfacePhysicalVertices
+            ]
+            Vel_array_X.setValues(self.localSolidInterfacePETScIndices, vel[:, 0])
+            Vel_array_Y.setValues(self.localSolidInterfacePETScIndices, vel[:, 1])
+            Vel_array_Z.setValues(self.localSolidInterfacePETScIndices, vel[:, 2])
+            VelnM1_array_X.setValues(self.localSolidInterfacePETScIndices, velNm1[:, 0])
+            VelnM1_array_Y.setValues(self.localSolidInterfacePETScIndices, velNm1[:, 1])
+            VelnM1_array_Z.setValues(self.localSolidInterfacePETScIndices, velNm1[:, 2])
 
         Vel_array_X.assemblyBegin()
         Vel_array_X.assemblyEnd()
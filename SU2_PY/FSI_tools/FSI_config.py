@@ -112,6 +112,8 @@ class FSIConfig:
                 or (this_param == "TIME_MARCHING")
                 or (this_param == "IMPOSED_MOTION")
                 or (this_param == "MAPPING_MODES")
+                or (this_param == "MAPPING_CACHE")
+                or (this_param == "MAPPING_SOLVER")
             ):
                 self._ConfigContent[this_param] = this_value
 
@@ -127,6 +129,12 @@ class FSIConfig:
                 False,
             )
 
+        if "MAPPING_CACHE" not in self._ConfigContent:
+            self._ConfigContent["MAPPING_CACHE"] = "NONE"
+
+        if "MAPPING_SOLVER" not in self._ConfigContent:
+            self._ConfigContent["MAPPING_SOLVER"] = "ITERATIVE"
+
         if "IMPOSED_MOTION" not in self._ConfigContent:
             self._ConfigContent["IMPOSED_MOTION"] = "NO"
             self.MPIPrint(
@@ -88,7 +88,7 @@ class Design(object):
         if "*" in folder:
             folder = su2io.next_folder(folder)
 
-        config = copy.deepcopy(config)
+        config = config.snapshot()
         state = copy.deepcopy(state)
         state = su2io.State(state)
         state.find_files(config)
@@ -124,7 +124,7 @@ class Design(object):
         # check folder
         assert os.path.exists(folder), "cannot find design folder %s" % folder
 
-        konfig = copy.deepcopy(config)
+        konfig = config.snapshot()
 
         """
         If the time convergence criterion was activated, we have less time iterations.
@@ -233,6 +233,10 @@ def obj_f(dvs, config, state=None):
     config.unpack_dvs(dvs)
     state = su2io.State(state)
 
+    # results found in the cache skip their evaluation
+    cache = su2io.ResultCache.from_config(config)
+    cache_key = cache.load(config, state)
+
     def_objs = config["OPT_OBJECTIVE"]
     objectives = def_objs.keys()
 
@@ -259,6 +263,8 @@ def obj_f(dvs, config, state=None):
     if "COMBO" in state.FUNCTIONS:
         state["FUNCTIONS"]["COMBO"] = func
 
+    cache.store(cache_key, config, state)
+
     return vals_out
 
 
@@ -329,6 +335,10 @@ def obj_df(dvs, config, state=None):
     # unpack config and state
     config.unpack_dvs(dvs)
     state = su2io.State(state)
+
+    # results found in the cache skip their evaluation
+    cache = su2io.ResultCache.from_config(config)
+    cache_key = cache.load(config, state)
     grad_method = config.get("GRADIENT_METHOD", "CONTINUOUS_ADJOINT")
 
     def_objs = config["OPT_OBJECTIVE"]
@@ -339,8 +349,7 @@ def obj_df(dvs, config, state=None):
     # Whether to calculate gradients one-by-one or all-at-once
     combine_obj = config["OPT_COMBINE_OBJECTIVE"] == "YES"
 
-    dv_scales = config["DEFINITION_DV"]["SCALE"]
-    dv_size = config["DEFINITION_DV"]["SIZE"]
+    dv_layout = config.dv_layout()
 
     # evaluate each objective
     vals_out = []
@@ -365,11 +374,7 @@ def obj_df(dvs, config, state=None):
         grad = su2grad(obj_list, grad_method, config, state)
         # scaling : obj scale  and sign are accounted for in combo gradient, dv scale now applied
         global_factor = float(config["OPT_GRADIENT_FACTOR"])
-        k = 0
-        for i_dv, dv_scl in enumerate(dv_scales):
-            for i_grd in range(dv_size[i_dv]):
-                grad[k] = grad[k] * global_factor / dv_scl
-                k = k + 1
+        grad = dv_layout.scale_gradient(grad, global_factor).tolist()
 
         vals_out.append(grad)
     else:
@@ -395,16 +400,14 @@ def obj_df(dvs, config, state=None):
             grad = su2grad(this_obj, grad_method, config, state)
 
             # scaling and sign
-            k = 0
-            for i_dv, dv_scl in enumerate(dv_scales):
-                for i_grd in range(dv_size[i_dv]):
-                    grad[k] = grad[k] * sign * scale * global_factor / dv_scl
-                    k = k + 1
+            grad = dv_layout.scale_gradient(grad, sign * scale * global_factor).tolist()
 
             vals_out.append(grad)
 
     #: for each objective
 
+    cache.store(cache_key, config, state)
+
     return vals_out
 
 
@@ -429,6 +432,10 @@ def con_ceq(dvs, config, state=None):
     config.unpack_dvs(dvs)
     state = su2io.State(state)
 
+    # results found in the cache skip their evaluation
+    cache = su2io.ResultCache.from_config(config)
+    cache_key = cache.load(config, state)
+
     def_cons = config["OPT_CONSTRAINT"]["EQUALITY"]
     constraints = def_cons.keys()
 
@@ -449,6 +456,8 @@ def con_ceq(dvs, config, state=None):
 
     #: for each constraint
 
+    cache.store(cache_key, config, state)
+
     return vals_out
 
 
@@ -472,13 +481,16 @@ def con_dceq(dvs, config, state=None):
     # unpack state and config
     config.unpack_dvs(dvs)
     state = su2io.State(state)
+
+    # results found in the cache skip their evaluation
+    cache = su2io.ResultCache.from_config(config)
+    cache_key = cache.load(config, state)
     grad_method = config.get("GRADIENT_METHOD", "CONTINUOUS_ADJOINT")
 
     def_cons = config["OPT_CONSTRAINT"]["EQUALITY"]
     constraints = def_cons.keys()
 
-    dv_scales = config["DEFINITION_DV"]["SCALE"]
-    dv_size = config["DEFINITION_DV"]["SIZE"]
+    dv_layout = config.dv_layout()
 
     # evaluate each constraint
     vals_out = []
@@ -490,16 +502,14 @@ def con_dceq(dvs, config, state=None):
         grad = su2grad(this_con, grad_method, config, state)
 
         # scaling
-        k = 0
-        for i_dv, dv_scl in enumerate(dv_scales):
-            for i_grd in range(dv_size[i_dv]):
-                grad[k] = grad[k] * global_factor / dv_scl
-                k = k + 1
+        grad = dv_layout.scale_gradient(grad, global_factor).tolist()
 
         vals_out.append(grad)
 
     #: for each constraint
 
+    cache.store(cache_key, config, state)
+
     return vals_out
 
 
@@ -525,6 +535,10 @@ def con_cieq(dvs, config, state=None):
     config.unpack_dvs(dvs)
     state = su2io.State(state)
 
+    # results found in the cache skip their evaluation
+    cache = su2io.ResultCache.from_config(config)
+    cache_key = cache.load(config, state)
+
     def_cons = config["OPT_CONSTRAINT"]["INEQUALITY"]
     constraints = def_cons.keys()
 
@@ -547,6 +561,8 @@ def con_cieq(dvs, config, state=None):
 
     #: for each constraint
 
+    cache.store(cache_key, config, state)
+
     return vals_out
 
 
@@ -571,13 +587,16 @@ def con_dcieq(dvs, config, state=None):
     # unpack state and config
     config.unpack_dvs(dvs)
     state = su2io.State(state)
+
+    # results found in the cache skip their evaluation
+    cache = su2io.ResultCache.from_config(config)
+    cache_key = cache.load(config, state)
     grad_method = config.get("GRADIENT_METHOD", "CONTINUOUS_ADJOINT")
 
     def_cons = config["OPT_CONSTRAINT"]["INEQUALITY"]
     constraints = def_cons.keys()
 
-    dv_scales = config["DEFINITION_DV"]["SCALE"]
-    dv_size = config["DEFINITION_DV"]["SIZE"]
+    dv_layout = config.dv_layout()
 
     # evaluate each constraint
     vals_out = []
@@ -591,16 +610,14 @@ def con_dcieq(dvs, config, state=None):
         grad = su2grad(this_con, grad_method, config, state)
 
         # scaling and sign
-        k = 0
-        for i_dv, dv_scl in enumerate(dv_scales):
-            for i_grd in range(dv_size[i_dv]):
-                grad[k] = grad[k] * sign * global_factor / dv_scl
-                k = k + 1
+        grad = dv_layout.scale_gradient(grad, sign * global_factor).tolist()
 
         vals_out.append(grad)
 
     #: for each constraint
 
+    cache.store(cache_key, config, state)
+
     return vals_out
 
 
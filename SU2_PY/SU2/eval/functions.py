@@ -30,6 +30,7 @@
 # ----------------------------------------------------------------------
 
 import os, sys, shutil, copy, time, subprocess
+import multiprocessing
 from .. import run as su2run
 from .. import io as su2io
 from .. import util as su2util
@@ -207,10 +208,7 @@ def aerodynamics(config, state=None):
     # ----------------------------------------------------
     #  Direct Solution
     # ----------------------------------------------------
-    opt_names = []
-    for key in su2io.historyOutFields:
-        if su2io.historyOutFields[key]["TYPE"] == "COEFFICIENT":
-            opt_names.append(key)
+    opt_names = su2io.get_fieldsOfType("COEFFICIENT")
 
     # redundancy check
     direct_done = all([key in state.FUNCTIONS for key in opt_names])
@@ -284,7 +282,7 @@ def aerodynamics(config, state=None):
             # # RUN DIRECT SOLUTION # #
             info = su2run.direct(config)
 
-            konfig = copy.deepcopy(config)
+            konfig = config.snapshot()
             """
             If the time convergence criterion was activated, we have less time iterations.
             Store the changed values of TIME_ITER, ITER_AVERAGE_OBJ and UNST_ADJOINT_ITER in
@@ -408,7 +406,7 @@ def stability(config, state=None, step=1e-2):
     with redirect_folder(folder, pull, link) as push:
         with redirect_output(log_direct):
 
-            konfig = copy.deepcopy(config)
+            konfig = config.snapshot()
             ztate = copy.deepcopy(state)
 
             # TODO: GENERALIZE
@@ -506,10 +504,7 @@ def multipoint(config, state=None, step=1e-2):
     for i in range(len(weight_list)):
         folder[i] = "MULTIPOINT_" + str(i)
 
-    opt_names = []
-    for key in su2io.historyOutFields:
-        if su2io.historyOutFields[key]["TYPE"] == "COEFFICIENT":
-            opt_names.append(key)
+    opt_names = su2io.get_fieldsOfType("COEFFICIENT")
 
     # ----------------------------------------------------
     #  Initialize
@@ -539,23 +534,38 @@ def multipoint(config, state=None, step=1e-2):
     # does decomposition and deformation
     info = update_mesh(config, state)
 
+    # ----------------------------------------------------
+    #  Concurrent Points
+    # ----------------------------------------------------
+
+    # flow conditions of each point
+    orig_marker_outlet = config["MARKER_OUTLET"]
+    orig_marker_outlet = orig_marker_outlet.replace("(", "").replace(")", "").split(",")
+    conditions = []
+    for i in range(len(weight_list)):
+        this_conditions = su2util.ordered_bunch()
+        this_conditions.AOA = aoa_list[i]
+        this_conditions.SIDESLIP_ANGLE = sideslip_list[i]
+        this_conditions.MACH_NUMBER = mach_list[i]
+        this_conditions.REYNOLDS_NUMBER = reynolds_list[i]
+        this_conditions.FREESTREAM_TEMPERATURE = freestream_temp_list[i]
+        this_conditions.FREESTREAM_PRESSURE = freestream_press_list[i]
+        this_conditions.TARGET_CL = target_cl_list[i]
+        this_conditions.MARKER_OUTLET = (
+            "(" + orig_marker_outlet[0] + "," + outlet_value_list[i] + ")"
+        )
+        conditions.append(this_conditions)
+
+    # points after the first run simultaneously, each gets a share of the partitions
+    n_jobs = max(1, min(int(config.get("MULTIPOINT_JOBS", 1)), len(weight_list) - 1))
+
     # ----------------------------------------------------
     #  FIRST POINT
     # ----------------------------------------------------
 
     # will run in DIRECT/
 
-    config.AOA = aoa_list[0]
-    config.SIDESLIP_ANGLE = sideslip_list[0]
-    config.MACH_NUMBER = mach_list[0]
-    config.REYNOLDS_NUMBER = reynolds_list[0]
-    config.FREESTREAM_TEMPERATURE = freestream_temp_list[0]
-    config.FREESTREAM_PRESSURE = freestream_press_list[0]
-    config.TARGET_CL = target_cl_list[0]
-    orig_marker_outlet = config["MARKER_OUTLET"]
-    orig_marker_outlet = orig_marker_outlet.replace("(", "").replace(")", "").split(",")
-    new_marker_outlet = "(" + orig_marker_outlet[0] + "," + outlet_value_list[0] + ")"
-    config.MARKER_OUTLET = new_marker_outlet
+    config.update(conditions[0])
     config.SOLUTION_FILENAME = solution_flow_list[0]
 
     # If solution file for the first point is available, use it
@@ -615,7 +625,7 @@ def multipoint(config, state=None, step=1e-2):
     with redirect_folder(folder[0], pull, link) as push:
         with redirect_output(log_direct):
 
-            konfig = copy.deepcopy(config)
+            konfig = config.snapshot()
             ztate = copy.deepcopy(state)
             # Reset restart to original value
             konfig["RESTART_SOL"] = restart_sol
@@ -628,143 +638,74 @@ def multipoint(config, state=None, step=1e-2):
             stringlist = string.split()
             subprocess.Popen(stringlist)
 
-    for i in range(len(weight_list) - 1):
-
-        konfig = copy.deepcopy(config)
+    # start the other points in the background, from the state after the first
+    pool = None
+    results = {}
+    if n_jobs > 1:
+        # arguments are pickled in the background, pass snapshots
+        konfig = config.snapshot()
         ztate = copy.deepcopy(state)
-
-        konfig.SOLUTION_FILENAME = solution_flow_list[i + 1]
-
-        # delete direct solution file from previous point
-        if "DIRECT" in ztate.FILES:
-            del ztate.FILES.DIRECT
-
-        if "FLOW_META" in ztate.FILES:
-            del ztate.FILES.FLOW_META
-
-        # use direct solution file from relevant point
-        if "MULTIPOINT_DIRECT" in state.FILES and state.FILES.MULTIPOINT_DIRECT[i + 1]:
-            ztate.FILES["DIRECT"] = state.FILES.MULTIPOINT_DIRECT[i + 1]
-
-        # use flow.meta file from relevant point
-        if (
-            "MULTIPOINT_FLOW_META" in state.FILES
-            and state.FILES.MULTIPOINT_FLOW_META[i + 1]
-        ):
-            ztate.FILES["FLOW_META"] = state.FILES.MULTIPOINT_FLOW_META[i + 1]
-
-        # use mesh file from relevant point
-        if "MULTIPOINT_MESH_FILENAME" in ztate.FILES:
-            ztate.FILES.MESH = ztate.FILES.MULTIPOINT_MESH_FILENAME[i + 1]
-            konfig.MESH_FILENAME = ztate.FILES.MULTIPOINT_MESH_FILENAME[i + 1]
-            konfig["DV_VALUE_OLD"] = dv_value_old
-
-        files = ztate.FILES
-        link = []
-        pull = []
-
-        # files: mesh
-        name = files["MESH"]
-        name = su2io.expand_part(name, konfig)
-        link.extend(name)
-
-        # files: direction solution
-        if "DIRECT" in files:
-            name = files["DIRECT"]
-            name = su2io.expand_time(name, konfig)
-            link.extend(name)
-        else:
-            konfig["RESTART_SOL"] = "NO"
-
-        # files: meta data for the flow
-        if "FLOW_META" in files:
-            pull.append(files["FLOW_META"])
-
-        # pull needed files, start folder_1
-        with redirect_folder(folder[i + 1], pull, link) as push:
-            with redirect_output(log_direct):
-
-                # Perform deformation on multipoint mesh
-                if "MULTIPOINT_MESH_FILENAME" in state.FILES:
-                    info = update_mesh(konfig, ztate)
-
-                # Update config values
-                konfig.AOA = aoa_list[i + 1]
-                konfig.SIDESLIP_ANGLE = sideslip_list[i + 1]
-                konfig.MACH_NUMBER = mach_list[i + 1]
-                konfig.REYNOLDS_NUMBER = reynolds_list[i + 1]
-                konfig.FREESTREAM_TEMPERATURE = freestream_temp_list[i + 1]
-                konfig.FREESTREAM_PRESSURE = freestream_press_list[i + 1]
-                konfig.TARGET_CL = target_cl_list[i + 1]
-                orig_marker_outlet = config["MARKER_OUTLET"]
-                orig_marker_outlet = (
-                    orig_marker_outlet.replace("(", "").replace(")", "").split(",")
-                )
-                new_marker_outlet = (
-                    "(" + orig_marker_outlet[0] + "," + outlet_value_list[i + 1] + ")"
+        number_part = konfig.get("NUMBER_PART", 0)
+        if number_part > 1:
+            konfig.NUMBER_PART = max(1, number_part // n_jobs)
+        pool = multiprocessing.Pool(n_jobs)
+        for i in range(1, len(weight_list)):
+            results[i] = pool.apply_async(
+                _multipoint_aerodynamics,
+                (
+                    i,
+                    konfig,
+                    ztate,
+                    conditions[i],
+                    solution_flow_list[i],
+                    flow_meta_list[i],
+                    dv_value_old,
+                    log_direct,
+                ),
+            )
+        pool.close()
+
+    try:
+        for i in range(1, len(weight_list)):
+
+            if pool is None:
+                func[i], point_files = _multipoint_aerodynamics(
+                    i,
+                    config,
+                    state,
+                    conditions[i],
+                    solution_flow_list[i],
+                    flow_meta_list[i],
+                    dv_value_old,
+                    log_direct,
                 )
-                konfig.MARKER_OUTLET = new_marker_outlet
-
-                ztate.FUNCTIONS.clear()
+            else:
+                func[i], point_files = results[i].get()
 
-                # rename meta data to flow.meta
-                if "FLOW_META" in ztate.FILES:
-                    ztate.FILES["FLOW_META"] = "flow.meta"
-                    os.rename(ztate.FILES.MULTIPOINT_FLOW_META[i + 1], "flow.meta")
+            # Link direct solution to MULTIPOINT_# folder
+            src = os.getcwd()
+            src = os.path.abspath(src).rstrip("/") + "/"
+            dst = os.path.abspath(folder[i]).rstrip("/") + "/"
 
-                func[i + 1] = aerodynamics(konfig, ztate)
-
-                dst = os.getcwd()
-
-                # revert name of flow.meta file to multipoint name
-                if os.path.exists("flow.meta"):
-                    os.rename("flow.meta", flow_meta_list[i + 1])
-                    ztate.FILES["FLOW_META"] = flow_meta_list[i + 1]
-                    dst_flow_meta = (
-                        os.path.abspath(dst).rstrip("/")
-                        + "/"
-                        + ztate.FILES["FLOW_META"]
+            # make unix link
+            os.symlink(src + point_files["DIRECT"], dst + point_files["DIRECT"])
+
+            # If the mesh doesn't already exist, link it
+            if "MULTIPOINT_MESH_FILENAME" in state.FILES:
+                if not os.path.exists(src + point_files["MESH"]):
+                    os.symlink(src + point_files["MESH"], dst + point_files["MESH"])
+
+            # link flow.meta
+            if "MULTIPOINT_FLOW_META" in state.FILES and "FLOW_META" in point_files:
+                if not os.path.exists(src + point_files["FLOW_META"]):
+                    os.symlink(
+                        src + point_files["FLOW_META"], dst + point_files["FLOW_META"]
                     )
-                    push.append(ztate.FILES["FLOW_META"])
-
-                # direct files to push
-                dst_direct = (
-                    os.path.abspath(dst).rstrip("/") + "/" + ztate.FILES["DIRECT"]
-                )
-                name = ztate.FILES["DIRECT"]
-                name = su2io.expand_zones(name, konfig)
-                name = su2io.expand_time(name, konfig)
-                push.extend(name)
 
-                if "MULTIPOINT_MESH_FILENAME" in state.FILES:
-                    # Mesh files to push
-                    dst_mesh = (
-                        os.path.abspath(dst).rstrip("/") + "/" + ztate.FILES["MESH"]
-                    )
-                    name = ztate.FILES["MESH"]
-                    name = su2io.expand_part(name, konfig)
-                    push.extend(name)
-
-        # Link direct solution to MULTIPOINT_# folder
-        src = os.getcwd()
-        src_direct = os.path.abspath(src).rstrip("/") + "/" + ztate.FILES["DIRECT"]
-
-        # make unix link
-        os.symlink(src_direct, dst_direct)
-
-        # If the mesh doesn't already exist, link it
-        if "MULTIPOINT_MESH_FILENAME" in state.FILES:
-            src_mesh = os.path.abspath(src).rstrip("/") + "/" + ztate.FILES["MESH"]
-            if not os.path.exists(src_mesh):
-                os.symlink(src_mesh, dst_mesh)
-
-        # link flow.meta
-        if "MULTIPOINT_FLOW_META" in state.FILES:
-            src_flow_meta = (
-                os.path.abspath(src).rstrip("/") + "/" + ztate.FILES["FLOW_META"]
-            )
-            if not os.path.exists(src_flow_meta):
-                os.symlink(src_flow_meta, dst_flow_meta)
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
 
     # Update MULTIPOINT_DIRECT in state.FILES
     state.FILES.MULTIPOINT_DIRECT = solution_flow_list
@@ -795,6 +736,126 @@ def multipoint(config, state=None, step=1e-2):
     return funcs
 
 
+def _multipoint_aerodynamics(
+    i_point,
+    config,
+    state,
+    conditions,
+    solution_filename,
+    flow_meta_name,
+    dv_value_old,
+    log_direct,
+):
+    """func, files = _multipoint_aerodynamics(i_point,config,state,conditions,
+                                              solution_filename,flow_meta_name,
+                                              dv_value_old,log_direct)
+    evaluates the aerodynamics of one multipoint point
+    after the first, config and state are not modified
+
+    Executes in:
+        ./MULTIPOINT_#
+
+    Outputs:
+        func  - Bunch() of aerodynamic function values
+        files - state files of the point, the direct solution,
+                mesh and flow.meta are pushed to the current folder
+    """
+
+    konfig = config.snapshot()
+    ztate = copy.deepcopy(state)
+    folder = "MULTIPOINT_" + str(i_point)
+
+    konfig.SOLUTION_FILENAME = solution_filename
+
+    # delete direct solution file from previous point
+    if "DIRECT" in ztate.FILES:
+        del ztate.FILES.DIRECT
+
+    if "FLOW_META" in ztate.FILES:
+        del ztate.FILES.FLOW_META
+
+    # use direct solution file from relevant point
+    if "MULTIPOINT_DIRECT" in state.FILES and state.FILES.MULTIPOINT_DIRECT[i_point]:
+        ztate.FILES["DIRECT"] = state.FILES.MULTIPOINT_DIRECT[i_point]
+
+    # use flow.meta file from relevant point
+    if (
+        "MULTIPOINT_FLOW_META" in state.FILES
+        and state.FILES.MULTIPOINT_FLOW_META[i_point]
+    ):
+        ztate.FILES["FLOW_META"] = state.FILES.MULTIPOINT_FLOW_META[i_point]
+
+    # use mesh file from relevant point
+    if "MULTIPOINT_MESH_FILENAME" in ztate.FILES:
+        ztate.FILES.MESH = ztate.FILES.MULTIPOINT_MESH_FILENAME[i_point]
+        konfig.MESH_FILENAME = ztate.FILES.MULTIPOINT_MESH_FILENAME[i_point]
+        konfig["DV_VALUE_OLD"] = dv_value_old
+
+    files = ztate.FILES
+    link = []
+    pull = []
+
+    # files: mesh
+    name = files["MESH"]
+    name = su2io.expand_part(name, konfig)
+    link.extend(name)
+
+    # files: direction solution
+    if "DIRECT" in files:
+        name = files["DIRECT"]
+        name = su2io.expand_time(name, konfig)
+        link.extend(name)
+    else:
+        konfig["RESTART_SOL"] = "NO"
+
+    # files: meta data for the flow
+    if "FLOW_META" in files:
+        pull.append(files["FLOW_META"])
+
+    # pull needed files, start folder
+    with redirect_folder(folder, pull, link) as push:
+        with redirect_output(log_direct):
+
+            # Perform deformation on multipoint mesh
+            if "MULTIPOINT_MESH_FILENAME" in state.FILES:
+                info = update_mesh(konfig, ztate)
+
+            # Update config values
+            konfig.update(conditions)
+
+            ztate.FUNCTIONS.clear()
+
+            # rename meta data to flow.meta
+            if "FLOW_META" in ztate.FILES:
+                ztate.FILES["FLOW_META"] = "flow.meta"
+                os.rename(ztate.FILES.MULTIPOINT_FLOW_META[i_point], "flow.meta")
+
+            func = aerodynamics(konfig, ztate)
+
+            # revert name of flow.meta file to multipoint name
+            if os.path.exists("flow.meta"):
+                os.rename("flow.meta", flow_meta_name)
+                ztate.FILES["FLOW_META"] = flow_meta_name
+                push.append(ztate.FILES["FLOW_META"])
+
+            # direct files to push
+            name = ztate.FILES["DIRECT"]
+            name = su2io.expand_zones(name, konfig)
+            name = su2io.expand_time(name, konfig)
+            push.extend(name)
+
+            if "MULTIPOINT_MESH_FILENAME" in state.FILES:
+                # Mesh files to push
+                name = ztate.FILES["MESH"]
+                name = su2io.expand_part(name, konfig)
+                push.extend(name)
+
+    return func, ztate.FILES
+
+
+#: def _multipoint_aerodynamics()
+
+
 # ----------------------------------------------------------------------
 #  Geometric Functions
 # ----------------------------------------------------------------------
@@ -30,6 +30,7 @@
 # ----------------------------------------------------------------------
 
 import os, sys, shutil, copy, subprocess
+import multiprocessing
 from .. import run as su2run
 from .. import io as su2io
 from .. import util as su2util
@@ -225,7 +226,7 @@ def adjoint(func_name, config, state=None):
     #  Adjoint Solution
     # ----------------------------------------------------
 
-    konfig = copy.deepcopy(config)
+    konfig = config.snapshot()
 
     # Set correct starting time for reverse sweep
     if (
@@ -436,7 +437,7 @@ def stability(func_name, config, state=None, step=1e-2):
     with redirect_folder(folder, pull, link) as push:
         with redirect_output(log_direct):
 
-            konfig = copy.deepcopy(config)
+            konfig = config.snapshot()
             ztate = copy.deepcopy(state)
 
             # TODO: GENERALIZE
@@ -513,10 +514,7 @@ def multipoint(func_name, config, state=None, step=1e-2):
     for i in range(len(weight_list)):
         folder[i] = "MULTIPOINT_" + str(i)
 
-    opt_names = []
-    for key in su2io.historyOutFields:
-        if su2io.historyOutFields[key]["TYPE"] == "COEFFICIENT":
-            opt_names.append(key)
+    opt_names = su2io.get_fieldsOfType("COEFFICIENT")
 
     # ----------------------------------------------------
     #  Initialize
@@ -550,19 +548,29 @@ def multipoint(func_name, config, state=None, step=1e-2):
     #    # does decomposition and deformation
     #    info = update_mesh(config,state)
 
+    # flow conditions of each point
+    conditions = []
+    for i in range(len(weight_list)):
+        this_conditions = su2util.ordered_bunch()
+        this_conditions.AOA = aoa_list[i]
+        this_conditions.SIDESLIP_ANGLE = sideslip_list[i]
+        this_conditions.MACH_NUMBER = mach_list[i]
+        this_conditions.REYNOLDS_NUMBER = reynolds_list[i]
+        this_conditions.FREESTREAM_TEMPERATURE = freestream_temp_list[i]
+        this_conditions.FREESTREAM_PRESSURE = freestream_press_list[i]
+        this_conditions.TARGET_CL = target_cl_list[i]
+        conditions.append(this_conditions)
+
+    # points after the first run simultaneously, each gets a share of the partitions
+    n_jobs = max(1, min(int(config.get("MULTIPOINT_JOBS", 1)), len(weight_list) - 1))
+
     # ----------------------------------------------------
     #  FIRST POINT
     # ----------------------------------------------------
 
     # will run in ADJOINT/
 
-    config.AOA = aoa_list[0]
-    config.SIDESLIP_ANGLE = sideslip_list[0]
-    config.MACH_NUMBER = mach_list[0]
-    config.REYNOLDS_NUMBER = reynolds_list[0]
-    config.FREESTREAM_TEMPERATURE = freestream_temp_list[0]
-    config.FREESTREAM_PRESSURE = freestream_press_list[0]
-    config.TARGET_CL = target_cl_list[0]
+    config.update(conditions[0])
     config.SOLUTION_FILENAME = solution_flow_list[0]
     config.SOLUTION_ADJ_FILENAME = solution_adj_list[0]
     if MULTIPOINT_ADJ_NAME in state.FILES and state.FILES[MULTIPOINT_ADJ_NAME][0]:
@@ -616,7 +624,7 @@ def multipoint(func_name, config, state=None, step=1e-2):
     with redirect_folder(folder[0], pull, link) as push:
         with redirect_output(log_direct):
 
-            konfig = copy.deepcopy(config)
+            konfig = config.snapshot()
             ztate = copy.deepcopy(state)
 
             dst = os.getcwd()
@@ -627,118 +635,69 @@ def multipoint(func_name, config, state=None, step=1e-2):
             string_list = string.split()
             subprocess.Popen(string_list)
 
-    for i in range(len(weight_list) - 1):
-
-        konfig = copy.deepcopy(config)
+    # start the other points in the background, from the state after the first
+    pool = None
+    results = {}
+    if n_jobs > 1:
+        # arguments are pickled in the background, pass snapshots
+        konfig = config.snapshot()
         ztate = copy.deepcopy(state)
-        # Reset RESTART_SOL to original value
-        konfig["RESTART_SOL"] = restart_sol
-        # Set correct config option names
-        konfig.SOLUTION_FILENAME = solution_flow_list[i + 1]
-        konfig.SOLUTION_ADJ_FILENAME = solution_adj_list[i + 1]
-
-        # Delete file run in previous case
-        if ADJ_NAME in ztate.FILES:
-            del ztate.FILES[ADJ_NAME]
-
-        # Update ADJOINT filename with MULTIPOINT_ADJOINT filename
-        if (
-            MULTIPOINT_ADJ_NAME in state.FILES
-            and state.FILES[MULTIPOINT_ADJ_NAME][i + 1]
-        ):
-            ztate.FILES[ADJ_NAME] = state.FILES[MULTIPOINT_ADJ_NAME][i + 1]
-
-        if "MULTIPOINT_MESH_FILENAME" in ztate.FILES:
-            if "deform" in ztate.FILES.MESH:
-                ztate.FILES.MESH = su2io.add_suffix(
-                    ztate.FILES.MULTIPOINT_MESH_FILENAME[i + 1], "deform"
-                )
-                konfig.MESH_FILENAME = su2io.add_suffix(
-                    ztate.FILES.MULTIPOINT_MESH_FILENAME[i + 1], "deform"
+        number_part = konfig.get("NUMBER_PART", 0)
+        if number_part > 1:
+            konfig.NUMBER_PART = max(1, number_part // n_jobs)
+        pool = multiprocessing.Pool(n_jobs)
+        for i in range(1, len(weight_list)):
+            results[i] = pool.apply_async(
+                _multipoint_adjoint,
+                (
+                    i,
+                    base_name,
+                    konfig,
+                    ztate,
+                    conditions[i],
+                    solution_flow_list[i],
+                    solution_adj_list[i],
+                    flow_meta_list[i],
+                    restart_sol,
+                    log_direct,
+                ),
+            )
+        pool.close()
+
+    try:
+        for i in range(1, len(weight_list)):
+
+            if pool is None:
+                grads[i], name = _multipoint_adjoint(
+                    i,
+                    base_name,
+                    config,
+                    state,
+                    conditions[i],
+                    solution_flow_list[i],
+                    solution_adj_list[i],
+                    flow_meta_list[i],
+                    restart_sol,
+                    log_direct,
                 )
             else:
-                ztate.FILES.MESH = ztate.FILES.MULTIPOINT_MESH_FILENAME[i + 1]
-                konfig.MESH_FILENAME = ztate.FILES.MULTIPOINT_MESH_FILENAME[i + 1]
+                grads[i], name = results[i].get()
+            solution_adj_list[i] = name
 
-        # use flow.meta file from relevant point
-        if (
-            "MULTIPOINT_FLOW_META" in state.FILES
-            and state.FILES.MULTIPOINT_FLOW_META[i + 1]
-        ):
-            ztate.FILES["FLOW_META"] = state.FILES.MULTIPOINT_FLOW_META[i + 1]
+            # Link adjoint solution to MULTIPOINT_# folder
+            src = os.getcwd()
+            src = os.path.abspath(src).rstrip("/") + "/" + name
+            dst = os.path.abspath(folder[i]).rstrip("/") + "/" + name
 
-        files = ztate.FILES
-        link = []
-        files["DIRECT"] = state.FILES.MULTIPOINT_DIRECT[i + 1]
-
-        # files: mesh
-        name = files["MESH"]
-        name = su2io.expand_part(name, konfig)
-        link.extend(name)
-
-        # files: direct solution
-        if "DIRECT" in files:
-            name = files["DIRECT"]
-            name = su2io.expand_time(name, konfig)
-            link.extend(name)
+            # make unix link
+            string = "ln -s " + src + " " + dst
+            string_list = string.split()
+            subprocess.Popen(string_list)
 
-        # files: adjoint solution
-        if ADJ_NAME in files:
-            name = files[ADJ_NAME]
-            name = su2io.expand_time(name, konfig)
-            link.extend(name)
-        else:
-            konfig["RESTART_SOL"] = "NO"
-
-        # files: meta data of solution
-        if "FLOW_META" in files:
-            pull.append(files["FLOW_META"])
-
-        # pull needed files, start folder
-        with redirect_folder(folder[i + 1], pull, link) as push:
-            with redirect_output(log_direct):
-
-                # Set the multipoint options
-                konfig.AOA = aoa_list[i + 1]
-                konfig.SIDESLIP_ANGLE = sideslip_list[i + 1]
-                konfig.MACH_NUMBER = mach_list[i + 1]
-                konfig.REYNOLDS_NUMBER = reynolds_list[i + 1]
-                konfig.FREESTREAM_TEMPERATURE = freestream_temp_list[i + 1]
-                konfig.FREESTREAM_PRESSURE = freestream_press_list[i + 1]
-                konfig.TARGET_CL = target_cl_list[i + 1]
-
-                # rename meta data to flow.meta
-                if "FLOW_META" in ztate.FILES:
-                    os.rename(ztate.FILES.MULTIPOINT_FLOW_META[i + 1], "flow.meta")
-                    ztate.FILES["FLOW_META"] = "flow.meta"
-
-                # let's start somethin somthin
-                ztate.GRADIENTS.clear()
-
-                # the gradient
-                grads[i + 1] = gradient(base_name, "DISCRETE_ADJOINT", konfig, ztate)
-
-                # rename meta data to multipoint name
-                if os.path.exists("flow.meta"):
-                    os.rename("flow.meta", flow_meta_list[i + 1])
-
-                # adjoint files to push
-                dst = os.getcwd()
-                dst = os.path.abspath(dst).rstrip("/") + "/" + ztate.FILES[ADJ_NAME]
-                name = ztate.FILES[ADJ_NAME]
-                solution_adj_list[i + 1] = name
-                name = su2io.expand_zones(name, konfig)
-                name = su2io.expand_time(name, konfig)
-                push.extend(name)
-
-        # Link adjoint solution to MULTIPOINT_# folder
-        src = os.getcwd()
-        src = os.path.abspath(src).rstrip("/") + "/" + ztate.FILES[ADJ_NAME]
-
-        # make unix link
-        string = "ln -s " + src + " " + dst
-        string_list = string.split()
-        subprocess.Popen(string_list)
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
 
     # Update MULTPOINT_ADJOINT files in state.FILES
     state.FILES[MULTIPOINT_ADJ_NAME] = solution_adj_list
@@ -765,6 +724,134 @@ def multipoint(func_name, config, state=None, step=1e-2):
     return grads_out
 
 
+def _multipoint_adjoint(
+    i_point,
+    base_name,
+    config,
+    state,
+    conditions,
+    solution_flow_filename,
+    solution_adj_filename,
+    flow_meta_name,
+    restart_sol,
+    log_direct,
+):
+    """grad, adj_name = _multipoint_adjoint(i_point,base_name,config,state,conditions,
+                                           solution_flow_filename,solution_adj_filename,
+                                           flow_meta_name,restart_sol,log_direct)
+    evaluates the discrete adjoint gradient of one multipoint point
+    after the first, config and state are not modified
+
+    Executes in:
+        ./MULTIPOINT_#
+
+    Outputs:
+        grad     - list of gradient values of the point
+        adj_name - adjoint solution filename, pushed to the current folder
+    """
+
+    ADJ_NAME = "ADJOINT_" + base_name
+    MULTIPOINT_ADJ_NAME = "MULTIPOINT_" + ADJ_NAME
+    folder = "MULTIPOINT_" + str(i_point)
+
+    konfig = config.snapshot()
+    ztate = copy.deepcopy(state)
+    # Reset RESTART_SOL to original value
+    konfig["RESTART_SOL"] = restart_sol
+    # Set correct config option names
+    konfig.SOLUTION_FILENAME = solution_flow_filename
+    konfig.SOLUTION_ADJ_FILENAME = solution_adj_filename
+
+    # Delete file run in previous case
+    if ADJ_NAME in ztate.FILES:
+        del ztate.FILES[ADJ_NAME]
+
+    # Update ADJOINT filename with MULTIPOINT_ADJOINT filename
+    if MULTIPOINT_ADJ_NAME in state.FILES and state.FILES[MULTIPOINT_ADJ_NAME][i_point]:
+        ztate.FILES[ADJ_NAME] = state.FILES[MULTIPOINT_ADJ_NAME][i_point]
+
+    if "MULTIPOINT_MESH_FILENAME" in ztate.FILES:
+        if "deform" in ztate.FILES.MESH:
+            ztate.FILES.MESH = su2io.add_suffix(
+                ztate.FILES.MULTIPOINT_MESH_FILENAME[i_point], "deform"
+            )
+            konfig.MESH_FILENAME = su2io.add_suffix(
+                ztate.FILES.MULTIPOINT_MESH_FILENAME[i_point], "deform"
+            )
+        else:
+            ztate.FILES.MESH = ztate.FILES.MULTIPOINT_MESH_FILENAME[i_point]
+            konfig.MESH_FILENAME = ztate.FILES.MULTIPOINT_MESH_FILENAME[i_point]
+
+    # use flow.meta file from relevant point
+    if (
+        "MULTIPOINT_FLOW_META" in state.FILES
+        and state.FILES.MULTIPOINT_FLOW_META[i_point]
+    ):
+        ztate.FILES["FLOW_META"] = state.FILES.MULTIPOINT_FLOW_META[i_point]
+
+    files = ztate.FILES
+    link = []
+    pull = []
+    files["DIRECT"] = state.FILES.MULTIPOINT_DIRECT[i_point]
+
+    # files: mesh
+    name = files["MESH"]
+    name = su2io.expand_part(name, konfig)
+    link.extend(name)
+
+    # files: direct solution
+    if "DIRECT" in files:
+        name = files["DIRECT"]
+        name = su2io.expand_time(name, konfig)
+        link.extend(name)
+
+    # files: adjoint solution
+    if ADJ_NAME in files:
+        name = files[ADJ_NAME]
+        name = su2io.expand_time(name, konfig)
+        link.extend(name)
+    else:
+        konfig["RESTART_SOL"] = "NO"
+
+    # files: meta data of solution
+    if "FLOW_META" in files:
+        pull.append(files["FLOW_META"])
+
+    # pull needed files, start folder
+    with redirect_folder(folder, pull, link) as push:
+        with redirect_output(log_direct):
+
+            # Set the multipoint options
+            konfig.update(conditions)
+
+            # rename meta data to flow.meta
+            if "FLOW_META" in ztate.FILES:
+                os.rename(ztate.FILES.MULTIPOINT_FLOW_META[i_point], "flow.meta")
+                ztate.FILES["FLOW_META"] = "flow.meta"
+
+            # let's start somethin somthin
+            ztate.GRADIENTS.clear()
+
+            # the gradient
+            grad = gradient(base_name, "DISCRETE_ADJOINT", konfig, ztate)
+
+            # rename meta data to multipoint name
+            if os.path.exists("flow.meta"):
+                os.rename("flow.meta", flow_meta_name)
+
+            # adjoint files to push
+            name = ztate.FILES[ADJ_NAME]
+            adj_name = name
+            name = su2io.expand_zones(name, konfig)
+            name = su2io.expand_time(name, konfig)
+            push.extend(name)
+
+    return grad, adj_name
+
+
+#: def _multipoint_adjoint()
+
+
 # ----------------------------------------------------------------------
 #  Finite Difference Gradients
 # ----------------------------------------------------------------------
@@ -786,8 +873,16 @@ def findiff(config, state=None):
         Gradient Redundancy if state.GRADIENTS has the key func_name.
         Direct Redundancy if state.FUNCTIONS has key func_name.
 
+    Options:
+        FIN_DIFF_STEP       - step length, default 0.001
+        FIN_DIFF_SCHEME     - FORWARD (default) or CENTRAL
+        FIN_DIFF_JOBS       - number of steps run simultaneously, default 1,
+                              NUMBER_PART is split evenly between the jobs
+        FIN_DIFF_WARM_START - YES to restart each step from the baseline
+                              direct solution (steady problems only)
+
     Executes in:
-        ./FINDIFF
+        ./FINDIFF, and ./FINDIFF/DV_* if FIN_DIFF_JOBS > 1
 
     Inputs:
         config - an SU2 config
@@ -820,13 +915,12 @@ def findiff(config, state=None):
         step = 0.001
 
     opt_names = []
+    coeff_names = su2io.get_fieldsOfType("COEFFICIENT", sort=True)
     for i in range(config["NZONES"]):
-        for key in sorted(su2io.historyOutFields):
-            if su2io.historyOutFields[key]["TYPE"] == "COEFFICIENT":
-                if config["NZONES"] == 1:
-                    opt_names.append(key)
-                else:
-                    opt_names.append(key + "[" + str(i) + "]")
+        if config["NZONES"] == 1:
+            opt_names.extend(coeff_names)
+        else:
+            opt_names.extend([key + "[" + str(i) + "]" for key in coeff_names])
 
     # ----------------------------------------------------
     #  Redundancy Check
@@ -860,7 +954,7 @@ def findiff(config, state=None):
     # ----------------------------------------------------
 
     # local config
-    konfig = copy.deepcopy(config)
+    konfig = config.snapshot()
 
     # check deformation setup
     n_dv = sum(Definition_DV["SIZE"])
@@ -883,6 +977,31 @@ def findiff(config, state=None):
     else:
         step = [step] * n_dv
 
+    # difference scheme
+    scheme = config.get("FIN_DIFF_SCHEME", "FORWARD")
+    if scheme == "FORWARD":
+        signs = [1.0]
+    elif scheme == "CENTRAL":
+        signs = [1.0, -1.0]
+    else:
+        raise Exception("unknown FIN_DIFF_SCHEME %s" % scheme)
+
+    # warm start each step from the baseline solution
+    warm_start = []
+    if (
+        config.get("FIN_DIFF_WARM_START", "NO") == "YES"
+        and config.get("TIME_DOMAIN", "NO") != "YES"
+        and "DIRECT" in state.FILES
+    ):
+        konfig["RESTART_SOL"] = "YES"
+        warm_start = su2io.expand_time(state.FILES["DIRECT"], config)
+        warm_start = [os.path.abspath(name) for name in warm_start]
+
+    # simultaneous jobs, each gets a share of the partitions
+    n_jobs = max(1, min(int(config.get("FIN_DIFF_JOBS", 1)), n_dv * len(signs)))
+    if n_jobs > 1 and konfig.get("NUMBER_PART", 0) > 1:
+        konfig["NUMBER_PART"] = max(1, konfig["NUMBER_PART"] // n_jobs)
+
     # files to pull
     files = state["FILES"]
     pull = []
@@ -918,71 +1037,169 @@ def findiff(config, state=None):
     if "INV_DESIGN_HEATFLUX" in special_cases and "TARGET_HEATFLUX" in files:
         pull.append(files["TARGET_HEATFLUX"])
 
+    # one task per perturbed design
+    tasks = []
+    for i_dv in range(n_dv):
+        for sign in signs:
+            this_dvs = copy.deepcopy(dvs_base)
+            this_dvs[i_dv] = this_dvs[i_dv] + sign * step[i_dv]
+            tasks.append((i_dv, sign, this_dvs))
+
     # output redirection
     with redirect_folder("FINDIFF", pull, link) as push:
-        with redirect_output(log_findiff):
+        with redirect_output(log_findiff), su2util.PlotWriter(
+            grad_filename, output_format
+        ) as grad_plot:
+
+            # run the steps, serially or in per-step subfolders
+            if n_jobs == 1:
+                results = (
+                    _findiff_step(konfig, state.FILES, dvs_base, task, warm_start)
+                    for task in tasks
+                )
+            else:
+                # files are now in ./, relink them into the subfolders
+                sub_pull = [os.path.split(name)[-1] for name in pull]
+                sub_link = [os.path.split(name)[-1] for name in link]
+                pool = multiprocessing.Pool(n_jobs)
+                step_args = [
+                    (
+                        konfig,
+                        state.FILES,
+                        dvs_base,
+                        task,
+                        sub_pull,
+                        sub_link,
+                        log_findiff,
+                    )
+                    for task in tasks
+                ]
+                results = pool.imap(_findiff_substep, step_args)
+
+            # results arrive in task order
+            try:
+                for i_dv in range(n_dv):
+
+                    this_step = step[i_dv]
+                    func_steps = [next(results) for sign in signs]
+
+                    for key in grads.keys():
+                        if key == "VARIABLE" or key == "FINDIFF_STEP":
+                            pass
+                        elif not all([key in func_step for func_step in func_steps]):
+                            del grads[key]
+
+                    # calc finite difference and store
+                    for key in grads.keys():
+                        if key == "VARIABLE":
+                            grads[key].append(i_dv)
+                        elif key == "FINDIFF_STEP":
+                            grads[key].append(this_step)
+                        elif scheme == "CENTRAL":
+                            this_grad = (func_steps[0][key] - func_steps[1][key]) / (
+                                2.0 * this_step
+                            )
+                            grads[key].append(this_grad)
+                        else:
+                            this_grad = (
+                                func_steps[0][key] - func_base[key]
+                            ) / this_step
+                            grads[key].append(this_grad)
+
+                    #: for each grad name
+
+                    grad_plot.write(grads)
+
+                #: for each dv
+
+            finally:
+                if n_jobs > 1:
+                    pool.terminate()
+                    pool.join()
 
-            # iterate each dv
-            for i_dv in range(n_dv):
+    #: with output redirection
 
-                this_step = step[i_dv]
-                temp_config_name = "config_FINDIFF_%i.cfg" % i_dv
+    # remove plot items
+    del grads["VARIABLE"]
+    del grads["FINDIFF_STEP"]
+    state.GRADIENTS.update(grads)
 
-                this_dvs = copy.deepcopy(dvs_base)
-                this_konfig = copy.deepcopy(konfig)
-                this_dvs[i_dv] = this_dvs[i_dv] + this_step
+    # return results
+    grads = copy.deepcopy(grads)
+    return grads
 
-                this_state = su2io.State()
-                this_state.FILES = copy.deepcopy(state.FILES)
-                this_konfig.unpack_dvs(this_dvs, dvs_base)
 
-                this_konfig.dump(temp_config_name)
+#: def findiff()
 
-                # Direct Solution, findiff step
-                func_step = function("ALL", this_konfig, this_state)
 
-                # remove deform step files
-                meshfiles = this_state.FILES.MESH
-                meshfiles = su2io.expand_part(meshfiles, this_konfig)
-                for name in meshfiles:
-                    os.remove(name)
+def _findiff_step(konfig, files, dvs_base, task, warm_start=[]):
+    """func_step = _findiff_step(konfig,files,dvs_base,task,warm_start=[])
+    runs deformation and direct solution of one finite
+    difference step in the current folder
 
-                for key in grads.keys():
-                    if key == "VARIABLE" or key == "FINDIFF_STEP":
-                        pass
-                    elif not key in func_step:
-                        del grads[key]
+    Inputs:
+        konfig     - findiff config, not modified
+        files      - baseline state files
+        dvs_base   - baseline design vector
+        task       - tuple of (i_dv, sign, perturbed design vector)
+        warm_start - baseline solution files to link first, the
+                     previous step in the folder replaced them
+    """
 
-                # calc finite difference and store
-                for key in grads.keys():
-                    if key == "VARIABLE":
-                        grads[key].append(i_dv)
-                    elif key == "FINDIFF_STEP":
-                        grads[key].append(this_step)
-                    else:
-                        this_grad = (func_step[key] - func_base[key]) / this_step
-                        grads[key].append(this_grad)
+    i_dv, sign, this_dvs = task
 
-                #: for each grad name
+    for name in warm_start:
+        su2io.make_link(name, os.path.abspath(os.path.split(name)[-1]))
+    temp_config_name = "config_FINDIFF_%i.cfg" % i_dv
+    if sign < 0.0:
+        temp_config_name = "config_FINDIFF_%i_m.cfg" % i_dv
 
-                su2util.write_plot(grad_filename, output_format, grads)
-                os.remove(temp_config_name)
+    this_konfig = konfig.snapshot()
 
-            #: for each dv
+    this_state = su2io.State()
+    this_state.FILES = copy.deepcopy(files)
+    this_konfig.unpack_dvs(this_dvs, dvs_base)
 
-    #: with output redirection
+    this_konfig.dump(temp_config_name)
 
-    # remove plot items
-    del grads["VARIABLE"]
-    del grads["FINDIFF_STEP"]
-    state.GRADIENTS.update(grads)
+    # Direct Solution, findiff step
+    func_step = function("ALL", this_konfig, this_state)
 
-    # return results
-    grads = copy.deepcopy(grads)
-    return grads
+    # remove deform step files
+    meshfiles = this_state.FILES.MESH
+    meshfiles = su2io.expand_part(meshfiles, this_konfig)
+    for name in meshfiles:
+        os.remove(name)
 
+    os.remove(temp_config_name)
 
-#: def findiff()
+    return func_step
+
+
+#: def _findiff_step()
+
+
+def _findiff_substep(args):
+    """func_step = _findiff_substep(args)
+    pool worker, runs _findiff_step() in the subfolder
+    ./DV_<i_dv> or ./DV_<i_dv>_m for negative steps
+    """
+
+    konfig, files, dvs_base, task, pull, link, log_findiff = args
+    i_dv, sign, this_dvs = task
+
+    folder = "DV_%i" % i_dv
+    if sign < 0.0:
+        folder = "DV_%i_m" % i_dv
+
+    with redirect_folder(folder, pull, link):
+        with redirect_output(log_findiff):
+            func_step = _findiff_step(konfig, files, dvs_base, task)
+
+    return func_step
+
+
+#: def _findiff_substep()
 
 
 # ----------------------------------------------------------------------
@@ -1144,10 +1361,7 @@ def directdiff(config, state=None):
     # ----------------------------------------------------
 
     # master redundancy check
-    opt_names = []
-    for key in sorted(su2io.historyOutFields):
-        if su2io.historyOutFields[key]["TYPE"] == "COEFFICIENT":
-            opt_names.append(key)
+    opt_names = su2io.get_fieldsOfType("COEFFICIENT", sort=True)
 
     directdiff_todo = all([key in state.GRADIENTS for key in opt_names])
     if directdiff_todo:
@@ -1169,7 +1383,7 @@ def directdiff(config, state=None):
     # ----------------------------------------------------
 
     # local config
-    konfig = copy.deepcopy(config)
+    konfig = config.snapshot()
 
     n_dv = sum(Definition_DV["SIZE"])
 
@@ -1212,14 +1426,16 @@ def directdiff(config, state=None):
 
     # output redirection
     with redirect_folder("DIRECTDIFF", pull, link) as push:
-        with redirect_output(log_directdiff):
+        with redirect_output(log_directdiff), su2util.PlotWriter(
+            grad_filename, output_format
+        ) as grad_plot:
 
             # iterate each dv
             for i_dv in range(n_dv):
 
                 temp_config_name = "config_DIRECTDIFF_%i.cfg" % i_dv
 
-                this_konfig = copy.deepcopy(konfig)
+                this_konfig = konfig.snapshot()
 
                 this_dvs = [0.0] * n_dv
                 this_dvs[i_dv] = 1.0
@@ -1250,7 +1466,7 @@ def directdiff(config, state=None):
                         grads[key].append(this_grad)
                 #: for each grad name
 
-                su2util.write_plot(grad_filename, output_format, grads)
+                grad_plot.write(grads)
                 os.remove(temp_config_name)
 
             #: for each dv
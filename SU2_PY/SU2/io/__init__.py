@@ -5,7 +5,11 @@ from .redirect import output as redirect_output
 from .redirect import folder as redirect_folder
 from .data import load_data, save_data
 from .filelock import filelock
+from .history import HistoryReader
+from .journal import Journal
+from .restart import RestartFile
 
 from .config import Config
 from .state import State_Factory as State
-from .historyMap import history_header_map as historyOutFields
+from .tools import historyOutFields
+from .cache import ResultCache
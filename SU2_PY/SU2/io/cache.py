@@ -0,0 +1,358 @@
+#!/usr/bin/env python
+
+## \file cache.py
+#  \brief content addressed cache of design evaluation results
+#  \version 8.0.1 "Harrier"
+#
+# SU2 Project Website: https://su2code.github.io
+#
+# The SU2 Project is maintained by the SU2 Foundation
+# (http://su2foundation.org)
+#
+# Copyright 2012-2024, SU2 Contributors (cf. AUTHORS.md)
+#
+# SU2 is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# SU2 is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with SU2. If not, see <http://www.gnu.org/licenses/>.
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import os, sys, json, hashlib
+
+if sys.version_info[0] > 2:
+    import pickle
+else:
+    import cPickle as pickle
+
+from ..util import ordered_bunch
+from .filelock import filelock
+from .state import State_Factory as State
+
+# config options that only name or format outputs, or that are changed
+# by the evaluation chain itself, they do not change the results
+output_keys = [
+    "MESH_FILENAME",
+    "MESH_OUT_FILENAME",
+    "SOLUTION_FILENAME",
+    "SOLUTION_ADJ_FILENAME",
+    "RESTART_FILENAME",
+    "RESTART_ADJ_FILENAME",
+    "VOLUME_FILENAME",
+    "VOLUME_ADJ_FILENAME",
+    "SURFACE_FILENAME",
+    "SURFACE_ADJ_FILENAME",
+    "CONV_FILENAME",
+    "BREAKDOWN_FILENAME",
+    "GRAD_OBJFUNC_FILENAME",
+    "VALUE_OBJFUNC_FILENAME",
+    "OUTPUT_FILES",
+    "OUTPUT_WRT_FREQ",
+    "HISTORY_OUTPUT",
+    "SCREEN_OUTPUT",
+    "TABULAR_FORMAT",
+    "CONSOLE",
+    "NUMBER_PART",
+    "AVAILABLE_PROC",
+    "FIN_DIFF_JOBS",
+    "MULTIPOINT_JOBS",
+    "RESTART_SOL",
+    "OBJECTIVE_FUNCTION",
+    "OBJECTIVE_WEIGHT",
+    "OPT_COMBINE_OBJECTIVE",
+    "OPT_ITERATIONS",
+    "OPT_ACCURACY",
+    "OPT_RELAX_FACTOR",
+    "OPT_LINE_SEARCH_BOUND",
+    "OPT_BOUND_UPPER",
+    "OPT_BOUND_LOWER",
+    "DV_VALUE_OLD",
+    "DV_VALUE_NEW",
+    "RESULT_CACHE",
+    "RESULT_CACHE_SIZE",
+    "MERGE_ENGINE",
+]
+
+# mesh hashes, by real path, size and modification time
+_mesh_hashes = {}
+
+# -------------------------------------------------------------------
+#  Result Cache Class
+# -------------------------------------------------------------------
+
+
+class ResultCache(object):
+    """cache = SU2.io.ResultCache(folder,max_size=100.0)
+
+    On-disk cache of design evaluation results, shared by all
+    projects pointing to the same folder. Entries are addressed by
+    a hash of the mesh file, the config without its output-only
+    options (see SU2.io.cache.output_keys) and the design vector.
+    Each entry holds the functions and gradients of a design and
+    pointers to its solution files.
+
+    Example:
+    cache = SU2.io.ResultCache.from_config(config)
+    key = cache.load(config, state)   # fills state from the cache
+    # evaluate, the redundancy checks skip what was found
+    cache.store(key, config, state)   # files the new results
+
+    Inputs:
+        folder   - cache folder, None disables the cache
+        max_size - size limit in MB, least recently used
+                   entries are evicted beyond it
+
+    Notes:
+        Functions and solution file pointers are only restored
+        while the solution files still exist.
+        All folder updates hold a file lock on the cache folder.
+    """
+
+    def __init__(self, folder, max_size=100.0):
+        if folder is not None:
+            folder = os.path.abspath(folder)
+        self.folder = folder
+        self.max_size = float(max_size)
+
+    @staticmethod
+    def from_config(config):
+        """cache = SU2.io.ResultCache.from_config(config)
+        cache set up by the config options RESULT_CACHE and
+        RESULT_CACHE_SIZE, disabled if RESULT_CACHE is NONE
+        """
+        folder = config.get("RESULT_CACHE", "NONE")
+        if folder == "NONE":
+            folder = None
+        max_size = config.get("RESULT_CACHE_SIZE", 100.0)
+        return ResultCache(folder, max_size)
+
+    def key(self, config):
+        """key = SU2.io.ResultCache.key(config)
+        hash of the mesh, the normalized config and the design vector,
+        None if the mesh file does not exist
+        """
+
+        mesh_hash = get_meshHash(config["MESH_FILENAME"])
+        if mesh_hash is None:
+            return None
+
+        settings = ordered_bunch()
+        for key, value in config.items():
+            if not key in output_keys:
+                settings[key] = value
+
+        dv_values = [
+            [float(v) for v in config.get("DV_VALUE_OLD", [])],
+            [float(v) for v in config.get("DV_VALUE_NEW", [])],
+        ]
+
+        content = hashlib.sha1()
+        content.update(mesh_hash.encode())
+        content.update(json.dumps(settings, sort_keys=True, default=repr).encode())
+        content.update(json.dumps(dv_values).encode())
+
+        return content.hexdigest()
+
+    def load(self, config, state):
+        """key = SU2.io.ResultCache.load(config,state)
+        fills state with the cached results of the design,
+        returns the key to store the new results with
+
+        Updates:
+            state.GRADIENTS
+            state.FUNCTIONS, state.FILES if the solution files exist
+            config.MESH_FILENAME, config.DV_VALUE_OLD if the cached
+            deformed mesh is used
+        """
+
+        if self.folder is None:
+            return None
+
+        key = self.key(config)
+        if key is None:
+            return None
+
+        self._make_folders()
+        with filelock(self._path("cache")):
+            entry_name = self._entry_name(key, config, state)
+            entry = self._read(entry_name)
+            if entry is None:
+                return key
+            os.utime(self._path("entries", entry_name))
+
+        state._cache_entry = (entry_name, list(config["DV_VALUE_NEW"]))
+
+        # nested items do not touch the state timestamp
+        for name, grad in entry.GRADIENTS.items():
+            if not name in state.GRADIENTS:
+                state.GRADIENTS[name] = grad
+                state.set_timestamp()
+
+        # functions are only of use with the files they came from
+        ztate = State()
+        ztate.FILES.update(entry.FILES)
+        pull, link = ztate.pullnlink(config)
+        if not all([os.path.exists(name) for name in pull + link if name]):
+            return key
+
+        for name, func in entry.FUNCTIONS.items():
+            if not name in state.FUNCTIONS:
+                state.FUNCTIONS[name] = func
+                state.set_timestamp()
+
+        for label, filename in entry.FILES.items():
+            if label == "MESH":
+                continue
+            if not label in state.FILES:
+                state.FILES[label] = filename
+                state.set_timestamp()
+
+        # deformed mesh, as SU2.run.deform() would leave it
+        deform_todo = not config["DV_VALUE_NEW"] == config["DV_VALUE_OLD"]
+        if "MESH" in entry.FILES and deform_todo:
+            state.FILES.MESH = entry.FILES.MESH
+            state.set_timestamp()
+            config.MESH_FILENAME = os.path.basename(entry.FILES.MESH)
+            config.DV_VALUE_OLD = list(config["DV_VALUE_NEW"])
+
+        return key
+
+    def store(self, key, config, state):
+        """SU2.io.ResultCache.store(key,config,state)
+        files the results of state under key, and under the key of
+        the current config, which changes once the mesh is deformed
+        """
+
+        if self.folder is None or key is None:
+            return
+
+        keys = [key, self.key(config)]
+
+        self._make_folders()
+        with filelock(self._path("cache")):
+            entry_name = self._entry_name(key, config, state)
+            entry = self._read(entry_name)
+            if entry is None:
+                entry = ordered_bunch()
+                for name in ["FUNCTIONS", "GRADIENTS", "FILES"]:
+                    entry[name] = ordered_bunch()
+
+            entry.FUNCTIONS.update(state.FUNCTIONS)
+            entry.GRADIENTS.update(state.GRADIENTS)
+            for label, filename in state.FILES.items():
+                if isinstance(filename, list):
+                    filename = [os.path.abspath(f) if f else f for f in filename]
+                else:
+                    filename = os.path.abspath(filename)
+                entry.FILES[label] = filename
+
+            self._write(entry_name, entry)
+            for this_key in keys:
+                if this_key is not None:
+                    self._link(this_key, entry_name)
+
+            self.evict()
+
+        state._cache_entry = (entry_name, list(config["DV_VALUE_NEW"]))
+
+    def evict(self):
+        """SU2.io.ResultCache.evict()
+        removes the least recently used entries until the
+        cache fits max_size, and the keys of removed entries,
+        call with the cache folder locked
+        """
+
+        entries = []
+        total = 0
+        for name in os.listdir(self._path("entries")):
+            stat = os.stat(self._path("entries", name))
+            entries.append((stat.st_mtime, stat.st_size, name))
+            total += stat.st_size
+
+        if total <= self.max_size * 1e6:
+            return
+
+        entries.sort()
+        while entries and total > self.max_size * 1e6:
+            mtime, size, name = entries.pop(0)
+            os.remove(self._path("entries", name))
+            total -= size
+
+        kept = set([name for mtime, size, name in entries])
+        for this_key in os.listdir(self._path("keys")):
+            with open(self._path("keys", this_key)) as key_file:
+                if not key_file.read().strip() in kept:
+                    os.remove(self._path("keys", this_key))
+
+    def _make_folders(self):
+        for name in ["entries", "keys"]:
+            if not os.path.exists(self._path(name)):
+                os.makedirs(self._path(name), exist_ok=True)
+
+    def _entry_name(self, key, config, state):
+        # a design keeps its entry while its mesh gets deformed
+        cache_entry = getattr(state, "_cache_entry", None)
+        if cache_entry is not None and cache_entry[1] == config["DV_VALUE_NEW"]:
+            return cache_entry[0]
+        key_name = self._path("keys", key)
+        if os.path.exists(key_name):
+            with open(key_name) as key_file:
+                return key_file.read().strip()
+        return key
+
+    def _read(self, entry_name):
+        entry_name = self._path("entries", entry_name)
+        if not os.path.exists(entry_name):
+            return None
+        with open(entry_name, "rb") as entry_file:
+            return pickle.load(entry_file)
+
+    def _write(self, entry_name, entry):
+        entry_name = self._path("entries", entry_name)
+        with open(entry_name + ".tmp", "wb") as entry_file:
+            pickle.dump(entry, entry_file, -1)
+        os.replace(entry_name + ".tmp", entry_name)
+
+    def _link(self, key, entry_name):
+        with open(self._path("keys", key), "w") as key_file:
+            key_file.write(entry_name)
+
+    def _path(self, *names):
+        return os.path.join(self.folder, *names)
+
+    def __repr__(self):
+        return "<ResultCache> %s" % self.folder
+
+
+#: class ResultCache
+
+
+def get_meshHash(mesh_name):
+    """mesh_hash = SU2.io.cache.get_meshHash(mesh_name)
+    sha1 hash of a mesh file, remembered while the file
+    is unchanged, None if the file does not exist
+    """
+
+    if not os.path.exists(mesh_name):
+        return None
+
+    stat = os.stat(mesh_name)
+    mesh_id = (os.path.realpath(mesh_name), stat.st_size, stat.st_mtime)
+    if not mesh_id in _mesh_hashes:
+        content = hashlib.sha1()
+        with open(mesh_name, "rb") as mesh_file:
+            for block in iter(lambda: mesh_file.read(1 << 20), b""):
+                content.update(block)
+        _mesh_hashes[mesh_id] = content.hexdigest()
+
+    return _mesh_hashes[mesh_id]
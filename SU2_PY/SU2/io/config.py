@@ -29,11 +29,11 @@
 #  Imports
 # ----------------------------------------------------------------------
 
-import os, sys, shutil, copy
-from .historyMap import history_header_map as historyOutFields
+import os, sys, copy
 import numpy as np
-from ..util import ordered_bunch, switch
+from ..util import ordered_bunch
 from .tools import *
+from .tools import historyOutFields
 from .config_options import *
 
 from ..util.ordered_dict import OrderedDict
@@ -67,12 +67,29 @@ class Config(ordered_bunch):
         write()      - write to a config file (requires existing file)
         dump()       - dump a raw config file
         unpack_dvs() - unpack a design vector
+        dv_layout()  - offsets and scales of the design vector
         diff()       - returns the difference from another config
         dist()       - computes the distance from another config
+        snapshot()   - cheap copy, see below
+
+    Snapshots:
+        konfig = config.snapshot() replaces copy.deepcopy(config).
+        Both configs become layers over a frozen parent holding the
+        current parameters, and only store the parameters set or
+        read afterwards. Mutable values (lists, dicts) are copied
+        from the parent on first access, so they can be modified
+        in place. Values taken from the config before a snapshot
+        must not be modified in place after it.
+        Pickling writes a plain config without layers.
     """
 
     _filename = "config.cfg"
 
+    # copy-on-write layers, see snapshot()
+    _parent = None
+    _deleted = None
+    _depth = 0
+
     def __init__(self, *args, **kwarg):
 
         # look for filename in inputs
@@ -162,10 +179,154 @@ class Config(ordered_bunch):
             raise AttributeError("Config parameter not found")
 
     def __getitem__(self, k):
+        if self._parent is None or dict.__contains__(self, k):
+            try:
+                return super(Config, self).__getitem__(k)
+            except KeyError:
+                raise KeyError("Config parameter not found: %s" % k)
         try:
-            return super(Config, self).__getitem__(k)
+            value = self._lookup(k)
         except KeyError:
             raise KeyError("Config parameter not found: %s" % k)
+        # copy on write, the parent layer is shared
+        if not isinstance(value, (str, int, float, type(None))):
+            value = copy.deepcopy(value)
+            self._set_layer(k, value)
+        return value
+
+    def __setitem__(self, k, v):
+        if self._parent is None:
+            return super(Config, self).__setitem__(k, v)
+        self._deleted.discard(k)
+        self._set_layer(k, v)
+
+    def __delitem__(self, k):
+        if self._parent is None:
+            return super(Config, self).__delitem__(k)
+        if not self._has(k):
+            raise KeyError("Config parameter not found: %s" % k)
+        if dict.__contains__(self, k):
+            super(Config, self).__delitem__(k)
+        if self._parent._has(k):
+            self._deleted.add(k)
+
+    def __contains__(self, k):
+        if self._parent is None:
+            return super(Config, self).__contains__(k)
+        try:
+            return hasattr(Config, k) or self._has(k)
+        except:
+            return False
+
+    def __iter__(self):
+        if self._parent is None:
+            return super(Config, self).__iter__()
+        return self._iter_layers()
+
+    def __reversed__(self):
+        if self._parent is None:
+            return super(Config, self).__reversed__()
+        return reversed(list(self._iter_layers()))
+
+    def __len__(self):
+        if self._parent is None:
+            return super(Config, self).__len__()
+        return len(list(self._iter_layers()))
+
+    def get(self, k, default=None):
+        if self._parent is None:
+            return super(Config, self).get(k, default)
+        try:
+            return self[k]
+        except KeyError:
+            return default
+
+    def clear(self):
+        self._parent = None
+        self._deleted = None
+        self._depth = 0
+        super(Config, self).clear()
+
+    def snapshot(self):
+        """konfig = config.snapshot()
+        returns a copy of the config, sharing a frozen parent
+        layer with it, see help(SU2.io.Config)
+        """
+        if self._parent is None or dict.__len__(self) or self._deleted:
+            self._freeze()
+        konfig = Config()
+        konfig._parent = self._parent
+        konfig._deleted = set()
+        konfig._depth = self._depth
+        konfig._filename = self._filename
+        return konfig
+
+    def _freeze(self):
+        # moves the parameters of this layer to a new parent layer
+        parent = Config()
+        for key in super(Config, self).__iter__():
+            super(Config, parent).__setitem__(key, dict.__getitem__(self, key))
+        parent._parent = self._parent
+        parent._deleted = self._deleted
+        parent._depth = self._depth
+        parent._filename = self._filename
+
+        # bound the lookup chains
+        if parent._depth > 8:
+            flat = Config()
+            for key, value in parent._pairs():
+                flat[key] = value
+            flat._filename = self._filename
+            parent = flat
+
+        super(Config, self).clear()
+
+        self._parent = parent
+        self._deleted = set()
+        self._depth = parent._depth + 1
+
+    def _set_layer(self, k, v):
+        # sets k in this layer only
+        super(Config, self).__setitem__(k, v)
+
+    def _lookup(self, k):
+        # value of k in the first layer that has it, without copying
+        layer = self
+        while layer is not None:
+            if dict.__contains__(layer, k):
+                return dict.__getitem__(layer, k)
+            if layer._deleted and k in layer._deleted:
+                break
+            layer = layer._parent
+        raise KeyError(k)
+
+    def _has(self, k):
+        try:
+            self._lookup(k)
+        except KeyError:
+            return False
+        return True
+
+    def _iter_layers(self):
+        deleted = self._deleted
+        for key in self._parent:
+            if not key in deleted:
+                yield key
+        for key in super(Config, self).__iter__():
+            if not self._parent._has(key):
+                yield key
+
+    def _pairs(self):
+        # (key, value) pairs without copying, for reading only
+        return [(key, self._lookup(key)) for key in self]
+
+    def __reduce__(self):
+        # pickles as a plain config
+        items = [[key, value] for key, value in self._pairs()]
+        inst_dict = vars(self).copy()
+        for key in list(vars(OrderedDict())) + ["_parent", "_deleted", "_depth"]:
+            inst_dict.pop(key, None)
+        return (self.__class__, (items,), inst_dict)
 
     def unpack_dvs(self, dv_new, dv_old=None):
         """updates config with design variable vectors
@@ -184,30 +345,20 @@ class Config(ordered_bunch):
 
         """
 
-        dv_new = copy.deepcopy(dv_new)
-        dv_old = copy.deepcopy(dv_old)
-
         # handle unpacking cases
         def_dv = self["DEFINITION_DV"]
+        layout = self.dv_layout()
 
-        n_dv = sum(def_dv["SIZE"])
-
-        if not dv_old:
-            dv_old = [0.0] * n_dv
-        assert len(dv_new) == len(dv_old), "unexpected design vector length"
+        if dv_old is None or len(dv_old) == 0:
+            dv_old = np.zeros(layout.n_dv)
+        assert np.size(dv_new) == np.size(dv_old), "unexpected design vector length"
 
         # handle param
         param_dv = self["DV_PARAM"]
 
         # apply scale
-        dv_scales = def_dv["SCALE"]
-
-        k = 0
-        for i, dv_scl in enumerate(dv_scales):
-            for j in range(def_dv["SIZE"][i]):
-                dv_new[k] = dv_new[k] * dv_scl
-                dv_old[k] = dv_old[k] * dv_scl
-                k = k + 1
+        dv_new = layout.scale(dv_new).tolist()
+        dv_old = layout.scale(dv_old).tolist()
 
         # Change the parameters of the design variables
 
@@ -218,8 +369,21 @@ class Config(ordered_bunch):
 
         self.update({"DV_VALUE_OLD": dv_old, "DV_VALUE_NEW": dv_new})
 
+    def dv_layout(self):
+        """layout = config.dv_layout()
+        layout of the design vector defined by DEFINITION_DV,
+        see SU2.io.config.DVLayout
+        """
+        return get_dvLayout(self._peek("DEFINITION_DV"))
+
     def __eq__(self, konfig):
-        return super(Config, self).__eq__(konfig)
+        if self._parent is None and getattr(konfig, "_parent", None) is None:
+            return super(Config, self).__eq__(konfig)
+        if isinstance(konfig, Config):
+            return self._pairs() == konfig._pairs()
+        if isinstance(konfig, OrderedDict):
+            return self._pairs() == list(konfig.items())
+        return dict(self._pairs()) == konfig
 
     def __ne__(self, konfig):
         return super(Config, self).__ne__(konfig)
@@ -246,19 +410,37 @@ class Config(ordered_bunch):
         """
 
         keys = set([])
-        keys.update(self.keys())
-        keys.update(konfig.keys())
+        if self._parent is not None and (
+            konfig is self._parent or getattr(konfig, "_parent", None) is self._parent
+        ):
+            # layers over the same parent only differ in their own keys
+            for layer in [self, konfig]:
+                if layer is not self._parent:
+                    keys.update(dict.keys(layer))
+                    keys.update(layer._deleted)
+        else:
+            keys.update(self.keys())
+            keys.update(konfig.keys())
 
         konfig_diff = Config()
 
         for key in keys:
-            value1 = self.get(key, None)
-            value2 = konfig.get(key, None)
+            value1 = self._peek(key)
+            value2 = (
+                konfig._peek(key) if isinstance(konfig, Config) else konfig.get(key)
+            )
             if not value1 == value2:
-                konfig_diff[key] = [value1, value2]
+                konfig_diff[key] = copy.deepcopy([value1, value2])
 
         return konfig_diff
 
+    def _peek(self, k, default=None):
+        # value of k without copying, for reading only
+        try:
+            return self._lookup(k)
+        except KeyError:
+            return default
+
     def dist(self, konfig, keys_check="ALL"):
         """calculates a distance to another config
 
@@ -317,6 +499,246 @@ class Config(ordered_bunch):
 #: class Config
 
 
+# -------------------------------------------------------------------
+#  Design Vector Layout
+# -------------------------------------------------------------------
+
+# layouts of the design vector, by DEFINITION_DV sizes and scales
+_dv_layouts = {}
+
+
+class DVLayout(object):
+    """layout = SU2.io.config.DVLayout(sizes,scales)
+
+    Layout of a design vector, the concatenation of the values
+    of each DEFINITION_DV entry. Layouts are shared between
+    configs, see get_dvLayout(), their arrays are read-only.
+
+    Attributes:
+        sizes   - number of values of each DEFINITION_DV entry
+        offsets - position of the first value of each entry,
+                  with the design vector length appended
+        scales  - scale of each value of the design vector
+        n_dv    - design vector length
+
+    Methods:
+        scale(dvs)                  - scaled values, ie DV_VALUE_NEW
+        unscale(values)             - values divided by their scales
+        scale_gradient(grad,factor) - grad * factor / scales
+        split(values)               - views of the values of each entry
+    """
+
+    def __init__(self, sizes, scales):
+        sizes = np.array(sizes, dtype=int)
+        offsets = np.zeros(len(sizes) + 1, dtype=int)
+        np.cumsum(sizes, out=offsets[1:])
+        scales = np.repeat(np.array(scales, dtype=float), sizes)
+
+        for array in [sizes, offsets, scales]:
+            array.flags.writeable = False
+
+        self.sizes = sizes
+        self.offsets = offsets
+        self.scales = scales
+        self.n_dv = int(offsets[-1])
+
+    def scale(self, dvs):
+        return np.ravel(dvs) * self.scales
+
+    def unscale(self, values):
+        return np.ravel(values) / self.scales
+
+    def scale_gradient(self, grad, factor=1.0):
+        return np.ravel(grad) * factor / self.scales
+
+    def split(self, values):
+        return np.split(np.ravel(values), self.offsets[1:-1])
+
+    def __len__(self):
+        return self.n_dv
+
+    def __repr__(self):
+        return "<DVLayout> %i entries, %i values" % (len(self.sizes), self.n_dv)
+
+
+#: class DVLayout
+
+
+def get_dvLayout(def_dv):
+    """layout = SU2.io.config.get_dvLayout(def_dv)
+    returns the design vector layout of a DEFINITION_DV,
+    built once for each combination of sizes and scales
+    """
+
+    if not def_dv:
+        def_dv = {"SIZE": [], "SCALE": []}
+
+    layout_id = (tuple(def_dv["SIZE"]), tuple(def_dv["SCALE"]))
+    if not layout_id in _dv_layouts:
+        _dv_layouts[layout_id] = DVLayout(*layout_id)
+
+    return _dv_layouts[layout_id]
+
+
+# -------------------------------------------------------------------
+#  Config File Parse Tree
+# -------------------------------------------------------------------
+
+# parse trees of config files, by absolute path, see get_configTree()
+_config_trees = {}
+
+
+class ConfigTree(object):
+    """tree = SU2.io.config.ConfigTree(filename)
+
+    Parse tree of a config file, keeps the original lines
+    so the file can be updated without losing its formatting.
+
+    Attributes:
+        filename - config file name
+        lines    - raw lines of the file, with line returns
+        params   - ordered dict of parameter names to the
+                   (first line, last line, raw value) of their statement
+        values   - ordered dict of typed parameter values as read
+        data     - values with the defaults of read_config()
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        with open(filename) as config_file:
+            self.lines = config_file.readlines()
+        self.params = OrderedDict()
+        self.data = OrderedDict()
+        self.parse()
+
+    def parse(self):
+        """splits the lines into statements and converts their values"""
+
+        lines = self.lines
+        params = self.params
+        data_dict = self.data
+
+        i_line = 0
+        while i_line < len(lines):
+            i_first = i_line
+
+            # remove line returns
+            line = lines[i_line].strip("\r\n").strip()
+            i_line += 1
+
+            # make sure it has useful data
+            if len(line) == 0 or line[0] == "%":
+                continue
+
+            # --- Check if there is a line continuation character at the
+            # end of the current line or somewhere in between (the rest is ignored then).
+            # If yes, read until there is a line without one or an empty line.
+            # If there is a statement after a cont. char
+            # throw an error. ---*/
+
+            while "\\" in line:
+                tmp_line = lines[i_line].strip() if i_line < len(lines) else ""
+                i_line += 1
+                assert len(tmp_line.split("=")) <= 1, (
+                    "Statement found after line "
+                    "continuation character in config file %s" % tmp_line
+                )
+                if not tmp_line.startswith("%"):
+                    line = line.split("\\")[0]
+                    line += " " + tmp_line
+
+            # split across equals sign
+            line = line.split("=", 1)
+            this_param = line[0].strip()
+            this_value = line[1].strip()
+
+            assert this_param not in data_dict, (
+                "Config file has multiple specifications of %s" % this_param
+            )
+
+            params[this_param] = (i_first, min(i_line, len(lines)) - 1, this_value)
+
+            reader = config_readers.get(this_param, read_string)
+            data_dict[this_param] = reader(this_value, data_dict, self.filename)
+
+        #: for line
+
+        # values as read, before defaults fill in
+        self.values = copy.deepcopy(data_dict)
+
+        set_defaults(data_dict)
+
+    def update(self, param_dict):
+        """text = SU2.io.config.ConfigTree.update(param_dict)
+        returns the text of the file with the parameters of param_dict,
+        statements whose value did not change keep their formatting
+        """
+
+        lines = self.lines
+
+        output = []
+        written = set()
+        i_line = 0
+        for this_param, (i_first, i_last, old_value) in self.params.items():
+
+            # lines up to the statement
+            output.extend(lines[i_line:i_first])
+            i_line = i_last + 1
+
+            # skip if parameter unwanted or unchanged
+            if this_param not in param_dict:
+                output.extend(lines[i_first:i_line])
+                continue
+            written.add(this_param)
+            new_value = get_value(param_dict, this_param)
+            if same_value(new_value, self.values[this_param]):
+                output.extend(lines[i_first:i_line])
+                continue
+
+            output.append(
+                "%s= %s\n" % (this_param, format_value(this_param, new_value))
+            )
+
+        #: for each statement
+
+        output.extend(lines[i_line:])
+
+        # check that all params were used
+        for this_param in param_dict.keys():
+            if not this_param in written and not this_param in ["JOB_NUMBER"]:
+                print(
+                    "Warning: Parameter %s not found in config file and was not written"
+                    % (this_param)
+                )
+
+        return "".join(output)
+
+    def __repr__(self):
+        return "<ConfigTree> %s, %i parameters" % (self.filename, len(self.params))
+
+
+#: class ConfigTree
+
+
+def get_configTree(filename):
+    """tree = SU2.io.config.get_configTree(filename)
+    returns the parse tree of a config file, parsed once
+    and reused while the file is unchanged
+    """
+
+    path = os.path.abspath(filename)
+    stat = os.stat(path)
+    file_id = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    if path in _config_trees and _config_trees[path][0] == file_id:
+        return _config_trees[path][1]
+
+    tree = ConfigTree(filename)
+    _config_trees[path] = (file_id, tree)
+
+    return tree
+
+
 # -------------------------------------------------------------------
 #  Get SU2 Configuration Parameters
 # -------------------------------------------------------------------
@@ -325,396 +747,356 @@ class Config(ordered_bunch):
 def read_config(filename):
     """reads a config file"""
 
-    # initialize output dictionary
-    data_dict = OrderedDict()
+    return copy.deepcopy(get_configTree(filename).data)
 
-    input_file = open(filename)
 
-    # process each line
-    while 1:
-        # read the line
-        line = input_file.readline()
-        if not line:
-            break
+#: def read_config()
 
-        # remove line returns
-        line = line.strip("\r\n").strip()
 
-        if len(line) == 0:
-            continue
-        # make sure it has useful data
-        if line[0] == "%":
-            continue
+# comma delimited lists of strings with or without paren's
+def read_markers(this_value, data_dict, filename):
+    # remove white space
+    this_value = "".join(this_value.split())
+    # remove parens
+    this_value = this_value.strip("()")
+    # split by comma
+    return this_value.split(",")
+
+
+# semicolon delimited lists of comma delimited lists of floats
+def read_dvParam(this_value, data_dict, filename):
+    # remove white space
+    info_General = "".join(this_value.split())
+    # split by semicolon
+    info_General = info_General.split(";")
+    # build list of dv params, convert string to float
+    dv_Parameters = []
+    dv_FFDTag = []
+    dv_Size = []
+
+    for this_dvParam in info_General:
+        this_dvParam = this_dvParam.strip("()")
+        this_dvParam = this_dvParam.split(",")
+        this_dvSize = 1
+
+        # if FFD change the first element to work with numbers and float(x)
+        if data_dict["DV_KIND"][0] in [
+            "FFD_SETTING",
+            "FFD_ANGLE_OF_ATTACK",
+            "FFD_CONTROL_POINT",
+            "FFD_NACELLE",
+            "FFD_GULL",
+            "FFD_TWIST",
+            "FFD_ROTATION",
+            "FFD_CAMBER",
+            "FFD_THICKNESS",
+            "FFD_CONTROL_POINT_2D",
+            "FFD_CAMBER_2D",
+            "FFD_THICKNESS_2D",
+        ]:
+            this_dvFFDTag = this_dvParam[0]
+            this_dvParam[0] = "0"
+        else:
+            this_dvFFDTag = []
 
-        # --- Check if there is a line continuation character at the
-        # end of the current line or somewhere in between (the rest is ignored then).
-        # If yes, read until there is a line without one or an empty line.
-        # If there is a statement after a cont. char
-        # throw an error. ---*/
-
-        while line[0].endswith("\\") or len(line.split("\\")) > 1:
-            tmp_line = input_file.readline()
-            tmp_line = tmp_line.strip()
-            assert len(tmp_line.split("=")) <= 1, (
-                "Statement found after line "
-                "continuation character in config file %s" % tmp_line
-            )
-            if not tmp_line.startswith("%"):
-                line = line.split("\\")[0]
-                line += " " + tmp_line
+        if not data_dict["DV_KIND"][0] in ["NO_DEFORMATION"]:
+            this_dvParam = [float(x) for x in this_dvParam]
 
-        # split across equals sign
-        line = line.split("=", 1)
-        this_param = line[0].strip()
-        this_value = line[1].strip()
+        if data_dict["DV_KIND"][0] in ["FFD_CONTROL_POINT_2D"]:
+            if this_dvParam[3] == 0 and this_dvParam[4] == 0:
+                this_dvSize = 2
 
-        assert this_param not in data_dict, (
-            "Config file has multiple specifications of %s" % this_param
-        )
-        for case in switch(this_param):
-
-            # comma delimited lists of strings with or without paren's
-            if (
-                case("MARKER_EULER")
-                or case("MARKER_FAR")
-                or case("MARKER_PLOTTING")
-                or case("MARKER_MONITORING")
-                or case("MARKER_SYM")
-                or case("DV_KIND")
-            ):
-                # remove white space
-                this_value = "".join(this_value.split())
-                # remove parens
-                this_value = this_value.strip("()")
-                # split by comma
-                data_dict[this_param] = this_value.split(",")
-                break
+        if data_dict["DV_KIND"][0] in ["FFD_CONTROL_POINT"]:
+            if this_dvParam[4] == 0 and this_dvParam[5] == 0 and this_dvParam[6] == 0:
+                this_dvSize = 3
 
-            # semicolon delimited lists of comma delimited lists of floats
-            if case("DV_PARAM"):
-                # remove white space
-                info_General = "".join(this_value.split())
-                # split by semicolon
-                info_General = info_General.split(";")
-                # build list of dv params, convert string to float
-                dv_Parameters = []
-                dv_FFDTag = []
-                dv_Size = []
-
-                for this_dvParam in info_General:
-                    this_dvParam = this_dvParam.strip("()")
-                    this_dvParam = this_dvParam.split(",")
-                    this_dvSize = 1
-
-                    # if FFD change the first element to work with numbers and float(x)
-                    if data_dict["DV_KIND"][0] in [
-                        "FFD_SETTING",
-                        "FFD_ANGLE_OF_ATTACK",
-                        "FFD_CONTROL_POINT",
-                        "FFD_NACELLE",
-                        "FFD_GULL",
-                        "FFD_TWIST",
-                        "FFD_ROTATION",
-                        "FFD_CAMBER",
-                        "FFD_THICKNESS",
-                        "FFD_CONTROL_POINT_2D",
-                        "FFD_CAMBER_2D",
-                        "FFD_THICKNESS_2D",
-                    ]:
-                        this_dvFFDTag = this_dvParam[0]
-                        this_dvParam[0] = "0"
-                    else:
-                        this_dvFFDTag = []
-
-                    if not data_dict["DV_KIND"][0] in ["NO_DEFORMATION"]:
-                        this_dvParam = [float(x) for x in this_dvParam]
-
-                    if data_dict["DV_KIND"][0] in ["FFD_CONTROL_POINT_2D"]:
-                        if this_dvParam[3] == 0 and this_dvParam[4] == 0:
-                            this_dvSize = 2
-
-                    if data_dict["DV_KIND"][0] in ["FFD_CONTROL_POINT"]:
-                        if (
-                            this_dvParam[4] == 0
-                            and this_dvParam[5] == 0
-                            and this_dvParam[6] == 0
-                        ):
-                            this_dvSize = 3
-
-                    dv_FFDTag = dv_FFDTag + [this_dvFFDTag]
-                    dv_Parameters = dv_Parameters + [this_dvParam]
-                    dv_Size = dv_Size + [this_dvSize]
-
-                # store in a dictionary
-                dv_Definitions = {
-                    "FFDTAG": dv_FFDTag,
-                    "PARAM": dv_Parameters,
-                    "SIZE": dv_Size,
-                }
+        dv_FFDTag = dv_FFDTag + [this_dvFFDTag]
+        dv_Parameters = dv_Parameters + [this_dvParam]
+        dv_Size = dv_Size + [this_dvSize]
 
-                data_dict[this_param] = dv_Definitions
-                break
+    # store in a dictionary
+    dv_Definitions = {
+        "FFDTAG": dv_FFDTag,
+        "PARAM": dv_Parameters,
+        "SIZE": dv_Size,
+    }
 
-            # comma delimited lists of floats
-            if case("DV_VALUE_OLD") or case("DV_VALUE_NEW") or case("DV_VALUE"):
-                # remove white space
-                this_value = "".join(this_value.split())
-                # split by comma, map to float, store in dictionary
-                data_dict[this_param] = list(map(float, this_value.split(",")))
-                break
+    return dv_Definitions
 
-            # float parameters
-            if (
-                case("MACH_NUMBER")
-                or case("AOA")
-                or case("FIN_DIFF_STEP")
-                or case("CFL_NUMBER")
-                or case("HB_PERIOD")
-                or case("WRT_SOL_FREQ")
-            ):
-                data_dict[this_param] = float(this_value)
-                break
 
-            # int parameters
-            if (
-                case("NUMBER_PART")
-                or case("AVAILABLE_PROC")
-                or case("ITER")
-                or case("TIME_INSTANCES")
-                or case("UNST_ADJOINT_ITER")
-                or case("ITER_AVERAGE_OBJ")
-                or case("INNER_ITER")
-                or case("OUTER_ITER")
-                or case("TIME_ITER")
-                or case("ADAPT_CYCLES")
-            ):
-                data_dict[this_param] = int(this_value)
-                break
+# comma delimited lists of floats
+def read_floatList(this_value, data_dict, filename):
+    # remove white space
+    this_value = "".join(this_value.split())
+    # split by comma, map to float
+    return list(map(float, this_value.split(",")))
 
-            if case("OUTPUT_FILES"):
-                data_dict[this_param] = this_value.strip("()").split(",")
-                data_dict[this_param] = [i.strip(" ") for i in data_dict[this_param]]
-                break
-            if case("CONFIG_LIST"):
-                data_dict[this_param] = this_value.strip("()").split(",")
-                data_dict[this_param] = [i.strip(" ") for i in data_dict[this_param]]
-                break
-            if case("HISTORY_OUTPUT"):
-                data_dict[this_param] = this_value.strip("()").split(",")
-                data_dict[this_param] = [i.strip(" ") for i in data_dict[this_param]]
-                break
 
-            # unitary design variable definition
-            if case("DEFINITION_DV"):
-                # remove white space
-                this_value = "".join(this_value.split())
-                # split into unitary definitions
-                info_Unitary = this_value.split(";")
-                # process each Design Variable
-                dv_Kind = []
-                dv_Scale = []
-                dv_Markers = []
-                dv_FFDTag = []
-                dv_Parameters = []
-                dv_Size = []
-
-                for this_General in info_Unitary:
-                    if not this_General:
-                        continue
-                    # split each unitary definition into one general definition
-                    info_General = this_General.strip("()").split(
-                        "|"
-                    )  # check for needed strip()?
-                    # split information for dv Kinds
-                    info_Kind = info_General[0].split(",")
-                    # pull processed dv values
-                    this_dvKind = get_dvKind(int(info_Kind[0]))
-                    this_dvScale = float(info_Kind[1])
-                    this_dvMarkers = info_General[1].split(",")
-                    this_dvSize = 1
-
-                    if this_dvKind == "MACH_NUMBER" or this_dvKind == "AOA":
-                        this_dvParameters = []
-                    else:
-                        this_dvParameters = info_General[2].split(",")
-                        # if FFD change the first element to work with numbers and float(x), save also the tag
-                        if this_dvKind in [
-                            "FFD_SETTING",
-                            "FFD_ANGLE_OF_ATTACK",
-                            "FFD_CONTROL_POINT",
-                            "FFD_NACELLE",
-                            "FFD_GULL",
-                            "FFD_TWIST",
-                            "FFD_TWIST_ANGLE",
-                            "FFD_ROTATION",
-                            "FFD_CAMBER",
-                            "FFD_THICKNESS",
-                            "FFD_CONTROL_POINT_2D",
-                            "FFD_CAMBER_2D",
-                            "FFD_THICKNESS_2D",
-                        ]:
-                            this_dvFFDTag = this_dvParameters[0]
-                            this_dvParameters[0] = "0"
-                        else:
-                            this_dvFFDTag = []
-
-                        this_dvParameters = [float(x) for x in this_dvParameters]
-
-                        if this_dvKind in ["FFD_CONTROL_POINT_2D"]:
-                            if this_dvParameters[3] == 0 and this_dvParameters[4] == 0:
-                                this_dvSize = 2
-
-                        if this_dvKind in ["FFD_CONTROL_POINT"]:
-                            if (
-                                this_dvParameters[4] == 0
-                                and this_dvParameters[5] == 0
-                                and this_dvParameters[6] == 0
-                            ):
-                                this_dvSize = 3
-
-                    # add to lists
-                    dv_Kind = dv_Kind + [this_dvKind]
-                    dv_Scale = dv_Scale + [this_dvScale]
-                    dv_Markers = dv_Markers + [this_dvMarkers]
-                    dv_FFDTag = dv_FFDTag + [this_dvFFDTag]
-                    dv_Parameters = dv_Parameters + [this_dvParameters]
-                    dv_Size = dv_Size + [this_dvSize]
-                # store in a dictionary
-                dv_Definitions = {
-                    "KIND": dv_Kind,
-                    "SCALE": dv_Scale,
-                    "MARKER": dv_Markers,
-                    "FFDTAG": dv_FFDTag,
-                    "PARAM": dv_Parameters,
-                    "SIZE": dv_Size,
-                }
+# float parameters
+def read_float(this_value, data_dict, filename):
+    return float(this_value)
 
-                # save to output dictionary
-                data_dict[this_param] = dv_Definitions
-                break
 
-            # unitary objective definition
-            if case("OPT_OBJECTIVE"):
-                # remove white space
-                this_value = "".join(this_value.split())
-                # split by ;
-                this_def = OrderedDict()
-                this_value = this_value.split(";")
-
-                for this_obj in this_value:
-                    # split by scale
-                    this_obj = this_obj.split("*")
-                    this_name = this_obj[0]
-                    this_scale = 1.0
-                    if len(this_obj) > 1:
-                        this_scale = float(this_obj[1])
-                    # check for penalty-based constraint function
-                    for this_sgn in ["<", ">", "="]:
-                        if this_sgn in this_name:
-                            break
-                    this_obj = this_name.strip("()").split(this_sgn)
-                    if len(this_obj) > 1:
-                        this_type = this_sgn
-                        this_val = this_obj[1]
-                    else:
-                        this_type = "DEFAULT"
-                        this_val = 0.0
-                    this_name = this_obj[0]
-                    # Print an error and exit if the same key appears twice
-                    if this_name in this_def:
-                        raise SystemExit(
-                            "Multiple occurrences of the same objective in the OPT_OBJECTIVE definition are not currently supported. To evaluate one objective over multiple surfaces, list the objective once."
-                        )
-                    # Set up dict for objective, including scale, whether it is a penalty, and constraint value
-                    this_def.update(
-                        {
-                            this_name: {
-                                "SCALE": this_scale,
-                                "OBJTYPE": this_type,
-                                "VALUE": this_val,
-                            }
-                        }
-                    )
-                    # OPT_OBJECTIVE has to appear after MARKER_MONITORING in the .cfg, maybe catch that here
-                    if len(data_dict["MARKER_MONITORING"]) > 1:
-                        this_def[this_name]["MARKER"] = data_dict["MARKER_MONITORING"][
-                            len(this_def) - 1
-                        ]
-                    else:
-                        this_def[this_name]["MARKER"] = data_dict["MARKER_MONITORING"][
-                            0
-                        ]
-
-                # save to output dictionary
-                data_dict[this_param] = this_def
-                break
+# int parameters
+def read_int(this_value, data_dict, filename):
+    return int(this_value)
 
-            # unitary constraint definition
-            if case("OPT_CONSTRAINT"):
-                # remove white space
-                this_value = "".join(this_value.split())
-                # check for none case
-                if this_value == "NONE":
-                    data_dict[this_param] = {
-                        "EQUALITY": OrderedDict(),
-                        "INEQUALITY": OrderedDict(),
-                    }
-                    break
-                # split definitions
-                this_value = this_value.split(";")
-                this_def = OrderedDict()
-                for this_con in this_value:
-                    if not this_con:
-                        continue  # if no definition
-                    # defaults
-                    this_obj = "NONE"
-                    this_sgn = "="
-                    this_scl = 1.0
-                    this_val = 0.0
-                    # split scale if present
-                    this_con = this_con.split("*")
-                    if len(this_con) > 1:
-                        this_scl = float(this_con[1])
-                    this_con = this_con[0]
-                    # find sign
-                    for this_sgn in ["<", ">", "="]:
-                        if this_sgn in this_con:
-                            break
-                    # split sign, store objective and value
-                    this_con = this_con.strip("()").split(this_sgn)
-                    assert len(this_con) == 2, "incorrect constraint definition"
-                    this_obj = this_con[0]
-                    this_val = float(this_con[1])
-                    # store in dictionary
-                    this_def[this_obj] = {
-                        "SIGN": this_sgn,
-                        "VALUE": this_val,
-                        "SCALE": this_scl,
-                    }
-                #: for each constraint definition
-                # sort constraints by type
-                this_sort = {"EQUALITY": OrderedDict(), "INEQUALITY": OrderedDict()}
-                for key, value in this_def.items():
-                    if value["SIGN"] == "=":
-                        this_sort["EQUALITY"][key] = value
-                    else:
-                        this_sort["INEQUALITY"][key] = value
-                #: for each definition
-                # save to output dictionary
-                data_dict[this_param] = this_sort
-                break
 
-            # otherwise
-            # string parameters
-            if case():
-                data_dict[this_param] = this_value
+# comma delimited lists of strings inside paren's
+def read_list(this_value, data_dict, filename):
+    this_value = this_value.strip("()").split(",")
+    return [i.strip(" ") for i in this_value]
+
+
+def read_resultCache(this_value, data_dict, filename):
+    # relative to the config file, designs run in other folders
+    if this_value != "NONE":
+        this_value = os.path.join(
+            os.path.dirname(os.path.abspath(filename)), this_value
+        )
+    return this_value
+
+
+# unitary design variable definition
+def read_definitionDV(this_value, data_dict, filename):
+    # remove white space
+    this_value = "".join(this_value.split())
+    # split into unitary definitions
+    info_Unitary = this_value.split(";")
+    # process each Design Variable
+    dv_Kind = []
+    dv_Scale = []
+    dv_Markers = []
+    dv_FFDTag = []
+    dv_Parameters = []
+    dv_Size = []
+
+    for this_General in info_Unitary:
+        if not this_General:
+            continue
+        # split each unitary definition into one general definition
+        info_General = this_General.strip("()").split("|")  # check for needed strip()?
+        # split information for dv Kinds
+        info_Kind = info_General[0].split(",")
+        # pull processed dv values
+        this_dvKind = get_dvKind(int(info_Kind[0]))
+        this_dvScale = float(info_Kind[1])
+        this_dvMarkers = info_General[1].split(",")
+        this_dvSize = 1
+
+        if this_dvKind == "MACH_NUMBER" or this_dvKind == "AOA":
+            this_dvParameters = []
+        else:
+            this_dvParameters = info_General[2].split(",")
+            # if FFD change the first element to work with numbers and float(x), save also the tag
+            if this_dvKind in [
+                "FFD_SETTING",
+                "FFD_ANGLE_OF_ATTACK",
+                "FFD_CONTROL_POINT",
+                "FFD_NACELLE",
+                "FFD_GULL",
+                "FFD_TWIST",
+                "FFD_TWIST_ANGLE",
+                "FFD_ROTATION",
+                "FFD_CAMBER",
+                "FFD_THICKNESS",
+                "FFD_CONTROL_POINT_2D",
+                "FFD_CAMBER_2D",
+                "FFD_THICKNESS_2D",
+            ]:
+                this_dvFFDTag = this_dvParameters[0]
+                this_dvParameters[0] = "0"
+            else:
+                this_dvFFDTag = []
+
+            this_dvParameters = [float(x) for x in this_dvParameters]
+
+            if this_dvKind in ["FFD_CONTROL_POINT_2D"]:
+                if this_dvParameters[3] == 0 and this_dvParameters[4] == 0:
+                    this_dvSize = 2
+
+            if this_dvKind in ["FFD_CONTROL_POINT"]:
+                if (
+                    this_dvParameters[4] == 0
+                    and this_dvParameters[5] == 0
+                    and this_dvParameters[6] == 0
+                ):
+                    this_dvSize = 3
+
+        # add to lists
+        dv_Kind = dv_Kind + [this_dvKind]
+        dv_Scale = dv_Scale + [this_dvScale]
+        dv_Markers = dv_Markers + [this_dvMarkers]
+        dv_FFDTag = dv_FFDTag + [this_dvFFDTag]
+        dv_Parameters = dv_Parameters + [this_dvParameters]
+        dv_Size = dv_Size + [this_dvSize]
+    # store in a dictionary
+    dv_Definitions = {
+        "KIND": dv_Kind,
+        "SCALE": dv_Scale,
+        "MARKER": dv_Markers,
+        "FFDTAG": dv_FFDTag,
+        "PARAM": dv_Parameters,
+        "SIZE": dv_Size,
+    }
+
+    return dv_Definitions
+
+
+# unitary objective definition
+def read_optObjective(this_value, data_dict, filename):
+    # remove white space
+    this_value = "".join(this_value.split())
+    # split by ;
+    this_def = OrderedDict()
+    this_value = this_value.split(";")
+
+    for this_obj in this_value:
+        # split by scale
+        this_obj = this_obj.split("*")
+        this_name = this_obj[0]
+        this_scale = 1.0
+        if len(this_obj) > 1:
+            this_scale = float(this_obj[1])
+        # check for penalty-based constraint function
+        for this_sgn in ["<", ">", "="]:
+            if this_sgn in this_name:
                 break
+        this_obj = this_name.strip("()").split(this_sgn)
+        if len(this_obj) > 1:
+            this_type = this_sgn
+            this_val = this_obj[1]
+        else:
+            this_type = "DEFAULT"
+            this_val = 0.0
+        this_name = this_obj[0]
+        # Print an error and exit if the same key appears twice
+        if this_name in this_def:
+            raise SystemExit(
+                "Multiple occurrences of the same objective in the OPT_OBJECTIVE definition are not currently supported. To evaluate one objective over multiple surfaces, list the objective once."
+            )
+        # Set up dict for objective, including scale, whether it is a penalty, and constraint value
+        this_def.update(
+            {
+                this_name: {
+                    "SCALE": this_scale,
+                    "OBJTYPE": this_type,
+                    "VALUE": this_val,
+                }
+            }
+        )
+        # OPT_OBJECTIVE has to appear after MARKER_MONITORING in the .cfg, maybe catch that here
+        if len(data_dict["MARKER_MONITORING"]) > 1:
+            this_def[this_name]["MARKER"] = data_dict["MARKER_MONITORING"][
+                len(this_def) - 1
+            ]
+        else:
+            this_def[this_name]["MARKER"] = data_dict["MARKER_MONITORING"][0]
 
-            #: if case DEFINITION_DV
+    return this_def
 
-        #: for case
 
-    #: for line
+# unitary constraint definition
+def read_optConstraint(this_value, data_dict, filename):
+    # remove white space
+    this_value = "".join(this_value.split())
+    # check for none case
+    if this_value == "NONE":
+        return {
+            "EQUALITY": OrderedDict(),
+            "INEQUALITY": OrderedDict(),
+        }
+    # split definitions
+    this_value = this_value.split(";")
+    this_def = OrderedDict()
+    for this_con in this_value:
+        if not this_con:
+            continue  # if no definition
+        # defaults
+        this_obj = "NONE"
+        this_sgn = "="
+        this_scl = 1.0
+        this_val = 0.0
+        # split scale if present
+        this_con = this_con.split("*")
+        if len(this_con) > 1:
+            this_scl = float(this_con[1])
+        this_con = this_con[0]
+        # find sign
+        for this_sgn in ["<", ">", "="]:
+            if this_sgn in this_con:
+                break
+        # split sign, store objective and value
+        this_con = this_con.strip("()").split(this_sgn)
+        assert len(this_con) == 2, "incorrect constraint definition"
+        this_obj = this_con[0]
+        this_val = float(this_con[1])
+        # store in dictionary
+        this_def[this_obj] = {
+            "SIGN": this_sgn,
+            "VALUE": this_val,
+            "SCALE": this_scl,
+        }
+    #: for each constraint definition
+    # sort constraints by type
+    this_sort = {"EQUALITY": OrderedDict(), "INEQUALITY": OrderedDict()}
+    for key, value in this_def.items():
+        if value["SIGN"] == "=":
+            this_sort["EQUALITY"][key] = value
+        else:
+            this_sort["INEQUALITY"][key] = value
+    #: for each definition
+    return this_sort
+
+
+# otherwise string parameters
+def read_string(this_value, data_dict, filename):
+    return this_value
+
+
+# parameter readers, by parameter name
+config_readers = {
+    "MARKER_EULER": read_markers,
+    "MARKER_FAR": read_markers,
+    "MARKER_PLOTTING": read_markers,
+    "MARKER_MONITORING": read_markers,
+    "MARKER_SYM": read_markers,
+    "DV_KIND": read_markers,
+    "DV_PARAM": read_dvParam,
+    "DV_VALUE_OLD": read_floatList,
+    "DV_VALUE_NEW": read_floatList,
+    "DV_VALUE": read_floatList,
+    "MACH_NUMBER": read_float,
+    "AOA": read_float,
+    "FIN_DIFF_STEP": read_float,
+    "RESULT_CACHE_SIZE": read_float,
+    "CFL_NUMBER": read_float,
+    "HB_PERIOD": read_float,
+    "WRT_SOL_FREQ": read_float,
+    "NUMBER_PART": read_int,
+    "FIN_DIFF_JOBS": read_int,
+    "MULTIPOINT_JOBS": read_int,
+    "AVAILABLE_PROC": read_int,
+    "ITER": read_int,
+    "TIME_INSTANCES": read_int,
+    "UNST_ADJOINT_ITER": read_int,
+    "ITER_AVERAGE_OBJ": read_int,
+    "INNER_ITER": read_int,
+    "OUTER_ITER": read_int,
+    "TIME_ITER": read_int,
+    "ADAPT_CYCLES": read_int,
+    "OUTPUT_FILES": read_list,
+    "CONFIG_LIST": read_list,
+    "RESULT_CACHE": read_resultCache,
+    "HISTORY_OUTPUT": read_list,
+    "DEFINITION_DV": read_definitionDV,
+    "OPT_OBJECTIVE": read_optObjective,
+    "OPT_CONSTRAINT": read_optConstraint,
+}
+
+
+def set_defaults(data_dict):
+    """adds the default values of parameters missing in a config file"""
 
     if "OPT_CONSTRAINT" in data_dict:
         if (
@@ -909,10 +1291,8 @@ def read_config(filename):
     if "GRAD_OBJFUNC_FILENAME" not in data_dict:
         data_dict["GRAD_OBJFUNC_FILENAME"] = "of_grad.dat"
 
-    return data_dict
 
-
-#: def read_config()
+#: def set_defaults()
 
 
 # -------------------------------------------------------------------
@@ -923,290 +1303,200 @@ def read_config(filename):
 def write_config(filename, param_dict):
     """updates an existing config file"""
 
-    temp_filename = filename + "_tmp"
-    shutil.copy(filename, temp_filename)
-    output_file = open(filename, "w")
-
-    # break pointers
-    param_dict = copy.deepcopy(param_dict)
-
-    for raw_line in open(temp_filename):
-        # remove line returns
-        line = raw_line.strip("\r\n")
-
-        # make sure it has useful data
-        if not "=" in line:
-            output_file.write(raw_line)
-            continue
-
-        # split across equals sign
-        line = line.split("=")
-        this_param = line[0].strip()
-        old_value = line[1].strip()
-
-        # skip if parameter unwanted
-        if this_param not in param_dict:
-            output_file.write(raw_line)
-            continue
-
-        # start writing parameter
-        new_value = param_dict[this_param]
-        output_file.write(this_param + "= ")
-
-        # handle parameter types
-        for case in switch(this_param):
-
-            # comma delimited list of floats
-            if case("DV_VALUE_NEW"):
-                pass
-            if case("DV_VALUE_OLD"):
-                pass
-            if case("DV_VALUE"):
-                n_lists = len(new_value)
-                for i_value in range(n_lists):
-                    output_file.write("%s" % new_value[i_value])
-                    if i_value + 1 < n_lists:
-                        output_file.write(", ")
-                break
-
-            # comma delimited list of strings no paren's
-            if case("DV_KIND"):
-                pass
-            if case("TASKS"):
-                pass
-            if case("GRADIENTS"):
-                if not isinstance(new_value, list):
-                    new_value = [new_value]
-                n_lists = len(new_value)
-                for i_value in range(n_lists):
-                    output_file.write(new_value[i_value])
-                    if i_value + 1 < n_lists:
-                        output_file.write(", ")
-                break
+    text = get_configTree(filename).update(param_dict)
 
-            # comma delimited list of strings inside paren's
-            if case("MARKER_EULER"):
-                pass
-            if case("MARKER_FAR"):
-                pass
-            if case("MARKER_PLOTTING"):
-                pass
-            if case("MARKER_MONITORING"):
-                pass
-            if case("MARKER_SYM"):
-                pass
-            if case("DV_MARKER"):
-                if not isinstance(new_value, list):
-                    new_value = [new_value]
-                output_file.write("( ")
-                n_lists = len(new_value)
-                for i_value in range(n_lists):
-                    output_file.write(new_value[i_value])
-                    if i_value + 1 < n_lists:
-                        output_file.write(", ")
-                output_file.write(" )")
-                break
-            if case("OUTPUT_FILES"):
-                n_lists = len(new_value)
-                output_file.write("(")
-                for i_value in range(n_lists):
-                    output_file.write(new_value[i_value])
-                    if i_value + 1 < n_lists:
-                        output_file.write(", ")
-                output_file.write(")")
-                break
+    with open(filename, "w") as output_file:
+        output_file.write(text)
+    _config_trees.pop(os.path.abspath(filename), None)
 
-            if case("CONFIG_LIST"):
-                n_lists = len(new_value)
-                output_file.write("(")
-                for i_value in range(n_lists):
-                    output_file.write(new_value[i_value])
-                    if i_value + 1 < n_lists:
-                        output_file.write(", ")
-                output_file.write(")")
-                break
 
-            if case("HISTORY_OUTPUT"):
-                n_lists = len(new_value)
-                for i_value in range(n_lists):
-                    output_file.write(new_value[i_value])
-                    if i_value + 1 < n_lists:
-                        output_file.write(", ")
-                break
+#: def write_config()
 
-            # semicolon delimited lists of comma delimited lists
-            if case("DV_PARAM"):
-
-                assert isinstance(
-                    new_value["PARAM"], list
-                ), "incorrect specification of DV_PARAM"
-                if not isinstance(new_value["PARAM"][0], list):
-                    new_value = [new_value]
-
-                for i_value in range(len(new_value["PARAM"])):
-
-                    output_file.write("( ")
-                    this_param_list = new_value["PARAM"][i_value]
-                    this_ffd_list = new_value["FFDTAG"][i_value]
-                    n_lists = len(this_param_list)
-
-                    if this_ffd_list != []:
-                        output_file.write("%s, " % this_ffd_list)
-                        for j_value in range(1, n_lists):
-                            output_file.write("%s" % this_param_list[j_value])
-                            if j_value + 1 < n_lists:
-                                output_file.write(", ")
-                    else:
-                        for j_value in range(n_lists):
-                            output_file.write("%s" % this_param_list[j_value])
-                            if j_value + 1 < n_lists:
-                                output_file.write(", ")
-
-                    output_file.write(") ")
-                    if i_value + 1 < len(new_value["PARAM"]):
-                        output_file.write("; ")
-                break
 
-            # int parameters
-            if case("NUMBER_PART"):
-                pass
-            if case("ADAPT_CYCLES"):
-                pass
-            if case("TIME_INSTANCES"):
-                pass
-            if case("AVAILABLE_PROC"):
-                pass
-            if case("UNST_ADJOINT_ITER"):
-                pass
-            if (
-                case("ITER")
-                or case("TIME_ITER")
-                or case("INNER_ITER")
-                or case("OUTER_ITER")
-            ):
-                output_file.write("%i" % new_value)
-                break
+def get_value(param_dict, this_param):
+    # value of a parameter, without copying config layers, for reading only
+    if isinstance(param_dict, Config):
+        return param_dict._peek(this_param)
+    return param_dict[this_param]
 
-            if case("DEFINITION_DV"):
-                n_dv = len(new_value["KIND"])
-                if not n_dv:
-                    output_file.write("NONE")
-                for i_dv in range(n_dv):
-                    this_kind = new_value["KIND"][i_dv]
-                    output_file.write("( ")
-                    output_file.write("%i , " % get_dvID(this_kind))
-                    output_file.write("%s " % new_value["SCALE"][i_dv])
-                    output_file.write("| ")
-                    # markers
-                    n_mark = len(new_value["MARKER"][i_dv])
-                    for i_mark in range(n_mark):
-                        output_file.write("%s " % new_value["MARKER"][i_dv][i_mark])
-                        if i_mark + 1 < n_mark:
-                            output_file.write(", ")
-                    #: for each marker
-                    if not this_kind in ["AOA", "MACH_NUMBER"]:
-                        output_file.write(" | ")
-                        # params
-                        if this_kind in [
-                            "FFD_SETTING",
-                            "FFD_ANGLE_OF_ATTACK",
-                            "FFD_CONTROL_POINT",
-                            "FFD_NACELLE",
-                            "FFD_GULL",
-                            "FFD_TWIST_ANGLE",
-                            "FFD_TWIST",
-                            "FFD_ROTATION",
-                            "FFD_CAMBER",
-                            "FFD_THICKNESS",
-                            "FFD_CONTROL_POINT_2D",
-                            "FFD_CAMBER_2D",
-                            "FFD_THICKNESS_2D",
-                        ]:
-                            n_param = len(new_value["PARAM"][i_dv])
-                            output_file.write("%s , " % new_value["FFDTAG"][i_dv])
-                            for i_param in range(1, n_param):
-                                output_file.write(
-                                    "%s " % new_value["PARAM"][i_dv][i_param]
-                                )
-                                if i_param + 1 < n_param:
-                                    output_file.write(", ")
-                        else:
-                            n_param = len(new_value["PARAM"][i_dv])
-                            for i_param in range(n_param):
-                                output_file.write(
-                                    "%s " % new_value["PARAM"][i_dv][i_param]
-                                )
-                                if i_param + 1 < n_param:
-                                    output_file.write(", ")
-
-                        #: for each param
-                    output_file.write(" )")
-                    if i_dv + 1 < n_dv:
-                        output_file.write("; ")
-                #: for each dv
-                break
 
-            if case("OPT_OBJECTIVE"):
-                n_obj = 0
-                for name, value in new_value.items():
-                    if n_obj > 0:
-                        output_file.write("; ")
-                    if value["OBJTYPE"] == "DEFAULT":
-                        output_file.write("%s * %s " % (name, value["SCALE"]))
-                    else:
-                        output_file.write(
-                            "( %s %s %s ) * %s"
-                            % (name, value["OBJTYPE"], value["VALUE"], value["SCALE"])
-                        )
-                    n_obj += 1
-                break
+def same_value(value1, value2):
+    # values compare elementwise if one of them is an array
+    try:
+        return bool(value1 == value2)
+    except ValueError:
+        return False
 
-            if case("OPT_CONSTRAINT"):
-                i_con = 0
-                for con_type in ["EQUALITY", "INEQUALITY"]:
-                    this_con = new_value[con_type]
-                    for name, value in this_con.items():
-                        if i_con > 0:
-                            output_file.write("; ")
-                        output_file.write(
-                            "( %s %s %s ) * %s"
-                            % (name, value["SIGN"], value["VALUE"], value["SCALE"])
-                        )
-                        i_con += 1
-                    #: for each constraint
-                #: for each constraint type
-                if not i_con:
-                    output_file.write("NONE")
-                break
-
-            # default, assume string, integer or unformatted float
-            if case():
-                output_file.write("%s" % new_value)
-                break
 
-        #: for case
+def format_value(this_param, new_value):
+    """value = SU2.io.config.format_value(this_param,new_value)
+    formats a parameter value as written in a config file
+    """
+    writer = config_writers.get(this_param, write_string)
+    return writer(new_value)
 
-        # remove from param dictionary
-        del param_dict[this_param]
 
-        # next line
-        output_file.write("\n")
+# comma delimited list of floats
+def write_floatList(new_value):
+    return ", ".join(["%s" % value for value in new_value])
+
+
+# comma delimited list of strings no paren's
+def write_names(new_value):
+    if not isinstance(new_value, list):
+        new_value = [new_value]
+    return ", ".join(new_value)
+
+
+# comma delimited list of strings inside paren's
+def write_markers(new_value):
+    if not isinstance(new_value, list):
+        new_value = [new_value]
+    return "( " + ", ".join(new_value) + " )"
+
+
+def write_list(new_value):
+    return "(" + ", ".join(new_value) + ")"
+
+
+def write_history(new_value):
+    return ", ".join(new_value)
+
+
+# semicolon delimited lists of comma delimited lists
+def write_dvParam(new_value):
+
+    assert isinstance(new_value["PARAM"], list), "incorrect specification of DV_PARAM"
+    if not isinstance(new_value["PARAM"][0], list):
+        new_value = [new_value]
+
+    output = ""
+    for i_value in range(len(new_value["PARAM"])):
+
+        this_param_list = new_value["PARAM"][i_value]
+        this_ffd_list = new_value["FFDTAG"][i_value]
+
+        if this_ffd_list != []:
+            this_param_list = [this_ffd_list] + this_param_list[1:]
+        output += "( " + ", ".join(["%s" % value for value in this_param_list])
+
+        output += ") "
+        if i_value + 1 < len(new_value["PARAM"]):
+            output += "; "
+
+    return output
+
+
+# int parameters
+def write_int(new_value):
+    return "%i" % new_value
+
+
+def write_definitionDV(new_value):
+    n_dv = len(new_value["KIND"])
+    if not n_dv:
+        return "NONE"
+
+    output = ""
+    for i_dv in range(n_dv):
+        this_kind = new_value["KIND"][i_dv]
+        output += "( "
+        output += "%i , " % get_dvID(this_kind)
+        output += "%s " % new_value["SCALE"][i_dv]
+        output += "| "
+        # markers
+        output += ", ".join(["%s " % marker for marker in new_value["MARKER"][i_dv]])
+        if not this_kind in ["AOA", "MACH_NUMBER"]:
+            output += " | "
+            # params
+            this_params = new_value["PARAM"][i_dv]
+            if this_kind in [
+                "FFD_SETTING",
+                "FFD_ANGLE_OF_ATTACK",
+                "FFD_CONTROL_POINT",
+                "FFD_NACELLE",
+                "FFD_GULL",
+                "FFD_TWIST_ANGLE",
+                "FFD_TWIST",
+                "FFD_ROTATION",
+                "FFD_CAMBER",
+                "FFD_THICKNESS",
+                "FFD_CONTROL_POINT_2D",
+                "FFD_CAMBER_2D",
+                "FFD_THICKNESS_2D",
+            ]:
+                output += "%s , " % new_value["FFDTAG"][i_dv]
+                this_params = this_params[1:]
+            output += ", ".join(["%s " % param for param in this_params])
+        output += " )"
+        if i_dv + 1 < n_dv:
+            output += "; "
+
+    return output
 
-    #: for each line
 
-    # check that all params were used
-    for this_param in param_dict.keys():
-        if not this_param in ["JOB_NUMBER"]:
-            print(
-                "Warning: Parameter %s not found in config file and was not written"
-                % (this_param)
+def write_optObjective(new_value):
+    output = []
+    for name, value in new_value.items():
+        if value["OBJTYPE"] == "DEFAULT":
+            output.append("%s * %s " % (name, value["SCALE"]))
+        else:
+            output.append(
+                "( %s %s %s ) * %s"
+                % (name, value["OBJTYPE"], value["VALUE"], value["SCALE"])
             )
+    return "; ".join(output)
 
-    output_file.close()
-    os.remove(temp_filename)
 
-
-#: def write_config()
+def write_optConstraint(new_value):
+    output = []
+    for con_type in ["EQUALITY", "INEQUALITY"]:
+        for name, value in new_value[con_type].items():
+            output.append(
+                "( %s %s %s ) * %s"
+                % (name, value["SIGN"], value["VALUE"], value["SCALE"])
+            )
+    if not output:
+        return "NONE"
+    return "; ".join(output)
+
+
+# default, assume string, integer or unformatted float
+def write_string(new_value):
+    return "%s" % new_value
+
+
+# parameter writers, by parameter name
+config_writers = {
+    "DV_VALUE_NEW": write_floatList,
+    "DV_VALUE_OLD": write_floatList,
+    "DV_VALUE": write_floatList,
+    "DV_KIND": write_names,
+    "TASKS": write_names,
+    "GRADIENTS": write_names,
+    "MARKER_EULER": write_markers,
+    "MARKER_FAR": write_markers,
+    "MARKER_PLOTTING": write_markers,
+    "MARKER_MONITORING": write_markers,
+    "MARKER_SYM": write_markers,
+    "DV_MARKER": write_markers,
+    "OUTPUT_FILES": write_list,
+    "CONFIG_LIST": write_list,
+    "HISTORY_OUTPUT": write_history,
+    "DV_PARAM": write_dvParam,
+    "NUMBER_PART": write_int,
+    "ADAPT_CYCLES": write_int,
+    "TIME_INSTANCES": write_int,
+    "AVAILABLE_PROC": write_int,
+    "UNST_ADJOINT_ITER": write_int,
+    "ITER": write_int,
+    "TIME_ITER": write_int,
+    "INNER_ITER": write_int,
+    "OUTER_ITER": write_int,
+    "DEFINITION_DV": write_definitionDV,
+    "OPT_OBJECTIVE": write_optObjective,
+    "OPT_CONSTRAINT": write_optConstraint,
+}
 
 
 def dump_config(filename, config):
@@ -1218,10 +1508,10 @@ def dump_config(filename, config):
     if "DV_VALUE_NEW" in config:
         config.DV_VALUE = config.DV_VALUE_NEW
 
-    config_file = open(filename, "w")
-    # write dummy file
+    output = []
     for key in config.keys():
-        config_file.write("%s= 0 \n" % key)
-    config_file.close()
-    # dump data
-    write_config(filename, config)
+        output.append("%s= %s\n" % (key, format_value(key, get_value(config, key))))
+
+    with open(filename, "w") as config_file:
+        config_file.write("".join(output))
+    _config_trees.pop(os.path.abspath(filename), None)
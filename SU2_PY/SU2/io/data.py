@@ -85,8 +85,8 @@ def load_data(file_name, var_names=None, file_format="infer", core_name="python_
             file_format = "pickle"
     assert file_format in ["matlab", "pickle"], "unsupported file format"
 
-    # get filelock
-    with filelock(file_name):
+    # get shared filelock, readers do not wait for each other
+    with filelock(file_name, shared=True):
 
         # LOAD MATLAB
         if file_format == "matlab" and scipy_loaded:
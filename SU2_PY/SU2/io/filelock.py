@@ -25,9 +25,14 @@
 # You should have received a copy of the GNU Lesser General Public
 # License along with SU2. If not, see <http://www.gnu.org/licenses/>.
 
-import os, time, errno
+import os, sys, time, errno, socket
 from random import random
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 # -------------------------------------------------------------------
 #  File Lock Class
 # -------------------------------------------------------------------
@@ -36,21 +41,38 @@ class filelock(object):
     you can use it in a with statement.
 
     Example:
-    with filelock("test.txt", timeout=2, delay=0.5):
+    with filelock("test.txt"):
         print("Lock acquired.")
         # Do something with the locked file
 
+    with filelock("test.txt", shared=True):
+        # Read the locked file, other readers are let in
+
     Inputs:
         file_name - filename to lock
-        timeout   - default 10sec, maximum timeout to wait for lock
+        timeout   - default None waits for the lock as long as needed,
+                    otherwise maximum number of seconds to wait for it
         delay     - default 0.05sec, delay between each attempt to lock
-                    number incremented with a random perturbation
+                    with a timeout, number incremented with a random
+                    perturbation
+        shared    - default False, True for a shared (read) lock that
+                    other shared locks can hold at the same time
+        stamp     - default True, writes the process id and host name of
+                    exclusive owners into the lock file, see owner()
+
+    Notes:
+        Uses fcntl.flock() on a <file_name>.lock file where available.
+        Waits without a timeout block in the kernel without polling,
+        and locks are released by the system if their process dies.
+        Without fcntl (ie Windows) the lock file is created exclusively
+        and shared locks are exclusive; a lock file left behind by a dead
+        process on the same host is removed, found from its stamp.
 
     original source: Evan Fosmark, BSD license
     http://www.evanfosmark.com/2009/01/cross-platform-file-locking-support-in-python/
     """
 
-    def __init__(self, file_name, timeout=10, delay=0.05):
+    def __init__(self, file_name, timeout=None, delay=0.05, shared=False, stamp=True):
         """Prepare the file locker. Specify the file to lock and optionally
         the maximum timeout and the delay between each attempt to lock.
         """
@@ -59,37 +81,110 @@ class filelock(object):
         self.file_name = file_name
         self.timeout = timeout
         self.delay = delay
+        self.shared = shared
+        self.stamp = stamp
 
     def acquire(self):
-        """Acquire the lock, if possible. If the lock is in use, it check again
-        every `wait` seconds. It does this until it either gets the lock or
-        exceeds `timeout` number of seconds, in which case it throws
-        an exception.
+        """Acquire the lock. Without a timeout, waits until the lock is
+        free. With a timeout, checks again every `delay` seconds until it
+        either gets the lock or exceeds `timeout` number of seconds, in
+        which case it throws an exception.
         """
         start_time = time.time()
         while True:
-            try:
-                self.fd = os.open(self.lockfile, os.O_CREAT | os.O_EXCL | os.O_RDWR)
+            if fcntl is None:
+                locked = self._create()
+            else:
+                locked = self._flock(blocking=self.timeout is None)
+            if locked:
                 break
+            if self.timeout is not None and time.time() - start_time >= self.timeout:
+                raise FileLockException(
+                    "FileLock timeout occured for %s, owner %s"
+                    % (self.lockfile, self.owner())
+                )
+            delay = self.delay * (1.0 + 0.2 * random())
+            time.sleep(delay)
+        self.is_locked = True
+
+        if self.stamp and not (self.shared and fcntl is not None):
+            os.ftruncate(self.fd, 0)
+            os.write(
+                self.fd, ("%i %s\n" % (os.getpid(), socket.gethostname())).encode()
+            )
+
+    def _flock(self, blocking):
+        # returns True once locked, retries if the lock file was removed
+        # by its previous owner while this process waited for it
+        mode = fcntl.LOCK_SH if self.shared else fcntl.LOCK_EX
+        if not blocking:
+            mode |= fcntl.LOCK_NB
+        while True:
+            fd = os.open(self.lockfile, os.O_CREAT | os.O_RDWR)
+            try:
+                fcntl.flock(fd, mode)
+            except (IOError, OSError) as e:
+                os.close(fd)
+                if e.errno in [errno.EAGAIN, errno.EACCES]:
+                    return False
+                raise
+            try:
+                if os.fstat(fd).st_ino == os.stat(self.lockfile).st_ino:
+                    self.fd = fd
+                    return True
             except OSError as e:
-                if e.errno != errno.EEXIST:
+                if e.errno != errno.ENOENT:
+                    os.close(fd)
                     raise
-                if (time.time() - start_time) >= self.timeout:
-                    raise FileLockException(
-                        "FileLock timeout occured for %s" % self.lockfile
-                    )
-                delay = self.delay * (1.0 + 0.2 * random())
-                time.sleep(delay)
-        self.is_locked = True
+            os.close(fd)
+
+    def _create(self):
+        # returns True once the lock file was created
+        try:
+            self.fd = os.open(self.lockfile, os.O_CREAT | os.O_EXCL | os.O_RDWR)
+            return True
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                raise
+        # clean up after dead owners
+        owner = self.owner()
+        if owner is not None and owner[1] == socket.gethostname():
+            if not _pid_alive(owner[0]):
+                try:
+                    os.unlink(self.lockfile)
+                except OSError:
+                    pass
+        return False
+
+    def owner(self):
+        """Returns the (pid, host) stamped into the lock file by
+        its exclusive owner, or None if not known.
+        """
+        try:
+            with open(self.lockfile) as lock_file:
+                pid, host = lock_file.read().split()
+            return int(pid), host
+        except (IOError, OSError, ValueError):
+            return None
 
     def release(self):
-        """Get rid of the lock by deleting the lockfile.
+        """Release the lock, and delete the lockfile unless other
+        processes hold or wait for it.
         When working in a `with` statement, this gets automatically
         called at the end.
         """
         if self.is_locked:
-            os.close(self.fd)
-            os.unlink(self.lockfile)
+            if fcntl is None:
+                os.close(self.fd)
+                os.unlink(self.lockfile)
+            else:
+                try:
+                    # only without other owners, waiters check the inode
+                    fcntl.flock(self.fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    os.unlink(self.lockfile)
+                except (IOError, OSError):
+                    pass
+                os.close(self.fd)
             self.is_locked = False
 
     def __enter__(self):
@@ -119,3 +214,12 @@ class FileLockException(Exception):
 
 
 #: class filelock
+
+
+def _pid_alive(pid):
+    # True if a process with this id runs on this host
+    try:
+        os.kill(pid, 0)
+    except OSError as e:
+        return e.errno == errno.EPERM
+    return True
@@ -0,0 +1,212 @@
+#!/usr/bin/env python
+
+## \file history.py
+#  \brief incremental reader for growing history files
+#  \version 8.0.1 "Harrier"
+#
+# SU2 Project Website: https://su2code.github.io
+#
+# The SU2 Project is maintained by the SU2 Foundation
+# (http://su2foundation.org)
+#
+# Copyright 2012-2024, SU2 Contributors (cf. AUTHORS.md)
+#
+# SU2 is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# SU2 is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with SU2. If not, see <http://www.gnu.org/licenses/>.
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import os, time
+import numpy as np
+from ..util import ordered_bunch
+from .tools import read_plot_header, parse_plot_rows, map_history
+
+# -------------------------------------------------------------------
+#  History Reader Class
+# -------------------------------------------------------------------
+
+
+class HistoryReader(object):
+    """reader = SU2.io.HistoryReader(filename,nZones=1)
+
+    Reads a history file that is still being written by SU2_CFD.
+    Remembers the byte offset of the last complete row and the
+    header mapping, so each poll only parses newly appended rows.
+
+    Example:
+    reader = SU2.io.HistoryReader('history_direct.csv')
+    new_rows = reader.poll()
+    for row in reader.follow(interval=1.0, process=proc):
+        print(row.DRAG)
+
+    Inputs:
+        filename - history file name, need not exist yet
+        nZones   - number of zones, see SU2.io.read_history()
+
+    Attributes:
+        names  - history field names, once the header was read
+        n_rows - number of rows read so far
+        offset - byte offset of the next unread row
+
+    Methods:
+        poll()   - returns an ordered bunch of the new rows
+        read()   - returns all the rows not read yet, ie while
+                   a solver process runs
+        follow() - generator yielding new rows one by one
+        reset()  - forgets the header and offset
+    """
+
+    def __init__(self, filename, nZones=1):
+        self.filename = filename
+        self.nZones = nZones
+        self.reset()
+
+    def reset(self):
+        """forgets the header and restarts from the beginning of the file"""
+        self.headers = None
+        self.names = None
+        self.offset = 0
+        self.n_rows = 0
+
+    def poll(self, final=False):
+        """new_rows = SU2.io.HistoryReader.poll(final=False)
+        returns an ordered bunch with history field names for keys
+        and a float64 numpy array of the values appended since the
+        last poll. Incomplete trailing rows are left for the next poll,
+        unless final is True, ie once the writer has finished.
+        Returns an empty ordered bunch if the header is not written yet.
+        """
+
+        if not os.path.exists(self.filename):
+            return ordered_bunch()
+
+        # file was truncated or rewritten, start over
+        if os.path.getsize(self.filename) < self.offset:
+            self.reset()
+
+        with open(self.filename, "rb") as plot_file:
+
+            # header
+            if self.headers is None:
+                headers = read_plot_header(plot_file)
+                # header line may still be incomplete
+                if plot_file.tell() == 0 or headers == [""]:
+                    return ordered_bunch()
+                plot_file.seek(-1, os.SEEK_CUR)
+                if plot_file.read(1) != b"\n":
+                    return ordered_bunch()
+                self.headers = headers
+                self.names = list(
+                    map_history(ordered_bunch.fromkeys(headers), self.nZones).keys()
+                )
+                self.offset = plot_file.tell()
+
+            # new complete rows
+            plot_file.seek(self.offset)
+            body = plot_file.read()
+
+        n_complete = len(body) if final else body.rfind(b"\n") + 1
+        body = body[:n_complete]
+        self.offset += n_complete
+
+        plot_data = parse_plot_rows(body.decode(), self.headers, self.filename)
+
+        # rename headers to field names
+        new_rows = ordered_bunch()
+        for name, values in zip(self.names, plot_data.values()):
+            new_rows[name] = values
+        if new_rows:
+            self.n_rows += len(new_rows[self.names[0]])
+
+        return new_rows
+
+    def read(self, process=None, interval=1.0):
+        """history = SU2.io.HistoryReader.read(process=None,interval=1.0)
+        returns an ordered bunch of all the rows not read yet, as
+        SU2.io.read_history() does. With a process, see follow(), the
+        rows are parsed while it runs, polling every interval seconds,
+        and the method returns once it has finished.
+        """
+
+        chunks = []
+        while True:
+            running = process is not None and process.poll() is None
+            new_rows = self.poll(final=not running)
+            if new_rows:
+                chunks.append(new_rows)
+            if not running:
+                break
+            time.sleep(interval)
+
+        history = ordered_bunch()
+        for name in self.names or []:
+            history[name] = np.concatenate(
+                [chunk[name] for chunk in chunks] + [np.empty([0])]
+            )
+
+        return history
+
+    def follow(self, interval=1.0, timeout=None, process=None):
+        """for row in SU2.io.HistoryReader.follow(interval=1.0,timeout=None,process=None)
+        generator that streams history rows as they are appended,
+        each row is an ordered bunch of floats.
+
+        Inputs:
+            interval - seconds to wait between polls
+            timeout  - optional, stop after this many seconds without new rows
+            process  - optional, object with a poll() method returning None
+                       while running (ie subprocess.Popen), streaming stops
+                       once it has finished and all rows were read
+        """
+
+        last_data = time.time()
+
+        while True:
+            new_rows = self.poll()
+            n_new = len(new_rows[self.names[0]]) if new_rows else 0
+
+            for i_row in range(n_new):
+                row = ordered_bunch()
+                for name, values in new_rows.items():
+                    row[name] = float(values[i_row])
+                yield row
+
+            if n_new:
+                last_data = time.time()
+                continue
+
+            if process is not None and process.poll() is not None:
+                # catch rows written just before the process exited
+                if not self.poll_pending():
+                    break
+                continue
+            if timeout is not None and time.time() - last_data > timeout:
+                break
+
+            time.sleep(interval)
+
+    def poll_pending(self):
+        """returns True if the file holds complete rows not yet read"""
+        if not os.path.exists(self.filename) or self.headers is None:
+            return False
+        with open(self.filename, "rb") as plot_file:
+            plot_file.seek(self.offset)
+            return b"\n" in plot_file.read()
+
+    def __repr__(self):
+        return "<HistoryReader> %s, %i rows" % (self.filename, self.n_rows)
+
+
+#: class HistoryReader
@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+
+## \file journal.py
+#  \brief append-only record file for incremental persistence
+#  \version 8.0.1 "Harrier"
+#
+# SU2 Project Website: https://su2code.github.io
+#
+# The SU2 Project is maintained by the SU2 Foundation
+# (http://su2foundation.org)
+#
+# Copyright 2012-2024, SU2 Contributors (cf. AUTHORS.md)
+#
+# SU2 is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# SU2 is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with SU2. If not, see <http://www.gnu.org/licenses/>.
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import os, sys, struct, zlib
+
+if sys.version_info[0] > 2:
+    import pickle
+else:
+    import cPickle as pickle
+
+from .filelock import filelock
+
+# record frame header, magic, length and crc32 of the pickled record
+frame_header = struct.Struct("<4sQI")
+frame_magic = b"SU2J"
+
+# -------------------------------------------------------------------
+#  Journal Class
+# -------------------------------------------------------------------
+
+
+class Journal(object):
+    """journal = SU2.io.Journal(filename)
+
+    Append-only file of pickled records. Appended records are
+    not rewritten, so the cost of saving does not grow with the
+    size of the file. Owners replace records that later ones
+    superseded with an occasional rewrite().
+
+    Example:
+    journal = SU2.io.Journal('designs.log')
+    journal.append([record1, record2])
+    for record in journal.read():
+        print(record)
+    journal.rewrite([record2])
+
+    Inputs:
+        filename - journal file name, absolute or relative
+                   to the working folder
+
+    Notes:
+        Appends hold an exclusive file lock, reads a shared one.
+        Each record is framed with its length and checksum. A
+        record left incomplete by a process that died while
+        appending is ignored when reading, and cut off by the
+        next append, so the records after it are kept.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self._end = None  # file size after our last append
+
+    def append(self, records):
+        """SU2.io.Journal.append(records)
+        appends a list of records to the journal
+        """
+
+        if not records:
+            return
+
+        frames = _pack(records)
+
+        with filelock(self.filename):
+            with open(self.filename, "ab") as journal_file:
+                end = journal_file.seek(0, os.SEEK_END)
+                # skip the scan if nobody appended since our last append
+                if end != self._end:
+                    with open(self.filename, "rb") as scan_file:
+                        end = _valid_end(scan_file)
+                    journal_file.truncate(end)
+                    journal_file.seek(end)
+                journal_file.write(frames)
+                journal_file.flush()
+                self._end = journal_file.tell()
+
+    def rewrite(self, records):
+        """SU2.io.Journal.rewrite(records)
+        replaces the journal with a list of records, the new
+        file is written aside and moved in place, so readers
+        find either the old or the new records
+        """
+
+        frames = _pack(records)
+
+        with filelock(self.filename):
+            temp_name = self.filename + ".tmp"
+            with open(temp_name, "wb") as journal_file:
+                journal_file.write(frames)
+                journal_file.flush()
+                os.fsync(journal_file.fileno())
+            os.replace(temp_name, self.filename)
+            self._end = len(frames)
+
+    def read(self):
+        """for record in SU2.io.Journal.read()
+        generator yielding the records in the order they were appended
+        """
+
+        if not os.path.exists(self.filename):
+            return
+
+        with filelock(self.filename, shared=True):
+            with open(self.filename, "rb") as journal_file:
+                records = []
+                for data in _frames(journal_file):
+                    try:
+                        records.append(pickle.loads(data))
+                    except Exception:
+                        break
+
+        for record in records:
+            yield record
+
+    def clear(self):
+        """SU2.io.Journal.clear()
+        removes the journal file
+        """
+        with filelock(self.filename):
+            if os.path.exists(self.filename):
+                os.remove(self.filename)
+        self._end = None
+
+    def __repr__(self):
+        return "<Journal> %s" % self.filename
+
+
+#: class Journal
+
+
+def _pack(records):
+    # pickled and framed records
+    frames = []
+    for record in records:
+        data = pickle.dumps(record, -1)
+        frames.append(
+            frame_header.pack(frame_magic, len(data), zlib.crc32(data) & 0xFFFFFFFF)
+        )
+        frames.append(data)
+    return b"".join(frames)
+
+
+def _frames(journal_file):
+    # yields the data of the complete records, stops at the first
+    # incomplete or corrupted one
+    for position, length, crc in _headers(journal_file):
+        journal_file.seek(position + frame_header.size)
+        data = journal_file.read(length)
+        if zlib.crc32(data) & 0xFFFFFFFF != crc:
+            return
+        yield data
+
+
+def _headers(journal_file):
+    # yields the position, length and crc32 of each complete record
+    size = os.fstat(journal_file.fileno()).st_size
+    position = 0
+    while position + frame_header.size <= size:
+        journal_file.seek(position)
+        magic, length, crc = frame_header.unpack(journal_file.read(frame_header.size))
+        if magic != frame_magic or position + frame_header.size + length > size:
+            return
+        yield position, length, crc
+        position += frame_header.size + length
+
+
+def _valid_end(journal_file):
+    # end of the last complete record, appends cut off what follows
+    # it, so only the last record can be corrupted and is checked
+    end = 0
+    last = None
+    for last in _headers(journal_file):
+        end = last[0] + frame_header.size + last[1]
+    if last is not None:
+        journal_file.seek(last[0] + frame_header.size)
+        if zlib.crc32(journal_file.read(last[1])) & 0xFFFFFFFF != last[2]:
+            end = last[0]
+    return end
@@ -32,6 +32,14 @@
 import os, sys, shutil, copy, glob
 from .tools import add_suffix, make_link, expand_part
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# ioctl request to clone a file on linux (copy-on-write reflink)
+FICLONE = 0x40049409
+
 # -------------------------------------------------------------------
 #  Output Redirection
 # -------------------------------------------------------------------
@@ -129,16 +137,33 @@ class folder(object):
         pull   - list of files to pull (copy to working folder)
         link   - list of files to link (symbolic link in working folder)
         force  - True/False overwrite existing files in working folder
+        stage  - optional, how pull files are staged, default is
+                 the environment variable SU2_STAGING or CLONE:
+                 COPY  - plain copies
+                 CLONE - copy-on-write clones where the file system
+                         supports them (reflink), copies otherwise
+                 LINK  - hard links, clones or copies otherwise,
+                         the staged file is the original file so it
+                         must not be rewritten in place
 
     Targets:
         push   - list of files to push (copy to originating path)
 
+    Attributes:
+        staged - bytes staged by COPY, CLONE and LINK, and bytes
+                 not pushed back (UNCHANGED), of the last redirection
+        totals - class attribute, the same summed over all redirections
+
     Notes:
         push must be appended or extended, not overwritten
+        pushed files that were pulled into the folder and did
+        not change since are not pushed back over their original
         links in Windows not supported, will simply copy
     """
 
-    def __init__(self, folder, pull=None, link=None, force=True):
+    totals = {"COPY": 0, "CLONE": 0, "LINK": 0, "UNCHANGED": 0}
+
+    def __init__(self, folder, pull=None, link=None, force=True, stage=None):
         """folder redirection initialization
         see help( folder ) for more info
         """
@@ -163,6 +188,9 @@ class folder(object):
         self.push = []
         self.link = copy.deepcopy(link)
         self.force = force
+        self.stage = stage or os.environ.get("SU2_STAGING", "CLONE").upper()
+        self.staged = dict.fromkeys(self.totals, 0)
+        self.signatures = {}
 
     def __enter__(self):
 
@@ -196,7 +224,14 @@ class folder(object):
                     os.remove(new_name)
                 else:
                     continue
-            shutil.copy(old_name, new_name)
+            method = stage_file(old_name, new_name, self.stage)
+            self._count(method, os.path.getsize(new_name))
+            # to recognize unchanged files when pushing
+            self.signatures[new_name] = (
+                old_name,
+                file_signature(old_name),
+                file_signature(new_name),
+            )
 
         # make links
         for name in link:
@@ -252,6 +287,9 @@ class folder(object):
             else:
                 if old_name == new_name:
                     continue
+                if self._unchanged(old_name, new_name):
+                    self._count("UNCHANGED", os.path.getsize(old_name))
+                    continue
                 if os.path.exists(new_name):
                     if force:
                         os.remove(new_name)
@@ -262,5 +300,76 @@ class folder(object):
         # change directory
         os.chdir(origin)
 
+    def _count(self, method, size):
+        self.staged[method] += size
+        self.totals[method] += size
+
+    def _unchanged(self, name, origin_name):
+        # pulled from origin_name and neither file changed since
+        if not name in self.signatures:
+            return False
+        source, source_signature, signature = self.signatures[name]
+        return (
+            source == origin_name
+            and file_signature(source) == source_signature
+            and file_signature(name) == signature
+        )
+
+    def __repr__(self):
+        return "<redirect_folder> %s, staged %s" % (self.folder, self.staged)
+
 
 #: class folder()
+
+
+def stage_file(src, dst, stage="CLONE"):
+    """method = SU2.io.redirect.stage_file(src,dst,stage='CLONE')
+    stages src as dst with a hard link (stage LINK), a
+    copy-on-write clone (stage LINK or CLONE) or a copy,
+    whichever works first, returns the method used
+    """
+
+    src = os.path.realpath(src)
+
+    if stage == "LINK":
+        try:
+            os.link(src, dst)
+            return "LINK"
+        except OSError:
+            pass
+
+    if stage in ["LINK", "CLONE"] and clone_file(src, dst):
+        return "CLONE"
+
+    shutil.copy(src, dst)
+    return "COPY"
+
+
+def clone_file(src, dst):
+    """success = SU2.io.redirect.clone_file(src,dst)
+    copy-on-write clone of src, returns False and leaves no
+    dst if the platform or file system does not support it
+    """
+
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return False
+
+    try:
+        with open(src, "rb") as src_file:
+            with open(dst, "wb") as dst_file:
+                fcntl.ioctl(dst_file.fileno(), FICLONE, src_file.fileno())
+    except (IOError, OSError):
+        if os.path.exists(dst):
+            os.remove(dst)
+        return False
+
+    shutil.copymode(src, dst)
+    return True
+
+
+def file_signature(name):
+    """inode, size and modification time of a file, None if missing"""
+    if not os.path.exists(name):
+        return None
+    stat = os.stat(name)
+    return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
@@ -0,0 +1,301 @@
+#!/usr/bin/env python
+
+## \file restart.py
+#  \brief memory mapped reader for SU2 restart and solution files
+#  \version 8.0.1 "Harrier"
+#
+# SU2 Project Website: https://su2code.github.io
+#
+# The SU2 Project is maintained by the SU2 Foundation
+# (http://su2foundation.org)
+#
+# Copyright 2012-2024, SU2 Contributors (cf. AUTHORS.md)
+#
+# SU2 is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# SU2 is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with SU2. If not, see <http://www.gnu.org/licenses/>.
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import os, re, mmap
+import numpy as np
+from ..util import ordered_bunch
+
+# first int of binary restart files, the hex representation of "SU2"
+binary_magic = 535532
+# number of ints in the binary header
+binary_header_ints = 5
+# length of the field names in binary files, as in CGNS
+binary_name_length = 33
+
+# marker points of su2 meshes, by real path, size and modification time
+_marker_points = {}
+
+# -------------------------------------------------------------------
+#  Restart File Class
+# -------------------------------------------------------------------
+
+
+class RestartFile(object):
+    """restart = SU2.io.RestartFile(filename)
+
+    Reads an SU2 restart or solution file, binary (.dat) or
+    ASCII (.csv). Binary files are memory mapped, fields are
+    numpy views into the file and only the pages that are
+    used get read from disk.
+
+    Example:
+    with SU2.io.RestartFile('restart_flow.dat') as restart:
+        print(restart.fields, restart.n_points)
+        density = restart['Density']                  # view, no copy
+        data = restart.read(['x', 'y'], points=slice(0, 1000))
+        for start, chunk in restart.chunks(1000000, ['Pressure']):
+            print(start, chunk.Pressure.max())
+
+    Inputs:
+        filename - restart file name, binary files start with
+                   the SU2 magic number, others are read as ASCII
+
+    Attributes:
+        fields   - field names, without the point index
+        n_points - number of points
+        n_fields - number of fields
+        data     - (n_points, n_fields) array, read-only memory
+                   map for binary files
+        binary   - True for binary files
+
+    Notes:
+        ASCII files are loaded completely, their points are
+        sorted by their PointID.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.binary = is_binaryRestart(filename)
+        if self.binary:
+            self._map_binary()
+        else:
+            self._load_ascii()
+        self.n_points, self.n_fields = self.data.shape
+        self.index = dict([(name, i) for i, name in enumerate(self.fields)])
+
+    def _map_binary(self):
+        header = np.fromfile(self.filename, dtype=np.int32, count=binary_header_ints)
+        n_fields, n_points = int(header[1]), int(header[2])
+
+        names = np.fromfile(
+            self.filename,
+            dtype="S%i" % binary_name_length,
+            count=n_fields,
+            offset=header.nbytes,
+        )
+        self.fields = [name.split(b"\0")[0].decode().strip('"') for name in names]
+
+        offset = header.nbytes + names.nbytes
+        if n_points * n_fields:
+            self.data = np.memmap(
+                self.filename,
+                dtype=np.float64,
+                mode="r",
+                offset=offset,
+                shape=(n_points, n_fields),
+            )
+        else:
+            self.data = np.empty([n_points, n_fields])
+
+    def _load_ascii(self):
+        with open(self.filename) as restart_file:
+            header = restart_file.readline()
+        names = [name.strip().strip('"') for name in header.split(",")]
+        self.fields = names[1:]
+
+        data = np.loadtxt(self.filename, delimiter=",", skiprows=1, ndmin=2)
+        order = np.argsort(data[:, 0], kind="stable")
+        self.data = data[order, 1:]
+        self.data.flags.writeable = False
+
+    def __getitem__(self, name):
+        """values = restart[name]
+        view of the values of a field at all points
+        """
+        return self.data[:, self.index[name]]
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def keys(self):
+        return list(self.fields)
+
+    def read(self, fields=None, points=None):
+        """data = SU2.io.RestartFile.read(fields=None,points=None)
+        returns an ordered bunch of field names and arrays
+        of their values, copied from the file
+
+        Inputs:
+            fields - list of field names, default is all fields
+            points - optional, slice, range or index array of
+                     the points to read, default is all points
+        """
+
+        if fields is None:
+            fields = self.fields
+        if points is None:
+            points = slice(None)
+        elif isinstance(points, range):
+            points = slice(points.start, points.stop, points.step)
+
+        rows = self.data[points]
+
+        data = ordered_bunch()
+        for name in fields:
+            data[name] = np.array(rows[:, self.index[name]])
+
+        return data
+
+    def chunks(self, chunk_size=1000000, fields=None):
+        """for start, data in SU2.io.RestartFile.chunks(chunk_size,fields=None)
+        generator reading the file in blocks of chunk_size points,
+        yields the first point of each block and its data, see read()
+        """
+        for start in range(0, self.n_points, chunk_size):
+            stop = min(start + chunk_size, self.n_points)
+            yield start, self.read(fields, slice(start, stop))
+
+    def close(self):
+        """releases the memory map, views stay valid while referenced"""
+        self.data = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __repr__(self):
+        return "<RestartFile> %s, %i points, %i fields" % (
+            self.filename,
+            self.n_points,
+            self.n_fields,
+        )
+
+
+#: class RestartFile
+
+
+def is_binaryRestart(filename):
+    """binary = SU2.io.restart.is_binaryRestart(filename)
+    True if the file starts with the binary restart magic number
+    """
+    with open(filename, "rb") as restart_file:
+        header = restart_file.read(4)
+    return len(header) == 4 and np.frombuffer(header, np.int32)[0] == binary_magic
+
+
+def write_restart(filename, fields, data):
+    """SU2.io.restart.write_restart(filename,fields,data)
+    writes a binary restart file, ie after interpolating a restart
+
+    Inputs:
+        filename - restart file name
+        fields   - list of field names, without the point index
+        data     - (n_points, n_fields) array, or a dictionary of
+                   field names and arrays of their values
+    """
+
+    if isinstance(data, dict):
+        data = np.column_stack([data[name] for name in fields])
+    data = np.ascontiguousarray(data, dtype=np.float64)
+    n_points, n_fields = data.shape
+    assert n_fields == len(fields), "fields and data do not match"
+
+    header = np.array([binary_magic, n_fields, n_points, 0, 0], dtype=np.int32)
+    names = np.array(
+        [name.encode() for name in fields], dtype="S%i" % binary_name_length
+    )
+
+    with open(filename, "wb") as restart_file:
+        restart_file.write(header.tobytes())
+        restart_file.write(names.tobytes())
+        data.tofile(restart_file)
+
+
+def get_markerPoints(mesh_name, markers):
+    """points = SU2.io.restart.get_markerPoints(mesh_name,markers)
+    sorted global indices of the points on the given markers
+    of an ASCII su2 mesh, ie the rows of the surface in a restart,
+    remembered while the mesh file is unchanged
+
+    Inputs:
+        mesh_name - single zone su2 mesh file name
+        markers   - list of marker tags
+
+    Notes:
+        The mesh is memory mapped and searched for the marker
+        section, the volume elements and points are not parsed.
+    """
+
+    stat = os.stat(mesh_name)
+    mesh_id = (os.path.realpath(mesh_name), stat.st_size, stat.st_mtime)
+    if not mesh_id in _marker_points:
+        _marker_points.clear()
+        _marker_points[mesh_id] = read_markers(mesh_name)
+    mesh_markers = _marker_points[mesh_id]
+
+    for tag in markers:
+        if not tag in mesh_markers:
+            raise Exception("marker %s not found in %s" % (tag, mesh_name))
+
+    points = [mesh_markers[tag] for tag in markers]
+    if not points:
+        return np.empty([0], dtype=np.int64)
+    return np.unique(np.concatenate(points))
+
+
+def read_markers(mesh_name):
+    """markers = SU2.io.restart.read_markers(mesh_name)
+    dictionary of marker tags and the sorted global indices of
+    their points, read from an ASCII su2 mesh
+    """
+
+    markers = {}
+    with open(mesh_name, "rb") as mesh_file:
+        with mmap.mmap(mesh_file.fileno(), 0, access=mmap.ACCESS_READ) as mesh:
+            match = re.search(rb"^\s*NMARK\s*=", mesh, re.M)
+            if match is None:
+                return markers
+            lines = iter(mesh[match.start() :].decode().splitlines())
+
+    tag = None
+    n_elems = 0
+    for line in lines:
+        line = line.split("%")[0].strip()
+        if not line:
+            continue
+        if n_elems:
+            # element type, then its point indices
+            points.extend(line.split()[1:])
+            n_elems -= 1
+            if not n_elems:
+                markers[tag] = np.unique(np.array(points, dtype=np.int64))
+        elif line.startswith("MARKER_TAG"):
+            tag = line.split("=")[1].strip()
+        elif line.startswith("MARKER_ELEMS"):
+            n_elems = int(line.split("=")[1])
+            points = []
+            if not n_elems:
+                markers[tag] = np.empty([0], dtype=np.int64)
+        elif line.startswith("NZONE") or line.startswith("IZONE"):
+            raise Exception("multizone meshes are not supported: %s" % mesh_name)
+
+    return markers
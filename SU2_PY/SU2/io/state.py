@@ -162,6 +162,8 @@ class State(ordered_bunch):
     """
 
     _timestamp = 0
+    # result cache entry and design vector, see SU2.io.ResultCache
+    _cache_entry = None
 
     def update(self, ztate):
         """Updates self given another state"""
@@ -31,8 +31,83 @@
 
 import os
 import shutil, glob
+import numpy as np
 from SU2.util import ordered_bunch
-from .historyMap import history_header_map as historyOutFields
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+# -------------------------------------------------------------------
+#  Lazily Loaded History Field Map
+# -------------------------------------------------------------------
+
+
+class HistoryFieldMap(Mapping):
+    """read-only view of SU2.io.historyMap.history_header_map
+
+    The map is only imported on first access. Along with it, a
+    reverse index from history file headers to field names and
+    the lists of field names per field type are built once.
+    """
+
+    def __init__(self):
+        self._fields = None
+        self._header_index = None
+        self._header_map = None
+        self._type_index = None
+
+    def _load(self):
+        if self._fields is None:
+            from .historyMap import history_header_map
+
+            header_index = {}
+            header_map = {}
+            type_index = {}
+            for field, value in history_header_map.items():
+                # several fields may share a header, the last one wins
+                header_index[value["HEADER"]] = field
+                header_map[field] = value["HEADER"]
+                type_index.setdefault(value["TYPE"], []).append(field)
+
+            self._header_index = header_index
+            self._header_map = header_map
+            self._type_index = type_index
+            self._fields = history_header_map
+        return self._fields
+
+    def __getitem__(self, field):
+        return self._load()[field]
+
+    def __iter__(self):
+        return iter(self._load())
+
+    def __len__(self):
+        return len(self._load())
+
+    def __contains__(self, field):
+        return field in self._load()
+
+    def header_index(self):
+        """returns the dictionary mapping history headers to field names"""
+        self._load()
+        return self._header_index
+
+    def header_map(self):
+        """returns the dictionary mapping field names to history headers"""
+        self._load()
+        return self._header_map
+
+    def fields_of_type(self, field_type):
+        """returns the list of field names of a given TYPE"""
+        self._load()
+        return self._type_index.get(field_type, [])
+
+
+#: class HistoryFieldMap
+
+historyOutFields = HistoryFieldMap()
 
 # -------------------------------------------------------------------
 #  Read SU2_DOT Gradient Values
@@ -68,110 +143,186 @@ def read_gradients(Grad_filename, scale=1.0):
 # -------------------------------------------------------------------
 
 
-def read_plot(filename):
+def read_plot(filename, tail=None):
     """reads a plot file
     returns an ordered bunch with the headers for keys
-    and a list of each header's floats for values.
+    and a float64 numpy array of each header's values.
+
+    Inputs:
+        filename - plot file name (CSV or Tecplot)
+        tail     - optional, number of rows to read from the end of
+                   the file, default reads all rows
     """
 
-    extension = os.path.splitext(filename)[1]
+    # open history file, binary mode to allow seeking from the end
+    plot_file = open(filename, "rb")
+
+    Variables = read_plot_header(plot_file)
+
+    # read all data rows, or only the last ones
+    if tail is None:
+        body = plot_file.read().decode()
+    else:
+        body = _read_tail(plot_file, plot_file.tell(), tail)
+    plot_file.close()
+
+    return parse_plot_rows(body, Variables, filename)
+
 
-    # open history file
-    plot_file = open(filename)
+def read_plot_header(plot_file):
+    """reads the header of an open plot file, leaves the file
+    positioned at the first data row
+    returns the list of variable names
+    """
 
     # title?
-    line = plot_file.readline()
+    line = plot_file.readline().decode()
     if line.startswith("TITLE"):
         title = line.split("=")[1].strip()  # not used right now
-        line = plot_file.readline()
+        line = plot_file.readline().decode()
 
     if line.startswith("VARIABLES"):
-        line = plot_file.readline()
+        line = plot_file.readline().decode()
 
     line = line.split(",")
     Variables = [x.strip().strip('"') for x in line]
-    n_Vars = len(Variables)
-
-    # initialize plot data dictionary
-    plot_data = ordered_bunch.fromkeys(Variables)
-    # must default each value to avoid pointer problems
-    for key in plot_data.keys():
-        plot_data[key] = []
 
-    # zone list
-    zones = []
+    return Variables
 
-    # read all data rows
-    while 1:
-        # read line
-        line = plot_file.readline()
-        if not line:
-            break
 
-        # zone?
-        if line.startswith("ZONE"):
-            zone = line.split("=")[1].strip('" ')
-            zones.append(zone)
-            continue
-
-        # split line
-        line_data = line.strip().split(",")
-        line_data = [float(x.strip()) for x in line_data]
+def parse_plot_rows(body, Variables, filename=""):
+    """parses the text of plot file data rows
+    returns an ordered bunch with the headers for keys
+    and a float64 numpy array of each header's values.
+    """
 
-        # store to dictionary
-        for i_Var in range(n_Vars):
-            this_variable = Variables[i_Var]
-            plot_data[this_variable] = plot_data[this_variable] + [line_data[i_Var]]
+    n_Vars = len(Variables)
 
-    #: for each line
+    # zone list
+    zones = []
+    if "ZONE" in body:
+        lines = []
+        for line in body.splitlines():
+            if line.startswith("ZONE"):
+                zone = line.split("=")[1].strip('" ')
+                zones.append(zone)
+            else:
+                lines.append(line)
+        body = "\n".join(lines)
 
     # check for number of zones
     if len(zones) > 1:
         raise IOError("multiple zones not supported")
 
-    # done
-    plot_file.close()
+    # parse all values at once, one row per line
+    data = np.array(body.replace(",", " ").split(), dtype=np.float64)
+    if data.size % n_Vars:
+        raise IOError("inconsistent number of columns in plot file %s" % filename)
+    data = data.reshape(-1, n_Vars)
+
+    # one contiguous array per column
+    columns = data.T.copy()
+
+    # initialize plot data dictionary
+    plot_data = ordered_bunch()
+    for i_Var, this_variable in enumerate(Variables):
+        plot_data[this_variable] = columns[i_Var]
+
     return plot_data
 
 
+def _read_tail(plot_file, data_start, n_rows, block_size=65536):
+    """reads the text of the last n_rows data lines of an open
+    binary file, without reading before data_start
+    """
+
+    if n_rows <= 0:
+        return ""
+
+    plot_file.seek(0, os.SEEK_END)
+    position = plot_file.tell()
+    buffer = b""
+
+    def data_lines(lines):
+        return [l for l in lines if l.strip() and not l.startswith(b"ZONE")]
+
+    # read blocks backwards until enough complete rows are found,
+    # the first line of the buffer may be incomplete
+    while position > data_start:
+        read_size = min(block_size, position - data_start)
+        position -= read_size
+        plot_file.seek(position)
+        buffer = plot_file.read(read_size) + buffer
+        if len(data_lines(buffer.splitlines()[1:])) >= n_rows:
+            break
+
+    lines = buffer.splitlines()
+    if position > data_start:
+        lines = lines[1:]
+    lines = [l for l in lines if l.strip()]
+
+    # keep the last n_rows data rows, zone lines are filtered by the caller
+    n_data = 0
+    for i_line in range(len(lines) - 1, -1, -1):
+        if not lines[i_line].startswith(b"ZONE"):
+            n_data += 1
+        if n_data == n_rows:
+            lines = lines[i_line:]
+            break
+
+    return "\n".join(l.decode() for l in lines)
+
+
 # -------------------------------------------------------------------
 #  Read All Data from History File
 # -------------------------------------------------------------------
 
 
-def read_history(History_filename, nZones=1):
+def read_history(History_filename, nZones=1, tail=None):
     """reads a history file
     returns an ordered bunch with the history file headers for keys
-    and a list of each header's floats for values.
+    and a float64 numpy array of each header's values.
     if header is an optimization objective, its name is mapped to
     the optimization name.
     Iter and Time(min) headers are mapped to ITERATION and TIME
     respectively.
+    if tail is given, only the last tail rows are read.
     """
 
     # read plot file
-    plot_data = read_plot(History_filename)
+    plot_data = read_plot(History_filename, tail)
+
+    return map_history(plot_data, nZones)
+
+
+#: def read_history()
+
+
+def map_history(plot_data, nZones=1):
+    """maps the headers of plot data to history field names
+    returns a new ordered bunch sharing the values of plot_data
+    """
 
     # initialize history data dictionary
     history_data = ordered_bunch()
+    header_index = historyOutFields.header_index()
 
     # map header names
     for key in plot_data.keys():
         var = key
-        for field in historyOutFields:
-
-            if key == historyOutFields[field]["HEADER"] and nZones == 1:
-                var = field
-
-            if key.split("[")[0] == historyOutFields[field]["HEADER"] and nZones > 1:
-                var = field + "[" + key.split("[")[1]
+        if nZones == 1:
+            var = header_index.get(key, key)
+        else:
+            split_key = key.split("[")
+            if split_key[0] in header_index:
+                var = header_index[split_key[0]] + "[" + split_key[1]
 
         history_data[var] = plot_data[key]
 
     return history_data
 
 
-#: def read_history()
+#: def map_history()
 
 
 # -------------------------------------------------------------------
@@ -181,13 +332,22 @@ def read_history(History_filename, nZones=1):
 
 def get_headerMap(nZones=1):
 
-    headerMap = dict()
-    for outputField in historyOutFields:
-        headerMap[outputField] = historyOutFields[outputField]["HEADER"]
+    # copy, callers may add entries
+    headerMap = dict(historyOutFields.header_map())
 
     return headerMap
 
 
+def get_fieldsOfType(field_type, sort=False):
+    """returns a new list of the history field names of a given TYPE,
+    ie 'COEFFICIENT', in history map order or sorted
+    """
+    names = list(historyOutFields.fields_of_type(field_type))
+    if sort:
+        names.sort()
+    return names
+
+
 def getTurboPerfIndex(nZones=1):
 
     if int(nZones) > 1:
@@ -342,8 +502,8 @@ def read_aerodynamics(
         otherwise returns final value from history file
     """
 
-    # read the history data
-    history_data = read_history(History_filename, nZones)
+    # read the history data, only the final values are needed
+    history_data = read_history(History_filename, nZones, tail=1)
 
     # pull only these functions
     Func_Values = ordered_bunch()
@@ -370,7 +530,7 @@ def read_aerodynamics(
         # for unsteady cases, average time-accurate objective function values
         for key, value in Func_Values.items():
             if historyOutFields[key]["TYPE"] == "COEFFICIENT":
-                if not history_data.get("TAVG_" + key):
+                if not len(history_data.get("TAVG_" + key, [])):
                     raise KeyError(
                         "Key "
                         + historyOutFields["TAVG_" + key]["HEADER"]
@@ -378,7 +538,7 @@ def read_aerodynamics(
                     )
                 Func_Values[key] = history_data["TAVG_" + key][-1]
             elif historyOutFields[key]["TYPE"] == "D_COEFFICIENT":
-                if not history_data.get("TAVG_" + key):
+                if not len(history_data.get("TAVG_" + key, [])):
                     raise KeyError(
                         "Key "
                         + historyOutFields["TAVG_" + key]["HEADER"]
@@ -388,7 +548,7 @@ def read_aerodynamics(
     else:
         # in steady cases take only last value.
         for key, value in Func_Values.iteritems():
-            if not history_data.get(key):
+            if not len(history_data.get(key, [])):
                 raise KeyError(
                     "Key "
                     + historyOutFields[key]["HEADER"]
@@ -924,6 +1084,8 @@ def get_extension(output_format):
         return ".cfg"
     if output_format == "CSV":
         return ".csv"
+    if output_format == "NPZ":
+        return ".npz"
     # otherwise
     raise Exception("Output Format Unknown")
 
@@ -39,6 +39,7 @@ from .. import eval as su2eval
 from .. import util as su2util
 from ..io import redirect_folder
 from ..io import historyOutFields
+from ..util.mp_eval import TaskFailure, worker_ranks
 from warnings import warn, simplefilter
 
 # simplefilter(Warning,'ignore')
@@ -69,6 +70,17 @@ class Project(object):
          designs - list of designs
          folder  - project working folder
          results - project design results
+         index   - index of the design vectors, see DesignIndex
+
+    Persistence:
+        project.pkl holds the project without its designs, which
+        are appended to the journal designs.log when they change,
+        see SU2.io.Journal. Each record holds the config options
+        of a design that differ from the project config, its state
+        and folder. The journal is rewritten with the current designs
+        once it holds more than twice as many records. A loaded
+        project reads the designs from the journal on first use of
+        project.designs.
 
     Methods:
         Optimizer Interface
@@ -91,9 +103,14 @@ class Project(object):
                                         where method is 'CONTINUOUS_ADJOINT' or 'FINDIFF'
         setup config for given dvs with
         config = project.unpack_dvs(dvs)
+
+        Batch Interface
+        evaluate_batch(list_of_dvs,funcs=True,grads=False,jobs=1)
+                     - evaluates several designs concurrently : list[Bunch]
     """
 
     _design_folder = "DESIGNS/DSN_*"
+    _n_records = 0  # records in the journal, see _log_designs()
     _design_number = "%03d"
 
     def __init__(self, config, state=None, designs=None, folder=".", warn=True):
@@ -107,7 +124,7 @@ class Project(object):
         print("New Project: %s" % (folder))
 
         # setup config
-        config = copy.deepcopy(config)
+        config = config.snapshot()
 
         # data_dict creation does not preserve the ordering of the config file.
         # This section ensures that the order of markers and objectives match
@@ -145,13 +162,20 @@ class Project(object):
         self.config = config  # base config
         self.state = state  # base state
         self.files = state.FILES  # base files
-        self.designs = designs  # design list
+        self._designs = designs  # design list, see designs
+        self._logged = {}  # journaled design timestamps
         self.folder = folder  # project folder
         self.results = su2util.ordered_bunch()  # project design results
+        self.results_table = None  # project design results, see ResultsTable
+        self.index = DesignIndex(config)  # design vector index
 
         # output filenames
         self.filename = "project.pkl"
         self.results_filename = "results.pkl"
+        self.journal_filename = "designs.log"
+        self._journal_path = os.path.abspath(
+            os.path.join(folder, self.journal_filename)
+        )
 
         # initialize folder with files
         pull, link = state.pullnlink(config)
@@ -169,8 +193,10 @@ class Project(object):
                 for f in folders:
                     shutil.rmtree(f)
             #: if existing designs
+            self._journal().clear()
 
             # save project
+            self._log_designs()
             su2io.save_data(self.filename, self)
 
         return
@@ -178,7 +204,7 @@ class Project(object):
     def _eval(self, config, func, *args):
         """evalautes a config, checking for existing designs"""
 
-        konfig = copy.deepcopy(config)  # design config
+        konfig = config  # design config, copied only for new designs
         config = self.config  # project config
         state = self.state  # project state
         folder = self.folder  # project folder
@@ -220,6 +246,7 @@ class Project(object):
                 self.plot_results()
 
                 # save data
+                self._log_designs()
                 su2io.save_data(filename, self)
 
             #: if updated
@@ -229,53 +256,153 @@ class Project(object):
         # done, return output
         return vals
 
+    def evaluate_batch(self, list_of_dvs, funcs=True, grads=False, jobs=1):
+        """vals = SU2.opt.Project.evaluate_batch(list_of_dvs,funcs=True,grads=False,jobs=1)
+        evaluates several design vectors concurrently
+
+        Designs are created up front, seeded only from designs that
+        existed before the batch, then evaluated in a SU2.util.mp_eval
+        pool. The project results are compiled and saved once at the end.
+
+        Inputs:
+            list_of_dvs - list of design vectors, or 2D numpy array
+            funcs       - True to evaluate obj_f, con_ceq and con_cieq
+            grads       - True to evaluate obj_df, con_dceq and con_dcieq
+            jobs        - number of designs run simultaneously, NUMBER_PART
+                          is split between them, default is one design
+                          at a time with all of NUMBER_PART
+
+        Outputs:
+            vals - list with a Bunch() for each design vector, keyed by
+                   the evaluated method names, ie vals[i].obj_f, or a
+                   SU2.util.mp_eval.TaskFailure if the design failed
+        """
+
+        config = self.config  # project config
+        state = self.state  # project state
+        folder = self.folder  # project folder
+        filename = self.filename
+
+        methods = []
+        if funcs:
+            methods.extend(["obj_f", "con_ceq", "con_cieq"])
+        if grads:
+            methods.extend(["obj_df", "con_dceq", "con_dcieq"])
+
+        # core budget
+        number_part = config.get("NUMBER_PART", 0)
+        jobs = max(1, min(jobs, len(list_of_dvs)))
+        ranks = max(1, number_part // jobs)
+
+        # check folder
+        assert os.path.exists(folder), "cannot find project folder %s" % folder
+
+        # list project files to pull and link
+        pull, link = state.pullnlink(config)
+
+        # project folder redirection, don't overwrite files
+        with redirect_folder(folder, pull, link, force=False) as push:
+
+            # start designs, seeding only from finished designs
+            n_designs = len(self.designs)
+            i_designs = []
+            i_tasks = []
+            tasks = []
+            for dvs in list_of_dvs:
+                konfig, dvs = self.unpack_dvs(dvs)
+                i_design, delta = self._closest(konfig)
+                if delta != 0.0:
+                    closest, delta = self.closest_design(konfig, n_designs)
+                    self.init_design(konfig, closest)
+                    i_design = len(self.designs) - 1
+                design = self.designs[i_design]
+                if not i_design in i_designs:
+                    i_designs.append(i_design)
+                    tasks.append([design, dvs, methods])
+                    if config.get("CONSOLE", "VERBOSE") == "VERBOSE":
+                        print(os.path.join(self.folder, design.folder))
+                i_tasks.append(i_designs.index(i_design))
+
+            # run designs
+            results = [None] * len(tasks)
+            with su2util.mp_eval(_batch_design, jobs, ranks=ranks) as pool:
+                for i_task, result in pool.imap_unordered(tasks):
+                    if isinstance(result, TaskFailure):
+                        results[i_task] = result
+                        continue
+                    design, vals = result
+                    self.designs[i_designs[i_task]] = design
+                    results[i_task] = vals
+
+            # recompile design results
+            self.compile_results()
+
+            # plot results
+            self.plot_results()
+
+            # save data
+            self._log_designs()
+            su2io.save_data(filename, self)
+
+        #: with redirect folder
+
+        # done, one output per design vector
+        return [results[i_task] for i_task in i_tasks]
+
     def unpack_dvs(self, dvs):
-        dvs = copy.deepcopy(dvs)
-        konfig = copy.deepcopy(self.config)
-        if isinstance(dvs, np.ndarray):
-            dvs = dvs.tolist()
+        dvs = np.ravel(dvs).tolist()
+        konfig = self.config.snapshot()
         konfig.unpack_dvs(dvs)
         return konfig, dvs
 
+    def _find_dvs(self, dvs):
+        """konfig, dvs = project._find_dvs(dvs)
+        like unpack_dvs(), but returns the config of an existing
+        design with the same design vector without copying it
+        """
+        dvs = np.ravel(dvs).tolist()
+        i_design = self._index().find(self._index().scale(dvs))
+        if i_design is not None:
+            return self.designs[i_design].config, dvs
+        return self.unpack_dvs(dvs)
+
     def obj_f(self, dvs):
         func = su2eval.obj_f
-        konfig, dvs = self.unpack_dvs(dvs)
+        konfig, dvs = self._find_dvs(dvs)
         return self._eval(konfig, func, dvs)
 
     def obj_df(self, dvs):
         func = su2eval.obj_df
-        konfig, dvs = self.unpack_dvs(dvs)
+        konfig, dvs = self._find_dvs(dvs)
         return self._eval(konfig, func, dvs)
 
     def con_ceq(self, dvs):
         func = su2eval.con_ceq
-        konfig, dvs = self.unpack_dvs(dvs)
+        konfig, dvs = self._find_dvs(dvs)
         return self._eval(konfig, func, dvs)
 
     def con_dceq(self, dvs):
         func = su2eval.con_dceq
-        konfig, dvs = self.unpack_dvs(dvs)
+        konfig, dvs = self._find_dvs(dvs)
         return self._eval(konfig, func, dvs)
 
     def con_cieq(self, dvs):
         func = su2eval.con_cieq
-        konfig, dvs = self.unpack_dvs(dvs)
+        konfig, dvs = self._find_dvs(dvs)
         return self._eval(konfig, func, dvs)
 
     def con_dcieq(self, dvs):
         func = su2eval.con_dcieq
-        konfig, dvs = self.unpack_dvs(dvs)
+        konfig, dvs = self._find_dvs(dvs)
         return self._eval(konfig, func, dvs)
 
     def func(self, func_name, config):
         func = su2eval.func
-        konfig = copy.deepcopy(config)
-        return self._eval(konfig, func, func_name)
+        return self._eval(config, func, func_name)
 
     def grad(self, func_name, method, config):
         func = su2eval.grad
-        konfig = copy.deepcopy(config)
-        return self._eval(konfig, func, func_name, method)
+        return self._eval(config, func, func_name, method)
 
     def user(self, user_func, config, *args):
         raise NotImplementedError
@@ -284,69 +411,77 @@ class Project(object):
     def add_design(self, config):
         # func = su2eval.touch # hack - TWL
         func = su2eval.skip
-        konfig = copy.deepcopy(config)
-        return self._eval(konfig, func)
+        return self._eval(config, func)
 
     def new_design(self, config):
         """finds an existing design for given config
         or starts a new design with a closest design
         used for restart data
         """
-        # local konfig
-        konfig = copy.deepcopy(config)
         # find closest design
-        closest, delta = self.closest_design(konfig)
+        closest, delta = self.closest_design(config)
         # found existing design
         if delta == 0.0 and closest:
             design = closest
-        # start new design
+        # start new design, copies config
         else:
-            design = self.init_design(konfig, closest)
+            design = self.init_design(config, closest)
         #: if new design
         return design
 
     def get_design(self, config):
-        konfig = copy.deepcopy(config)
-        closest, delta = self.closest_design(konfig)
+        closest, delta = self.closest_design(config)
         if delta == 0.0 and closest:
             design = closest
         else:
             raise Exception("design not found for this config")
         return design
 
-    def closest_design(self, config):
+    def closest_design(self, config, n_designs=None):
         """looks for an existing or closest design
-        given a config
+        given a config, optionally among the first n_designs
         """
 
-        designs = self.designs
-
-        keys_check = ["DV_VALUE_NEW"]
+        i_design, delta = self._closest(config, n_designs)
 
-        if not designs:
+        if i_design is None:
             return [], inf
 
-        diffs = []
-        for this_design in designs:
-            this_config = this_design.config
-            distance = config.dist(this_config, keys_check)
-            diffs.append(distance)
+        return self.designs[i_design], delta
 
-        #: for each design
+    def _closest(self, config, n_designs=None):
+        """returns the position of the closest design in
+        self.designs and its DV_VALUE_NEW distance
+        """
+
+        index = self._index()
+        dv_values = config.get("DV_VALUE_NEW", None)
 
-        # pick closest design
-        i_min = np.argmin(diffs)
-        delta = diffs[i_min]
-        closest = designs[i_min]
+        # exact match
+        i_design = index.find(dv_values)
+        if i_design is not None and (n_designs is None or i_design < n_designs):
+            return i_design, 0.0
 
-        return closest, delta
+        return index.closest(dv_values, n_designs)
+
+    def _index(self):
+        """returns the design vector index, rebuilt if out of
+        sync with the designs, ie for projects saved without it
+        """
+        index = getattr(self, "index", None)
+        if index is None or len(index) != len(self.designs):
+            index = DesignIndex(self.config)
+            for design in self.designs:
+                index.add(design.config.get("DV_VALUE_NEW", None))
+            self.index = index
+        return index
 
     def init_design(self, config, closest=None):
         """starts a new design
         works in project folder
         """
 
-        konfig = copy.deepcopy(config)
+        konfig = config.snapshot()
         ztate = copy.deepcopy(self.state)
         if closest is None:
             closest = []
@@ -392,6 +527,7 @@ class Project(object):
                 design.files[key] = name
 
         # add design to project
+        self._index().add(design.config.get("DV_VALUE_NEW", None))
         self.designs.append(design)
 
         return design
@@ -413,69 +549,25 @@ class Project(object):
             results.HISTORY.DIRECT
             results.HISTORY.ADJOINT_*
 
+        Only designs whose state changed since the last call
+        update their row of the project's ResultsTable, see
+        deep_compile() for a complete rebuild.
         """
 
-        results = su2io.State()
-        results.VARIABLES = []
-        del results.FILES
         filename = self.results_filename
 
-        n_dv = 0
-
-        # populate fields
-        for i, design in enumerate(self.designs):
-            for key in design.state.FUNCTIONS.keys():
-                results.FUNCTIONS[key] = []
-            for key in design.state.GRADIENTS.keys():
-                results.GRADIENTS[key] = []
-            for TYPE in design.state.HISTORY.keys():
-                if not TYPE in results.HISTORY:
-                    results.HISTORY[TYPE] = su2util.ordered_bunch()
-                for key in design.state.HISTORY[TYPE].keys():
-                    results.HISTORY[TYPE][key] = []
-            this_ndv = len(design.state.design_vector())
-
-            # check design vectors are of same length
-            if i == 0:
-                n_dv = this_ndv
-            else:
-                if n_dv != this_ndv:
-                    warn("different dv vector length during compile_results()")
-        #: for each design
-
-        # populate results
-        for design in self.designs:
-            this_designvector = design.state.design_vector()
-            results.VARIABLES.append(this_designvector)
-            for key in results.FUNCTIONS.keys():
-                if key in design.state.FUNCTIONS:
-                    new_func = design.state.FUNCTIONS[key]
-                else:
-                    new_func = default
-                results.FUNCTIONS[key].append(new_func)
-            for key in results.GRADIENTS.keys():
-                if key in design.state.GRADIENTS:
-                    new_grad = design.state.GRADIENTS[key]
-                else:
-                    new_grad = [default] * len(this_designvector)
-                results.GRADIENTS[key].append(new_grad)
-            for TYPE in results.HISTORY.keys():
-                for key in results.HISTORY[TYPE].keys():
-                    if key in results.FUNCTIONS.keys():
-                        new_func = results.FUNCTIONS[key][-1]
-                    elif (
-                        TYPE in design.state.HISTORY.keys()
-                        and key in design.state.HISTORY[TYPE].keys()
-                    ):
-                        new_func = design.state.HISTORY[TYPE][key][-1]
-                    else:
-                        new_func = default
-                    results.HISTORY[TYPE][key].append(new_func)
-        #: for each design
+        table = getattr(self, "results_table", None)
+        if table is None or not table.has_default(default):
+            table = ResultsTable(default)
+            self.results_table = table
+
+        for i_design, design in enumerate(self.designs):
+            if not table.is_current(i_design, design.state):
+                table.update(i_design, design.state)
 
         # save
-        self.results = results
-        su2io.save_data(filename, results)
+        self.results = table.results()
+        su2io.save_data(filename, self.results)
 
         return self.results
 
@@ -493,34 +585,504 @@ class Project(object):
                 design_filename = os.path.join(design.folder, design.filename)
                 self.designs[i_dsn] = su2io.load_data(design_filename)
 
+            self.results_table = None
             self.compile_results()
+            self.plot_results(rewrite=True)
+            self._logged = {}
+            self._log_designs()
             su2io.save_data(self.filename, self)
 
         return
 
-    def plot_results(self):
-        """writes a tecplot file for plotting design results"""
-        output_format = self.config.TABULAR_FORMAT
-        functions = self.results.FUNCTIONS
-        history = self.results.HISTORY
+    def plot_results(self, rewrite=False):
+        """writes a tecplot file for plotting design results
 
-        results_plot = su2util.ordered_bunch()
-        results_plot.EVALUATION = range(1, len(self.designs) + 1)
-        results_plot.update(functions)
-        results_plot.update(history.get("DIRECT", {}))
+        Appends the rows of new designs to the file, and rewrites
+        it from the first design whose results changed since the
+        last call, or completely if its columns changed.
+        """
+        output_format = self.config.TABULAR_FORMAT
+        table = self.results_table
 
         if output_format == "CSV":
-            su2util.write_plot("history_project.csv", output_format, results_plot)
+            plot_name = "history_project.csv"
         else:
-            su2util.write_plot("history_project.dat", output_format, results_plot)
+            plot_name = "history_project.dat"
+
+        # columns
+        results_plot = su2util.ordered_bunch()
+        results_plot.EVALUATION = None
+        results_plot.update(table.functions)
+        results_plot.update(table.history_columns("DIRECT"))
+        keys_plot = list(results_plot.keys())
+
+        # writer of the lines written so far
+        plot = getattr(self, "_plot_writer", None)
+        if (
+            plot is None
+            or plot.filename != os.path.abspath(plot_name)
+            or plot.plot_format != output_format
+        ):
+            plot = su2util.PlotWriter(plot_name, output_format)
+
+        # rows from the first changed one
+        n_rows = table.n_rows
+        results_plot.EVALUATION = np.arange(1, n_rows + 1)
+        for key in keys_plot[1:]:
+            results_plot[key] = results_plot[key][:n_rows]
+
+        start = 0 if rewrite else table.first_changed
+        plot.write(results_plot, start)
+
+        self._plot_writer = plot
+        table.first_changed = n_rows
 
     def save(self):
         with su2io.redirect_folder(self.folder):
+            self._log_designs()
             su2io.save_data(self.filename, self)
 
+    @property
+    def designs(self):
+        """list of designs, read from the journal on first use"""
+        if self._designs is None:
+            self._designs = self._load_designs()
+        return self._designs
+
+    @designs.setter
+    def designs(self, designs):
+        self._designs = designs
+        self._logged = {}
+
+    def _journal(self):
+        """returns the design journal, found next to the
+        working folder if the project folder moved
+        """
+        path = self._journal_path
+        if not os.path.exists(path) and os.path.exists(self.journal_filename):
+            path = os.path.abspath(self.journal_filename)
+        return su2io.Journal(path)
+
+    def _log_designs(self):
+        """appends the designs changed since the last
+        call to the journal, with the project config first,
+        rewrites the journal with only the current designs
+        once most of its records are superseded
+        """
+
+        if self._designs is None:
+            return
+
+        n_changed = 0
+        for i_design, design in enumerate(self._designs):
+            if self._logged.get(i_design, None) != design.state.tic():
+                n_changed += 1
+        n_current = len(self._designs) + 1
+        rewrite = (
+            not "CONFIG" in self._logged or self._n_records + n_changed > 2 * n_current
+        )
+        if rewrite:
+            self._logged = {}
+
+        records = []
+        if not "CONFIG" in self._logged:
+            records.append(["CONFIG", self.config])
+            self._logged = {"CONFIG": None}
+
+        for i_design, design in enumerate(self._designs):
+            timestamp = design.state.tic()
+            if self._logged.get(i_design, None) == timestamp:
+                continue
+            records.append(["DESIGN", i_design, _design_record(design, self.config)])
+            self._logged[i_design] = timestamp
+
+        if rewrite:
+            self._journal().rewrite(records)
+            self._n_records = len(records)
+        else:
+            self._journal().append(records)
+            self._n_records += len(records)
+
+    def _is_logged(self):
+        # True if the journal holds the current designs
+        if self._designs is None:
+            return True
+        if not "CONFIG" in self._logged:
+            return False
+        for i_design, design in enumerate(self._designs):
+            if self._logged.get(i_design, None) != design.state.tic():
+                return False
+        return True
+
+    def _load_designs(self):
+        """reads the designs from the journal,
+        later records of a design replace earlier ones
+        """
+
+        journal = self._journal()
+        base = None
+        records = {}
+        for record in journal.read():
+            if record[0] == "CONFIG":
+                base = record[1]
+            else:
+                records[record[1]] = (base, record[2])
+
+        n_designs = len(self._logged) - 1
+        designs = []
+        for i_design in range(n_designs):
+            if not i_design in records:
+                raise Exception("Design %i not found in %s" % (i_design, journal))
+            designs.append(_record_design(*records[i_design]))
+
+        return designs
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # designs are restored from the journal
+        if self._is_logged():
+            state["_designs"] = None
+        return state
+
+    def __setstate__(self, state):
+        # projects saved with their designs
+        if "designs" in state:
+            state["_designs"] = state.pop("designs")
+            state["_logged"] = {}
+            state["journal_filename"] = "designs.log"
+            state["_journal_path"] = os.path.abspath("designs.log")
+        self.__dict__.update(state)
+
     def __repr__(self):
         return "<Project> with %i <Design>" % len(self.designs)
 
     def __str__(self):
         output = self.__repr__()
         return output
+
+
+#: class Project
+
+
+class DesignIndex(object):
+    """index = SU2.opt.project.DesignIndex(config)
+
+    Index of the design vectors (DV_VALUE_NEW) of a project's designs,
+    stored in insertion order. Exact matches are found with a hash table,
+    closest designs with one vectorized distance computation over a
+    geometrically growing array.
+
+    Inputs:
+        config - project config, for the DEFINITION_DV scales
+
+    Methods:
+        add(dv_values)        - appends a design vector
+        find(dv_values)       - position of an identical vector, or None
+        closest(dv_values, n) - position and distance of the closest of
+                                the first n vectors, or None, inf
+        scale(dvs)            - DV_VALUE_NEW for unscaled dvs, see
+                                SU2.io.Config.unpack_dvs()
+    """
+
+    def __init__(self, config):
+        self.layout = su2io.config.get_dvLayout(config.get("DEFINITION_DV"))
+        self.keys = {}
+        self.vectors = np.empty([0, self.layout.n_dv])
+        self.positions = np.empty([0], dtype=int)
+        self.n_vectors = 0
+        self.n_designs = 0
+
+    def scale(self, dvs):
+        if len(dvs) != self.layout.n_dv:
+            return None
+        return self.layout.scale(dvs).tolist()
+
+    def add(self, dv_values):
+        """appends the design vector of the next design"""
+
+        key = _dv_key(dv_values)
+        # first design wins, like the linear search
+        if not key in self.keys:
+            self.keys[key] = self.n_designs
+
+        # only vectors of the expected length have a distance
+        if dv_values is not None and len(dv_values) == self.layout.n_dv:
+            if self.n_vectors == self.vectors.shape[0]:
+                n_new = max(16, 2 * self.n_vectors)
+                vectors = np.empty([n_new, self.layout.n_dv])
+                vectors[: self.n_vectors] = self.vectors[: self.n_vectors]
+                positions = np.empty([n_new], dtype=int)
+                positions[: self.n_vectors] = self.positions[: self.n_vectors]
+                self.vectors = vectors
+                self.positions = positions
+            self.vectors[self.n_vectors] = dv_values
+            self.positions[self.n_vectors] = self.n_designs
+            self.n_vectors += 1
+
+        self.n_designs += 1
+
+    def find(self, dv_values):
+        """returns the position of the first design with
+        this design vector, or None
+        """
+        return self.keys.get(_dv_key(dv_values), None)
+
+    def closest(self, dv_values, n_designs=None):
+        """returns the position of the closest design and
+        its distance, or None, inf if there is none
+        """
+
+        if dv_values is None or len(dv_values) != self.layout.n_dv:
+            return None, inf
+
+        n_vectors = self.n_vectors
+        if n_designs is not None:
+            n_vectors = np.searchsorted(self.positions[:n_vectors], n_designs)
+        if n_vectors == 0:
+            return None, inf
+
+        diffs = self.vectors[:n_vectors] - np.array(dv_values, dtype=float)
+        distances = np.sqrt(np.sum(diffs**2, axis=1))
+        i_min = np.argmin(distances)
+
+        return int(self.positions[i_min]), float(distances[i_min])
+
+    def __len__(self):
+        return self.n_designs
+
+    def __repr__(self):
+        return "<DesignIndex> %i designs" % self.n_designs
+
+
+#: class DesignIndex
+
+
+class ResultsTable(object):
+    """table = SU2.opt.project.ResultsTable(default=np.nan)
+
+    Results of a project's designs, one row per design. Function
+    and history values are kept in numpy columns that grow
+    geometrically, so updating the row of a design does not
+    touch the other designs.
+
+    Inputs:
+        default - value for missing values
+
+    Attributes:
+        n_rows        - number of designs
+        variables     - design vector of each design
+        functions     - ordered bunch of function value columns
+        gradients     - ordered bunch of lists of gradients
+        history       - ordered bunch by history type, of ordered
+                        bunches of last history value columns,
+                        see history_columns()
+        first_changed - first row changed since the last plot,
+                        see Project.plot_results()
+
+    Methods:
+        update(i_row, state)     - sets or appends the row of a design
+        is_current(i_row, state) - True if the row is up to date
+        results()                - results as compiled by
+                                   Project.compile_results()
+    """
+
+    def __init__(self, default=np.nan):
+        self.default = default
+        self.n_rows = 0
+        self.capacity = 0
+        self.timestamps = []
+        self.variables = []
+        self.functions = su2util.ordered_bunch()
+        self.gradients = su2util.ordered_bunch()
+        self.history = su2util.ordered_bunch()
+        self.first_changed = 0
+
+    def has_default(self, default):
+        if self.default == default:
+            return True
+        # nan defaults compare unequal
+        return (
+            isinstance(default, float)
+            and isinstance(self.default, float)
+            and np.isnan(self.default)
+            and np.isnan(default)
+        )
+
+    def is_current(self, i_row, state):
+        return i_row < self.n_rows and self.timestamps[i_row] == state.tic()
+
+    def update(self, i_row, state):
+        """sets the row of a design, appends it if i_row is n_rows"""
+
+        design_vector = state.design_vector()
+        if self.n_rows and len(design_vector) != len(self.variables[0]):
+            warn("different dv vector length during compile_results()")
+
+        if i_row == self.n_rows:
+            self._append()
+
+        self.variables[i_row] = design_vector
+        self.timestamps[i_row] = state.tic()
+        self.first_changed = min(self.first_changed, i_row)
+
+        for key, value in state.FUNCTIONS.items():
+            self._column(self.functions, key)[i_row] = value
+
+        for key, value in state.GRADIENTS.items():
+            if not key in self.gradients:
+                self.gradients[key] = [None] * self.n_rows
+            self.gradients[key][i_row] = value
+
+        for TYPE in state.HISTORY.keys():
+            if not TYPE in self.history:
+                self.history[TYPE] = su2util.ordered_bunch()
+            for key, values in state.HISTORY[TYPE].items():
+                if len(values):
+                    self._column(self.history[TYPE], key)[i_row] = values[-1]
+
+    def results(self):
+        """results = SU2.opt.project.ResultsTable.results()
+        returns the results as lists, see Project.compile_results()
+        """
+
+        n_rows = self.n_rows
+
+        results = su2io.State()
+        del results.FILES
+        results.VARIABLES = list(self.variables)
+        for key, column in self.functions.items():
+            results.FUNCTIONS[key] = column[:n_rows].tolist()
+        for key, grads in self.gradients.items():
+            results.GRADIENTS[key] = [
+                [self.default] * len(dvs) if grad is None else grad
+                for dvs, grad in zip(self.variables, grads)
+            ]
+        for TYPE in self.history.keys():
+            results.HISTORY[TYPE] = su2util.ordered_bunch()
+            for key, column in self.history_columns(TYPE).items():
+                results.HISTORY[TYPE][key] = column[:n_rows].tolist()
+
+        return results
+
+    def history_columns(self, TYPE):
+        """columns = SU2.opt.project.ResultsTable.history_columns(TYPE)
+        last history values of a history type, the function
+        values for history fields that are also functions
+        """
+        columns = su2util.ordered_bunch()
+        for key, column in self.history.get(TYPE, {}).items():
+            columns[key] = self.functions.get(key, column)
+        return columns
+
+    def _column(self, columns, key):
+        # new columns are missing for earlier rows
+        if not key in columns:
+            columns[key] = np.full(self.capacity, self.default, dtype=float)
+        return columns[key]
+
+    def _append(self):
+        if self.n_rows == self.capacity:
+            self.capacity = max(16, 2 * self.capacity)
+            for columns in [self.functions] + list(self.history.values()):
+                for key, column in columns.items():
+                    grown = np.full(self.capacity, self.default, dtype=float)
+                    grown[: self.n_rows] = column[: self.n_rows]
+                    columns[key] = grown
+        self.n_rows += 1
+        self.timestamps.append(None)
+        self.variables.append(None)
+        for grads in self.gradients.values():
+            grads.append(None)
+
+    def __len__(self):
+        return self.n_rows
+
+    def __repr__(self):
+        return "<ResultsTable> %i designs" % self.n_rows
+
+
+#: class ResultsTable
+
+
+def _dv_key(dv_values):
+    if dv_values is None:
+        return None
+    return tuple(float(value) for value in dv_values)
+
+
+def _batch_design(design, dvs, methods):
+    """design, vals = _batch_design(design,dvs,methods)
+    evaluates the methods of one design for
+    Project.evaluate_batch(), in a worker process
+    """
+
+    config = design.config
+    number_part = config.get("NUMBER_PART", 0)
+
+    # core budget of this design, unless run serially
+    ranks = worker_ranks() if number_part > 0 else None
+    if ranks:
+        config["NUMBER_PART"] = ranks
+
+    vals = su2util.ordered_bunch()
+    try:
+        for method in methods:
+            vals[method] = getattr(design, method)(dvs)
+    finally:
+        if ranks:
+            config["NUMBER_PART"] = number_part
+
+    return design, vals
+
+
+#: def _batch_design()
+
+
+def _design_record(design, base):
+    """record = _design_record(design,base)
+    journal record of a design, with the config
+    options that differ from the base config
+    """
+
+    config = design.config
+
+    delta = su2util.ordered_bunch()
+    for key in config.keys():
+        value = su2io.config.get_value(config, key)
+        if not key in base or not su2io.config.same_value(
+            value, su2io.config.get_value(base, key)
+        ):
+            delta[key] = value
+    deleted = [key for key in base.keys() if not key in config]
+
+    record = su2util.ordered_bunch()
+    record.CONFIG = delta
+    record.DELETED = deleted
+    record.STATE = design.state
+    record.FOLDER = design.folder
+    record.FILENAME = design.filename
+
+    return record
+
+
+def _record_design(base, record):
+    """design = _record_design(base,record)
+    restores a design from its journal record
+    """
+
+    config = base.snapshot()
+    for key in record.DELETED:
+        del config[key]
+    for key, value in record.CONFIG.items():
+        config[key] = value
+
+    design = su2eval.Design.__new__(su2eval.Design)
+    design.config = config
+    design.state = record.STATE
+    design.files = record.STATE.FILES
+    design.funcs = record.STATE.FUNCTIONS
+    design.grads = record.STATE.GRADIENTS
+    design.folder = record.FOLDER
+    design.filename = record.FILENAME
+
+    return design
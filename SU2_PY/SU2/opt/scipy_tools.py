@@ -91,12 +91,7 @@ def scipy_slsqp(project, x0=None, xb=None, its=100, accu=1e-10, grads=True):
         x0 = [0.0] * n_dv
 
     # prescale x0
-    dv_scales = project.config["DEFINITION_DV"]["SCALE"]
-    k = 0
-    for i, dv_scl in enumerate(dv_scales):
-        for j in range(dv_size[i]):
-            x0[k] = x0[k] / dv_scl
-            k = k + 1
+    x0 = project.config.dv_layout().unscale(x0).tolist()
 
     # scale accuracy
     obj = project.config["OPT_OBJECTIVE"]
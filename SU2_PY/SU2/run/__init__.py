@@ -1,6 +1,6 @@
 # SU2/run/__init__.py
 
-from .interface import build_command, run_command, CFD, DEF, DOT, SOL, SOL_FSI
+from .interface import build_command, run_command, Job, CFD, DEF, DOT, GEO, SOL, SOL_FSI
 
 from .direct import direct
 from .adjoint import adjoint
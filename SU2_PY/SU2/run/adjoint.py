@@ -29,11 +29,10 @@
 #  Imports
 # ----------------------------------------------------------------------
 
-import copy
 
 from .. import io as su2io
 from .merge import merge as su2merge
-from .interface import CFD as SU2_CFD
+from .direct import run_history
 
 # ----------------------------------------------------------------------
 #  Adjoint Simulation
@@ -66,7 +65,7 @@ def adjoint(config):
     """
 
     # local copy
-    konfig = copy.deepcopy(config)
+    konfig = config.snapshot()
 
     # setup problem
     if konfig.get("GRADIENT_METHOD", "CONTINUOUS_ADJOINT") == "DISCRETE_ADJOINT":
@@ -76,22 +75,20 @@ def adjoint(config):
 
     konfig["CONV_FILENAME"] = konfig["CONV_FILENAME"] + "_adjoint"
 
-    # Run Solution
-    SU2_CFD(konfig)
+    # filenames
+    plot_format = konfig.get("TABULAR_FORMAT", "CSV")
+    plot_extension = su2io.get_extension(plot_format)
+    history_filename = konfig["CONV_FILENAME"] + plot_extension
+
+    # Run Solution, reading the history while it is written
+    history = run_history(konfig, history_filename)
 
     # merge
     konfig["SOLUTION_ADJ_FILENAME"] = konfig["RESTART_ADJ_FILENAME"]
     su2merge(konfig)
 
-    # filenames
-    plot_format = konfig.get("TABULAR_FORMAT", "CSV")
-    plot_extension = su2io.get_extension(plot_format)
-    history_filename = konfig["CONV_FILENAME"] + plot_extension
     special_cases = su2io.get_specialCases(konfig)
 
-    # get history
-    history = su2io.read_history(history_filename, config.NZONES)
-
     # update super config
     config.update(
         {
@@ -29,7 +29,6 @@
 #  Imports
 # ----------------------------------------------------------------------
 
-import copy
 
 from .. import io as su2io
 from .interface import DEF as SU2_DEF
@@ -75,7 +74,7 @@ def deform(config, dv_new=None, dv_old=None):
         raise Exception("must provide dv_old with dv_new")
 
     # local copy
-    konfig = copy.deepcopy(config)
+    konfig = config.snapshot()
 
     # unpack design variables
     if dv_new:
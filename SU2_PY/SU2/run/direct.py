@@ -29,8 +29,7 @@
 #  Imports
 # ----------------------------------------------------------------------
 
-import copy
-
+import os
 from .. import io as su2io
 from .merge import merge as su2merge
 from .interface import CFD as SU2_CFD
@@ -66,7 +65,7 @@ def direct(config):
     """
 
     # local copy
-    konfig = copy.deepcopy(config)
+    konfig = config.snapshot()
 
     # setup direct problem
     konfig["MATH_PROBLEM"] = "DIRECT"
@@ -74,34 +73,34 @@ def direct(config):
 
     direct_diff = konfig.get("DIRECT_DIFF", "NO") == "YES"
 
-    # Run Solution
-    SU2_CFD(konfig)
-
-    # multizone cases
-    multizone_cases = su2io.get_multizone(konfig)
-
-    # merge
-    konfig["SOLUTION_FILENAME"] = konfig["RESTART_FILENAME"]
-    if "FLUID_STRUCTURE_INTERACTION" in multizone_cases:
-        konfig["SOLUTION_FILENAME"] = konfig["RESTART_FILENAME"]
-
     # filenames
     plot_format = konfig.get("TABULAR_FORMAT", "CSV")
     plot_extension = su2io.get_extension(plot_format)
 
+    # master cfg is always config_CFD. Hardcoded names are prob nt ideal.
+    conv_filename = konfig["CONV_FILENAME"]
+    if konfig.get("CONFIG_LIST", []) != []:
+        conv_filename = "config_CFD"
+
     # adapt the history_filename, if a restart solution is chosen
     # check for 'RESTART_ITER' is to avoid forced restart situation in "compute_polar.py"...
     if konfig.get("RESTART_SOL", "NO") == "YES" and konfig.get("RESTART_ITER", 1) != 1:
-        if konfig.get("CONFIG_LIST", []) != []:
-            konfig[
-                "CONV_FILENAME"
-            ] = "config_CFD"  # master cfg is always config_CFD. Hardcoded names are prob nt ideal.
         restart_iter = "_" + str(konfig["RESTART_ITER"]).zfill(5)
-        history_filename = konfig["CONV_FILENAME"] + restart_iter + plot_extension
+        history_filename = conv_filename + restart_iter + plot_extension
     else:
-        if konfig.get("CONFIG_LIST", []) != []:
-            konfig["CONV_FILENAME"] = "config_CFD"
-        history_filename = konfig["CONV_FILENAME"] + plot_extension
+        history_filename = conv_filename + plot_extension
+
+    # Run Solution, reading the history while it is written
+    history = run_history(konfig, history_filename)
+    konfig["CONV_FILENAME"] = conv_filename
+
+    # multizone cases
+    multizone_cases = su2io.get_multizone(konfig)
+
+    # merge
+    konfig["SOLUTION_FILENAME"] = konfig["RESTART_FILENAME"]
+    if "FLUID_STRUCTURE_INTERACTION" in multizone_cases:
+        konfig["SOLUTION_FILENAME"] = konfig["RESTART_FILENAME"]
 
     special_cases = su2io.get_specialCases(konfig)
 
@@ -110,8 +109,7 @@ def direct(config):
     # get chosen windowing function, default is square
     wnd_fct = config.get("WINDOW_FUNCTION", "SQUARE")
 
-    # get history and objectives
-    history = su2io.read_history(history_filename, config.NZONES)
+    # get objectives
     aerodynamics = su2io.read_aerodynamics(
         history_filename, config.NZONES, special_cases, final_avg, wnd_fct
     )
@@ -152,3 +150,40 @@ def direct(config):
     su2merge(konfig)
 
     return info
+
+
+#: def direct()
+
+
+def run_history(config, history_filename):
+    """history = run_history(config,history_filename)
+    runs SU2_CFD and reads its history file while it is written,
+    with SU2.io.HistoryReader, so only the last rows are left to
+    parse once the solver has finished
+
+    Outputs:
+        history - ordered bunch of the history, see SU2.io.read_history()
+    """
+
+    # a history left by an earlier run would be followed instead
+    if os.path.exists(history_filename):
+        os.remove(history_filename)
+
+    reader = su2io.HistoryReader(history_filename, config.NZONES)
+    job = SU2_CFD(config, wait=False)
+    try:
+        history = reader.read(process=job)
+    except BaseException:
+        # the solver would keep running and writing into the folder
+        job.cancel()
+        raise
+    job.result()
+
+    # raises like read_history() if the solver did not write the header
+    if reader.names is None:
+        history = su2io.read_history(history_filename, config.NZONES)
+
+    return history
+
+
+#: def run_history()
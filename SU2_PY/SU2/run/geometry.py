@@ -29,7 +29,6 @@
 #  Imports
 # ----------------------------------------------------------------------
 
-import copy
 
 from .. import io as su2io
 from .interface import GEO as SU2_GEO
@@ -66,7 +65,7 @@ def geometry(config, step=1e-3):
     """
 
     # local copy
-    konfig = copy.deepcopy(config)
+    konfig = config.snapshot()
 
     # unpack
     function_name = konfig["GEO_PARAM"]
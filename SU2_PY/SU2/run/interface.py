@@ -30,7 +30,8 @@
 # ----------------------------------------------------------------------
 
 import os, sys, shutil, copy
-import subprocess
+import subprocess, threading, signal, asyncio
+from concurrent import futures
 from ..io import Config
 from ..util import which
 
@@ -70,16 +71,21 @@ return_code_map = {
     2: DivergenceFailure,
 }
 
+# jobs of this process still running, see cancel_jobs()
+_running_jobs = set()
+
 # ------------------------------------------------------------
 #  SU2 Suite Interface Functions
 # ------------------------------------------------------------
 
 
-def CFD(config):
+def CFD(config, wait=True, timeout=None, output=None):
     """run SU2_CFD
     partitions set by config.NUMBER_PART
+    returns a Job handle instead of waiting if wait is False,
+    see run_command() for timeout and output
     """
-    konfig = copy.deepcopy(config)
+    konfig = config.snapshot()
 
     direct_diff = not konfig.get("DIRECT_DIFF", "") in ["NONE", ""]
 
@@ -111,19 +117,22 @@ def CFD(config):
         the_Command = "SU2_CFD%s %s" % (quote, tempname)
 
     the_Command = build_command(the_Command, processes)
-    run_command(the_Command)
+    job = run_command(the_Command, wait, timeout, output)
 
     # os.remove(tempname)
 
+    if not wait:
+        return job
     return
 
 
-def DEF(config):
+def DEF(config, wait=True, timeout=None, output=None):
     """run SU2_DEF
     partitions set by config.NUMBER_PART
     forced to run in serial, expects merged mesh input
+    returns a Job handle instead of waiting if wait is False
     """
-    konfig = copy.deepcopy(config)
+    konfig = config.snapshot()
 
     tempname = "config_DEF.cfg"
     konfig.dump(tempname)
@@ -133,18 +142,21 @@ def DEF(config):
 
     the_Command = "SU2_DEF%s %s" % (quote, tempname)
     the_Command = build_command(the_Command, processes)
-    run_command(the_Command)
+    job = run_command(the_Command, wait, timeout, output)
 
     # os.remove(tempname)
 
+    if not wait:
+        return job
     return
 
 
-def DOT(config):
+def DOT(config, wait=True, timeout=None, output=None):
     """run SU2_DOT
     partitions set by config.NUMBER_PART
+    returns a Job handle instead of waiting if wait is False
     """
-    konfig = copy.deepcopy(config)
+    konfig = config.snapshot()
 
     auto_diff = (
         konfig.MATH_PROBLEM == "DISCRETE_ADJOINT"
@@ -169,19 +181,22 @@ def DOT(config):
         the_Command = "SU2_DOT%s %s" % (quote, tempname)
 
     the_Command = build_command(the_Command, processes)
-    run_command(the_Command)
+    job = run_command(the_Command, wait, timeout, output)
 
     # os.remove(tempname)
 
+    if not wait:
+        return job
     return
 
 
-def GEO(config):
+def GEO(config, wait=True, timeout=None, output=None):
     """run SU2_GEO
     partitions set by config.NUMBER_PART
     forced to run in serial
+    returns a Job handle instead of waiting if wait is False
     """
-    konfig = copy.deepcopy(config)
+    konfig = config.snapshot()
 
     tempname = "config_GEO.cfg"
     konfig.dump(tempname)
@@ -191,19 +206,22 @@ def GEO(config):
 
     the_Command = "SU2_GEO%s %s" % (quote, tempname)
     the_Command = build_command(the_Command, processes)
-    run_command(the_Command)
+    job = run_command(the_Command, wait, timeout, output)
 
     # os.remove(tempname)
 
+    if not wait:
+        return job
     return
 
 
-def SOL(config):
+def SOL(config, wait=True, timeout=None, output=None):
     """run SU2_SOL
     partitions set by config.NUMBER_PART
+    returns a Job handle instead of waiting if wait is False
     """
 
-    konfig = copy.deepcopy(config)
+    konfig = config.snapshot()
 
     tempname = "config_SOL.cfg"
     konfig.dump(tempname)
@@ -213,19 +231,22 @@ def SOL(config):
 
     the_Command = "SU2_SOL%s %s" % (quote, tempname)
     the_Command = build_command(the_Command, processes)
-    run_command(the_Command)
+    job = run_command(the_Command, wait, timeout, output)
 
     # os.remove(tempname)
 
+    if not wait:
+        return job
     return
 
 
-def SOL_FSI(config):
+def SOL_FSI(config, wait=True, timeout=None, output=None):
     """run SU2_SOL for FSI problems
     partitions set by config.NUMBER_PART
+    returns a Job handle instead of waiting if wait is False
     """
 
-    konfig = copy.deepcopy(config)
+    konfig = config.snapshot()
 
     tempname = "config_SOL.cfg"
     konfig.dump(tempname)
@@ -235,10 +256,12 @@ def SOL_FSI(config):
 
     the_Command = "SU2_SOL%s %s 2" % (quote, tempname)
     the_Command = build_command(the_Command, processes)
-    run_command(the_Command)
+    job = run_command(the_Command, wait, timeout, output)
 
     # os.remove(tempname)
 
+    if not wait:
+        return job
     return
 
 
@@ -257,18 +280,244 @@ def build_command(the_Command, processes=0):
     return the_Command
 
 
-def run_command(Command):
+def run_command(Command, wait=True, timeout=None, output=None):
     """runs os command with subprocess
     checks for errors from command
+
+    Inputs:
+        Command - shell command
+        wait    - True to block until the command finished and return
+                  its return code, False to return a Job handle
+        timeout - optional, seconds after which the command is terminated
+        output  - optional, function called with each line of stdout
     """
 
-    sys.stdout.flush()
+    job = Job(Command, timeout, output)
 
-    proc = subprocess.Popen(
-        Command, shell=True, stdout=sys.stdout, stderr=subprocess.PIPE
-    )
-    return_code = proc.wait()
-    message = proc.stderr.read().decode()
+    if not wait:
+        return job
+
+    return job.result()
+
+
+#: def run_command()
+
+
+def cancel_jobs():
+    """SU2.run.interface.cancel_jobs()
+    terminates all jobs still running in this process,
+    ie before a worker process of SU2.util.mp_eval exits
+    """
+    for job in list(_running_jobs):
+        job.cancel()
+
+
+#: def cancel_jobs()
+
+
+class Job(object):
+    """job = SU2.run.Job(Command,timeout=None,output=None)
+
+    Handle of an os command running in the background, usually
+    returned by SU2.run.CFD(config,wait=False) and the like.
+    The command starts in the current folder when the job is created.
+
+    stdout is streamed line by line to the sys.stdout in place at
+    launch, keep any output redirection open until the job is done.
+    stderr is collected while the command runs.
+
+    Example:
+    job = SU2.run.CFD(config, wait=False)
+    # ... other work ...
+    job.result()          # blocks, raises like SU2.run.run_command()
+    # or, in a coroutine
+    await job
+
+    Inputs:
+        Command - shell command
+        timeout - optional, seconds after which the command is terminated
+                  and subprocess.TimeoutExpired is raised
+        output  - optional, function called with each line of stdout
+
+    Attributes:
+        future  - concurrent.futures.Future of the return code
+        process - the subprocess.Popen object
+
+    Methods:
+        result(timeout=None) - waits, returns 0 or raises the mapped error
+        done()               - True once the command has finished
+        poll()               - None while running, else the return code
+        cancel()             - terminates the command
+        add_done_callback()  - see concurrent.futures.Future
+    """
+
+    def __init__(self, Command, timeout=None, output=None):
+
+        self.Command = Command
+        self.path = os.path.abspath(",")
+        self.timeout = timeout
+        self.output = output
+        self.stdout = sys.stdout
+        self.stderr = []
+        self.future = futures.Future()
+        self._cancelled = False
+
+        sys.stdout.flush()
+
+        # own process group, so a cancel also reaches the mpi ranks
+        self.process = subprocess.Popen(
+            Command,
+            shell=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            start_new_session=sys.platform != "win32",
+        )
+        _running_jobs.add(self)
+
+        # cancelling the future, ie from asyncio, stops the command
+        self.future.add_done_callback(self._on_done)
+
+        # drain both pipes, a full pipe would stall the command
+        self._readers = [
+            threading.Thread(target=self._read_stdout),
+            threading.Thread(target=self._read_stderr),
+        ]
+        for reader in self._readers:
+            reader.daemon = True
+            reader.start()
+
+        watcher = threading.Thread(target=self._watch)
+        watcher.daemon = True
+        watcher.start()
+
+    def _read_stdout(self):
+        for line in iter(self.process.stdout.readline, b""):
+            line = line.decode(errors="replace")
+            self.stdout.write(line)
+            self.stdout.flush()
+            if self.output is not None:
+                self.output(line)
+        self.process.stdout.close()
+
+    def _read_stderr(self):
+        for line in iter(self.process.stderr.readline, b""):
+            self.stderr.append(line.decode(errors="replace"))
+        self.process.stderr.close()
+
+    def _watch(self):
+
+        proc = self.process
+        try:
+            return_code = proc.wait(self.timeout)
+            timed_out = False
+        except subprocess.TimeoutExpired:
+            self._terminate()
+            return_code = proc.wait()
+            timed_out = True
+
+        _running_jobs.discard(self)
+
+        for reader in self._readers:
+            reader.join()
+        message = "".join(self.stderr)
+
+        if self._cancelled:
+            self.future.cancel()
+            return
+
+        # a cancel may race with the exit of the command,
+        # once running the future can not be cancelled anymore
+        if not self.future.set_running_or_notify_cancel():
+            return
+
+        if timed_out:
+            self.future.set_exception(
+                subprocess.TimeoutExpired(self.Command, self.timeout, stderr=message)
+            )
+            return
+
+        try:
+            check_return_code(return_code, message, self.Command, self.path)
+        except BaseException as exception:
+            self.future.set_exception(exception)
+            return
+
+        self.stdout.write(message)
+        self.future.set_result(return_code)
+
+    def result(self, timeout=None):
+        """return_code = job.result(timeout=None)
+        waits for the command and returns its return code, raises
+        the error mapped by return_code_map if it failed,
+        concurrent.futures.CancelledError if it was cancelled,
+        and concurrent.futures.TimeoutError if timeout seconds
+        passed while waiting, the command keeps running then
+        """
+        try:
+            return self.future.result(timeout)
+        except KeyboardInterrupt:
+            self.cancel()
+            raise
+
+    def done(self):
+        return self.future.done()
+
+    def poll(self):
+        """returns None while running, else the return code of the command,
+        so a job can be followed with SU2.io.HistoryReader.follow(process=job)
+        """
+        if not self.future.done():
+            return None
+        return self.process.returncode
+
+    def cancel(self):
+        """terminates the command, returns False if it had already finished"""
+        if self.future.done() or self.future.running():
+            return False
+        self._cancelled = True
+        self._terminate()
+        return True
+
+    def _terminate(self):
+        if self.process.poll() is not None:
+            return
+        try:
+            if sys.platform == "win32":
+                self.process.terminate()
+            else:
+                os.killpg(self.process.pid, signal.SIGTERM)
+        except OSError:
+            pass
+
+    def _on_done(self, future):
+        if future.cancelled():
+            self._cancelled = True
+            self._terminate()
+
+    def cancelled(self):
+        return self.future.cancelled()
+
+    def add_done_callback(self, function):
+        self.future.add_done_callback(function)
+
+    def __await__(self):
+        return asyncio.wrap_future(self.future).__await__()
+
+    def __repr__(self):
+        if self.future.cancelled():
+            status = "cancelled"
+        elif self.future.done():
+            status = "done"
+        else:
+            status = "running"
+        return "<Job> %s, %s" % (self.Command, status)
+
+
+#: class Job
+
+
+def check_return_code(return_code, message, Command, path):
+    """raises the error of a failed command, see return_code_map"""
 
     if return_code < 0:
         message = "SU2 process was terminated by signal '%s'\n%s" % (
@@ -278,7 +527,7 @@ def run_command(Command):
         raise SystemExit(message)
     elif return_code > 0:
         message = "Path = %s\nCommand = %s\nSU2 process returned error '%s'\n%s" % (
-            os.path.abspath(","),
+            path,
             Command,
             return_code,
             message,
@@ -288,7 +537,3 @@ def run_command(Command):
         else:
             exception = RuntimeError
         raise exception(message)
-    else:
-        sys.stdout.write(message)
-
-    return return_code
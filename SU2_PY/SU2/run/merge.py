@@ -27,8 +27,11 @@
 #  Imports
 # ----------------------------------------------------------------------
 
-import os, sys, shutil, copy
+import os, sys, shutil, copy, re
+import multiprocessing as mp
+import numpy as np
 from .. import io as su2io
+from ..util import mp_eval
 from .interface import SOL as SU2_SOL
 from .interface import SOL_FSI as SU2_SOL_FSI
 
@@ -43,6 +46,8 @@ def merge(config):
     Merges mesh with:
         SU2.run.SOL()    (volume merging)
         internal scripts (surface merging)
+        SU2.run.merge.merge_python() (CSV outputs, if
+            config.MERGE_ENGINE is PYTHON)
 
     Assumptions:
         config.NUMBER_PART is set
@@ -59,7 +64,7 @@ def merge(config):
     """
 
     # local copy
-    konfig = copy.deepcopy(config)
+    konfig = config.snapshot()
 
     # check if needed
     partitions = konfig["NUMBER_PART"]
@@ -106,9 +111,18 @@ def merge_unsteady(config, begintime=0, endtime=None):
 
 def merge_solution(config):
     """SU2.io.merge.merge_solution(config)
-    general volume surface merging with SU2_SOL
+    general volume surface merging with SU2_SOL, or with
+    merge_python() first if config.MERGE_ENGINE is PYTHON
     """
 
+    if config.get("MERGE_ENGINE", "SU2_SOL") == "PYTHON":
+        formats = merge_python(config)
+        if not formats:
+            return
+        konfig = config.snapshot()
+        konfig["OUTPUT_FILES"] = formats
+        config = konfig
+
     SU2_SOL(config)
 
     return
@@ -117,6 +131,203 @@ def merge_solution(config):
 #: merge_solution( config )
 
 
+# output formats written by merge_python()
+python_formats = ["RESTART", "RESTART_ASCII", "CSV", "SURFACE_CSV"]
+
+
+def merge_python(config):
+    """formats = SU2.run.merge.merge_python(config)
+    merges binary or ASCII restarts into the CSV outputs
+    without SU2_SOL, time steps are merged in parallel
+
+    Assumptions:
+        a single zone, and an ASCII su2 mesh for SURFACE_CSV
+
+    Inputs:
+        config - an SU2 config, with config.MATH_PROBLEM
+
+    Outputs:
+        formats - list of the output formats left for SU2_SOL,
+                  ie the requested ones other than python_formats
+
+    Notes:
+        Surface files are the restart fields at the points of
+        config.MARKER_PLOTTING, fields that SU2_SOL computes only
+        on surfaces are not in them.
+        Only time steps whose restart is newer than their outputs
+        are merged, so repeated merges of unsteady runs process
+        the new time steps only.
+        Up to config.NUMBER_PART time steps are merged at once.
+    """
+
+    formats = config.get("OUTPUT_FILES", ["RESTART", "PARAVIEW", "SURFACE_PARAVIEW"])
+    formats = list(formats)
+    fallback = [f for f in formats if not f in python_formats]
+    todo = [f for f in formats if f in python_formats]
+
+    restart_names = get_restartNames(config)
+    if not restart_names or config.get("NZONES", 1) > 1:
+        return formats
+
+    # points of the plotted markers
+    points = None
+    if "SURFACE_CSV" in todo:
+        mesh_name = config["MESH_FILENAME"]
+        markers = config.get("MARKER_PLOTTING", [])
+        if not isinstance(markers, list):
+            markers = [markers]
+        markers = [m for m in markers if m != "NONE"]
+        try:
+            assert mesh_name.endswith(".su2")
+            points = su2io.restart.get_markerPoints(mesh_name, markers)
+        except Exception:
+            todo.remove("SURFACE_CSV")
+            fallback.append("SURFACE_CSV")
+
+    # output file base names, by format
+    if config.get("MATH_PROBLEM", "DIRECT") == "DIRECT":
+        volume_name = config.get("VOLUME_FILENAME", "flow")
+        surface_name = config.get("SURFACE_FILENAME", "surface_flow")
+    else:
+        volume_name = config.get("VOLUME_ADJ_FILENAME", "adjoint")
+        surface_name = config.get("SURFACE_ADJ_FILENAME", "surface_adjoint")
+    volume_name = os.path.splitext(volume_name)[0]
+    surface_name = os.path.splitext(surface_name)[0]
+
+    tasks = []
+    for time_iter, restart_name in restart_names:
+        restart_time = os.path.getmtime(restart_name)
+        restart_base = os.path.splitext(restart_name)[0]
+
+        outputs = []
+        if "RESTART_ASCII" in todo:
+            outputs.append([restart_base + ".csv", None])
+        for output_format, base_name, output_points in [
+            ("CSV", volume_name, None),
+            ("SURFACE_CSV", surface_name, points),
+        ]:
+            if not output_format in todo:
+                continue
+            if time_iter is None:
+                name = base_name + ".csv"
+            else:
+                name = "%s_%05d.csv" % (base_name, time_iter)
+            outputs.append([name, output_points])
+
+        # new since the last merge
+        for output in outputs:
+            output_name = output[0]
+            if os.path.abspath(output_name) == os.path.abspath(restart_name):
+                continue
+            if (
+                os.path.exists(output_name)
+                and os.path.getmtime(output_name) >= restart_time
+            ):
+                continue
+            tasks.append((restart_name, output_name, output[1]))
+
+    if tasks:
+        num_procs = max(1, min(int(config.get("NUMBER_PART", 1)), len(tasks)))
+        # workers of a pool, ie finite differences, can not start their own
+        if num_procs == 1 or mp.current_process().daemon:
+            for task in tasks:
+                merge_restart(*task)
+        else:
+            with mp_eval(merge_restart, num_procs) as pool:
+                results = pool(tasks)
+            for task, result in zip(tasks, results):
+                if isinstance(result, Exception):
+                    raise Exception("merging %s failed\n%s" % (task[1], result))
+
+    return fallback
+
+
+#: def merge_python()
+
+
+def get_restartNames(config):
+    """restart_names = SU2.run.merge.get_restartNames(config)
+    list of the time iteration, None if steady, and the file name
+    of the existing restarts to merge, binary before ASCII
+    """
+
+    if config.get("MATH_PROBLEM", "DIRECT") == "DIRECT":
+        restart_name = config["SOLUTION_FILENAME"]
+    else:
+        objective = config["OBJECTIVE_FUNCTION"]
+        if "," in objective:
+            objective = "COMBO"
+        suffix = su2io.get_adjointSuffix(objective)
+        restart_name = su2io.add_suffix(config["SOLUTION_ADJ_FILENAME"], suffix)
+    restart_base = os.path.splitext(restart_name)[0]
+
+    if config.get("TIME_DOMAIN", "NO") != "YES":
+        for extension in [".dat", ".csv"]:
+            if os.path.exists(restart_base + extension):
+                return [(None, restart_base + extension)]
+        return []
+
+    # all time steps written so far
+    folder, prefix = os.path.split(restart_base)
+    pattern = re.compile(re.escape(prefix) + r"_(\d{5,})\.(dat|csv)$")
+    restarts = {}
+    # sorted, so binary restarts replace ASCII ones
+    for name in sorted(os.listdir(folder or os.curdir)):
+        match = pattern.match(name)
+        if match:
+            restarts[int(match.group(1))] = os.path.join(folder, name)
+
+    return sorted(restarts.items())
+
+
+#: def get_restartNames()
+
+
+def merge_restart(restart_name, output_name, points=None, fields=None):
+    """SU2.run.merge.merge_restart(restart_name,output_name,points=None,fields=None)
+    writes the points and fields of a restart to a CSV file
+    in the ASCII restart format of SU2, a block of points at
+    a time from the memory mapped restart
+
+    Inputs:
+        restart_name - binary or ASCII restart file name
+        output_name  - CSV file name
+        points       - optional, sorted global indices of the
+                       points to write, default is all points
+        fields       - optional, list of field names to write,
+                       default is all fields
+    """
+
+    block_size = 100000
+
+    with su2io.RestartFile(restart_name) as restart:
+        if fields is None:
+            fields = restart.fields
+        if points is None:
+            points = np.arange(restart.n_points)
+        columns = [restart.index[name] for name in fields]
+
+        header = ",".join(['"PointID"'] + ['"%s"' % name for name in fields])
+        line_format = ", ".join(["%i"] + ["%.15e"] * len(fields))
+
+        # written next to the output and renamed when complete
+        temp_name = output_name + ".tmp%i" % os.getpid()
+        with open(temp_name, "w") as output_file:
+            output_file.write(header + "\n")
+            for start in range(0, len(points), block_size):
+                index = points[start : start + block_size]
+                block = restart.data[index][:, columns]
+                block = np.column_stack([index, block])
+                np.savetxt(output_file, block, fmt=line_format)
+
+    os.replace(temp_name, output_name)
+
+    return
+
+
+#: def merge_restart()
+
+
 def merge_multizone(config, begintime=0, endtime=None):
 
     if not endtime:
@@ -69,7 +69,7 @@ def projection(config, state={}, step=1e-3):
         ./
     """
     # local copy
-    konfig = copy.deepcopy(config)
+    konfig = config.snapshot()
 
     # choose dv values
     Definition_DV = konfig["DEFINITION_DV"]
@@ -2,7 +2,7 @@ from .switch import switch
 from .bunch import Bunch as bunch
 from .ordered_dict import OrderedDict as ordered_dict
 from .ordered_bunch import OrderedBunch as ordered_bunch
-from .plot import write_plot, tecplot, paraview
+from .plot import write_plot, tecplot, paraview, PlotWriter
 from .lhc_unif import lhc_unif
 from .mp_eval import mp_eval
 from .which import which
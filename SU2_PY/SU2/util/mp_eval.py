@@ -1,110 +1,331 @@
 import os
 import multiprocessing as mp
 import numpy as np
-import sys
+import sys, time, signal, traceback
 
 if sys.version_info[0] > 2:
     # In Py3, range corresponds to Py2 xrange
     xrange = range
 
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+# mpi ranks available to each evaluation, set in the workers
+_worker_ranks = None
+
+
+def worker_ranks():
+    """ranks = SU2.util.mp_eval.worker_ranks()
+    number of mpi ranks the current evaluation may use,
+    ie for config.NUMBER_PART, None outside of an mp_eval worker
+    """
+    return _worker_ranks
+
 
 class mp_eval(object):
-    def __init__(self, function, num_procs=None):
+    """pool = SU2.util.mp_eval(function,num_procs=None,ranks=1,timeout=None,chunksize=1)
+
+    Pool of persistent worker processes evaluating function(*input)
+    for many inputs, ie the designs of a design of experiments.
+
+    Example:
+    with SU2.util.mp_eval(func, ranks=4) as pool:
+        results = pool(inputs)                  # in input order
+        for index, result in pool.imap_unordered(inputs):
+            print(index, result)                # in completion order
+
+    Inputs:
+        function  - function to evaluate, called as function(*input)
+        num_procs - number of workers, default is the number
+                    of cpus divided by ranks
+        ranks     - number of mpi ranks each evaluation may use, see
+                    SU2.util.mp_eval.worker_ranks()
+        timeout   - optional, seconds a single task may run before
+                    its worker is terminated and replaced
+        chunksize - number of tasks sent to a worker at once
+
+    Notes:
+        A task that raises, times out or crashes its worker
+        returns a TaskFailure in place of its result.
+        Crashed or timed out workers are replaced, the
+        other tasks of their chunk are resubmitted. Jobs
+        started with SU2.run are cancelled with their worker.
+        Workers start on first use or with start(), and
+        stop with close() or at the end of the with block.
+    """
+
+    worker_ranks = staticmethod(worker_ranks)
+
+    def __init__(self, function, num_procs=None, ranks=1, timeout=None, chunksize=1):
 
         self.__name__ = function.__name__
 
-        tasks = mp.JoinableQueue()
-        results = mp.Queue()
-        function = TaskMaster(function)
-
         if num_procs is None:
-            num_procs = mp.cpu_count()
+            num_procs = max(1, mp.cpu_count() // max(1, ranks))
 
-        procs = [QueueMaster(tasks, results, function) for i in xrange(num_procs)]
+        self.function = TaskMaster(function)
+        self.num_procs = num_procs
+        self.ranks = ranks
+        self.timeout = timeout
+        self.chunksize = max(1, int(chunksize))
 
-        self.tasks = tasks
-        self.results = results
-        self.function = function
-        self.procs = procs
+        self.results = None
+        self.procs = []
 
         return
 
-    def __call__(self, inputs):
+    def start(self):
+        """starts the workers, if not already running"""
+        if self.procs:
+            return
+        self.results = mp.Queue()
+        self.procs = [self._spawn(i) for i in xrange(self.num_procs)]
 
-        tasks = self.tasks
-        results = self.results
+    def close(self):
+        """stops the workers, waiting for them to finish their current task"""
+        for proc in self.procs:
+            proc.task_queue.put(None)
+        for proc in self.procs:
+            proc.join(5.0)
+            if proc.is_alive():
+                proc.terminate()
+        self.procs = []
+        self.results = None
+
+    def terminate(self):
+        """stops the workers immediately"""
+        for proc in self.procs:
+            proc.terminate()
+            proc.join()
+        self.procs = []
+        self.results = None
 
-        if isinstance(inputs, np.ndarray):
-            n_inputs = inputs.shape[0]
-        elif isinstance(inputs, list):
-            n_inputs = len(inputs)
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
         else:
-            raise Exception("unsupported input")
+            self.terminate()
 
-        for i_input, this_input in enumerate(inputs):
-            this_job = {"index": i_input, "input": this_input, "result": None}
-            tasks.put(this_job)
-        # end
+    def _spawn(self, i_proc):
+        return QueueMaster(mp.Queue(), self.results, self.function, self.ranks, i_proc)
 
-        # wait for tasks
-        tasks.join()
+    def __call__(self, inputs):
+        """results = pool(inputs)
+        evaluates all inputs, returns the list of results in input order
+        """
+
+        n_inputs = self._count(inputs)
 
-        # pull results
         result_list = [[]] * n_inputs
-        for i in xrange(n_inputs):
-            result = results.get()
-            i_result = result["index"]
-            result_list[i_result] = result["result"]
+        for i_result, result in self.imap_unordered(inputs):
+            result_list[i_result] = result
 
         return result_list
 
-    def __del__(self):
+    def imap_unordered(self, inputs):
+        """for index, result in pool.imap_unordered(inputs)
+        generator yielding the results as the tasks complete
+        """
 
-        for proc in self.procs:
-            self.tasks.put(None)
-        self.tasks.join()
+        self._count(inputs)
+        self.start()
+
+        # pending chunks of job dictionaries
+        todo = []
+        chunk = []
+        for i_input, this_input in enumerate(inputs):
+            chunk.append({"index": i_input, "input": this_input, "result": None})
+            if len(chunk) == self.chunksize:
+                todo.append(chunk)
+                chunk = []
+        if chunk:
+            todo.append(chunk)
+
+        # jobs and deadline of each busy worker
+        busy = {}
+
+        while todo or busy:
+
+            # feed idle workers
+            for i_proc, proc in enumerate(self.procs):
+                if not todo:
+                    break
+                if i_proc in busy:
+                    continue
+                chunk = todo.pop(0)
+                proc.task_queue.put(chunk)
+                busy[i_proc] = [chunk, self._deadline()]
+
+            # collect the results
+            for index, result in self._collect(busy, 0.1):
+                yield index, result
+
+            # check busy workers for crashes and timeouts
+            failed = []
+            for i_proc in list(busy.keys()):
+                proc = self.procs[i_proc]
+                deadline = busy[i_proc][1]
+
+                if not proc.is_alive():
+                    reason = "worker exited with code %s" % proc.exitcode
+                elif deadline is not None and time.time() > deadline:
+                    reason = "timed out after %s s" % self.timeout
+                    proc.terminate()
+                else:
+                    continue
+
+                proc.join(5.0)
+                if proc.is_alive():
+                    proc.kill()
+                    proc.join()
+                failed.append((i_proc, proc.running.value, reason))
+
+            if not failed:
+                continue
+
+            # results queued before the workers stopped are still valid
+            for index, result in self._collect(busy, 0.0):
+                yield index, result
+
+            for i_proc, running, reason in failed:
+                self.procs[i_proc] = self._spawn(i_proc)
+                if not i_proc in busy:
+                    continue
+                chunk = busy.pop(i_proc)[0]
+
+                # the running task failed, the rest is resubmitted
+                rest = [job for job in chunk if job["index"] != running]
+                if rest:
+                    todo.insert(0, rest)
+                if len(rest) < len(chunk):
+                    yield running, TaskFailure("%s: %s" % (self.function, reason))
+
+        #: while tasks
 
         return
 
+    def _collect(self, busy, timeout):
+        """index, result pairs queued by the busy workers,
+        waits up to timeout seconds for the first one
+        """
+
+        collected = []
+        while True:
+            try:
+                i_proc, this_job = self.results.get(timeout=timeout)
+            except queue.Empty:
+                return collected
+            timeout = 0.0
+
+            # skip late results of replaced workers
+            if not i_proc in busy:
+                continue
+            chunk = busy[i_proc][0]
+            if chunk[0]["index"] != this_job["index"]:
+                continue
+            chunk.pop(0)
+            if chunk:
+                busy[i_proc][1] = self._deadline()
+            else:
+                del busy[i_proc]
+            collected.append((this_job["index"], this_job["result"]))
+
+    def _deadline(self):
+        if self.timeout is None:
+            return None
+        return time.time() + self.timeout
+
+    def _count(self, inputs):
+        if isinstance(inputs, np.ndarray):
+            return inputs.shape[0]
+        elif isinstance(inputs, list):
+            return len(inputs)
+        else:
+            raise Exception("unsupported input")
+
+    def __repr__(self):
+        return "<mp_eval> %s, %i workers x %i ranks" % (
+            self.__name__,
+            self.num_procs,
+            self.ranks,
+        )
+
+
+class TaskFailure(Exception):
+    """result of a task that raised, timed out or crashed its worker"""
+
+    pass
+
 
 class QueueMaster(mp.Process):
-    def __init__(self, task_queue, result_queue, task_class=None):
+    def __init__(self, task_queue, result_queue, task_class=None, ranks=1, i_proc=0):
         mp.Process.__init__(self)
         self.task_queue = task_queue
         self.result_queue = result_queue
         self.task_class = task_class
+        self.ranks = ranks
+        self.i_proc = i_proc
+        # index of the running task, read back if the worker stops
+        self.running = mp.Value("l", -1)
         self.daemon = True
         self.start()
 
     def run(self):
+        global _worker_ranks
+
         proc_name = self.name
+        i_proc = self.i_proc
         parentPID = os.getppid()
+        _worker_ranks = self.ranks
+
+        signal.signal(signal.SIGTERM, _terminate_worker)
 
         while True:
 
             if os.getppid() != parentPID:
                 break  # parent died
 
-            this_job = self.task_queue.get()
+            chunk = self.task_queue.get()
 
-            if this_job is None:
-                self.task_queue.task_done()
+            if chunk is None:
                 break  # kill signal
 
-            this_input = this_job["input"]
-            this_task = self.task_class
+            for this_job in chunk:
+
+                this_input = this_job["input"]
+                this_task = self.task_class
+                self.running.value = this_job["index"]
 
-            this_data = this_task(*this_input)
-            this_job["result"] = this_data
-            self.result_queue.put(this_job)
+                try:
+                    this_data = this_task(*this_input)
+                except Exception:
+                    this_data = TaskFailure(traceback.format_exc())
 
-            self.task_queue.task_done()
+                this_job["result"] = this_data
+                self.result_queue.put((i_proc, this_job))
+                self.running.value = -1
 
         #: while alive
 
         return
 
 
+def _terminate_worker(signum, frame):
+    """SIGTERM handler of the workers, also stops the SU2 runs
+    of the current task, they run in their own process groups
+    """
+    interface = sys.modules.get("SU2.run.interface")
+    if interface is not None:
+        interface.cancel_jobs()
+    os._exit(128 + signum)
+
+
 class TaskMaster(object):
     def __init__(self, func):
         self.func = func
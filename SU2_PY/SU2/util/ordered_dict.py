@@ -51,7 +51,7 @@ class OrderedDict(dict):
         "od.__setitem__(i, y) <==> od[i]=y"
         # Setting a new item creates a new link which goes at the end of the linked
         # list, and the inherited dictionary is updated with the new key/value pair.
-        if key not in self:
+        if not dict.__contains__(self, key):
             root = self.__root
             last = root[0]
             last[1] = root[0] = self.__map[key] = [last, root, key]
@@ -85,7 +85,7 @@ class OrderedDict(dict):
     def clear(self):
         "od.clear() -> None.  Remove all items from od."
         try:
-            for node in self.__map.itervalues():
+            for node in self.__map.values():
                 del node[:]
             root = self.__root
             root[:] = [root, root, None]
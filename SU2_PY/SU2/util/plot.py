@@ -26,22 +26,170 @@
 # License along with SU2. If not, see <http://www.gnu.org/licenses/>.
 
 
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import os
+import numpy as np
+
+
 def write_plot(filename, plot_format, data_plot, keys_plot=None):
     """write_plot(filename,plot_format,data_plot,keys_plot=[])
     writes a tecplot or paraview plot of dictionary data
     data_plot is a dictionary of lists with equal length
     if data_plot is an ordered dictionary, will output in order
     otherwise use keys_plot to specify the order of output
+    see PlotWriter to append to the plot instead
     """
 
-    default_spacing = 16
-    indent_spacing = 0
+    with PlotWriter(filename, plot_format, keys_plot) as plot:
+        plot.write(data_plot, start=0)
+
+    return
+
 
-    if keys_plot is None:
-        keys_plot = []
+class PlotWriter(object):
+    """plot = SU2.util.plot.PlotWriter(filename,plot_format,keys_plot=None)
+
+    Tabular plot file kept open between writes, each write
+    only formats and appends the rows that are new since the
+    last one. Columns are formatted in blocks with numpy.
+
+    Example:
+    with SU2.util.plot.PlotWriter('gradients.csv', 'CSV') as plot:
+        for i_dv in range(n_dv):
+            grads['VARIABLE'].append(i_dv)
+            grads['DRAG'].append(grad)
+            plot.write(grads)        # appends one line
+
+    Inputs:
+        filename    - plot file name
+        plot_format - TECPLOT, CSV or PARAVIEW as in write_plot(),
+                      or NPZ for a numpy archive of the columns
+        keys_plot   - optional, column order, default is the
+                      order of the keys of the written data
+
+    Notes:
+        The file is rewritten when the columns change, or when
+        it was changed by someone else since the last write.
+        NPZ archives can not be appended to, they are rewritten.
+        Writers can be pickled, they reopen the file when used.
+    """
+
+    def __init__(self, filename, plot_format, keys_plot=None):
+        self.filename = os.path.abspath(filename)
+        self.plot_format = plot_format
+        self.keys_plot = list(keys_plot) if keys_plot else None
+
+        # columns of the file, and the end of its header and of each line
+        self.keys = None
+        self.offsets = []
+        self._file = None
+
+    def write(self, data_plot, start=None):
+        """SU2.util.plot.PlotWriter.write(data_plot,start=None)
+        writes the lines of data_plot from line start on, default
+        is the first line not written yet, see write_plot()
+        """
+
+        keys_plot = self.keys_plot or list(data_plot.keys())
+
+        n_lines = 0
+        for i, key in enumerate(keys_plot):
+            # check vector lengths
+            value = data_plot[key]
+            if i == 0:
+                n_lines = len(value)
+            else:
+                assert n_lines == len(value), "unequal plot vector lengths"
+
+        if self.plot_format == "NPZ":
+            columns = dict([(key, np.asarray(data_plot[key])) for key in keys_plot])
+            with open(self.filename, "wb") as plot_file:
+                np.savez(plot_file, **columns)
+            self.keys = keys_plot
+            return
+
+        # lines written so far, if the file is still as left
+        plot_file = self._open()
+        if (
+            keys_plot != self.keys
+            or not self.offsets
+            or plot_file.tell() != self.offsets[-1]
+        ):
+            self.keys = None
+            start = 0
+        n_written = max(0, len(self.offsets) - 1)
+        if start is None or start > n_written:
+            start = n_written
+
+        header, line_format = get_plotFormat(self.plot_format, keys_plot)
+        if self.keys is None:
+            plot_file.seek(0)
+            plot_file.truncate()
+            plot_file.write(header.encode())
+            self.keys = keys_plot
+            self.offsets = [plot_file.tell()]
+        else:
+            del self.offsets[start + 1 :]
+            plot_file.seek(self.offsets[-1])
+            plot_file.truncate()
+
+        if start < n_lines:
+            columns = [data_plot[key][start:n_lines] for key in keys_plot]
+            lines = np.char.encode(format_plotLines(line_format, columns))
+            plot_file.write(b"".join(lines.tolist()))
+            ends = self.offsets[-1] + np.cumsum(np.char.str_len(lines))
+            self.offsets.extend(ends.tolist())
+
+        plot_file.flush()
+
+    def _open(self):
+        # reopen if closed, or if the file was removed meanwhile
+        if self._file is not None and not os.path.exists(self.filename):
+            self.close()
+        if self._file is None:
+            mode = "rb+" if os.path.exists(self.filename) else "wb+"
+            self._file = open(self.filename, mode)
+        self._file.seek(0, os.SEEK_END)
+        return self._file
+
+    def close(self):
+        """closes the file, the next write reopens it"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_file"] = None
+        return state
+
+    def __repr__(self):
+        return "<PlotWriter> %s, %i lines" % (
+            self.filename,
+            max(0, len(self.offsets) - 1),
+        )
+
+
+#: class PlotWriter
+
+
+def get_plotFormat(plot_format, keys_plot):
+    """header, line_format = get_plotFormat(plot_format,keys_plot)
+    header text and line format of a tecplot or paraview
+    plot, see write_plot() and format_plotLine()
+    """
 
-    if not keys_plot:
-        keys_plot = data_plot.keys()
+    default_spacing = 16
+    indent_spacing = 0
 
     keys_print = ['"' + key + '"' for key in keys_plot]
     keys_space = [default_spacing] * len(keys_plot)
@@ -52,40 +200,45 @@ def write_plot(filename, plot_format, data_plot, keys_plot=None):
         indent_spacing += 10
     indent_spacing = " " * indent_spacing
 
-    n_lines = 0
     for i, key in enumerate(keys_plot):
-        # check vector lengths
-        value = data_plot[key]
-        if i == 0:
-            n_lines = len(value)
-        else:
-            assert n_lines == len(value), "unequal plot vector lengths"
-
         # check spacing
         if len(key) > keys_space[i]:
             keys_space[i] = len(key)
         keys_space[i] = "%-" + str(keys_space[i]) + "s"
 
-    plotfile = open(filename, "w")
-    plotfile.write(header)
-    for i, key in enumerate(keys_print):
-        if i > 0:
-            plotfile.write(", ")
-        plotfile.write(keys_space[i] % key)
-    plotfile.write("\n")
-
-    for i_line in range(n_lines):
-        plotfile.write(indent_spacing)
-        for j, key in enumerate(keys_plot):
-            value = data_plot[key]
-            if j > 0:
-                plotfile.write(", ")
-            plotfile.write(keys_space[j] % value[i_line])
-        plotfile.write("\n")
+    header += ", ".join([space % key for space, key in zip(keys_space, keys_print)])
+    header += "\n"
 
-    plotfile.close()
+    return header, (indent_spacing, keys_space)
 
-    return
+
+def format_plotLine(line_format, values):
+    """line = format_plotLine(line_format,values)
+    text of one plot line, see get_plotFormat()
+    """
+    indent_spacing, keys_space = line_format
+    line = ", ".join([space % value for space, value in zip(keys_space, values)])
+    return indent_spacing + line + "\n"
+
+
+def format_plotLines(line_format, columns):
+    """lines = format_plotLines(line_format,columns)
+    array of the text of the plot lines of a list of columns,
+    as format_plotLine() for each line, formatted column-wise
+    """
+    indent_spacing, keys_space = line_format
+
+    lines = None
+    for space, column in zip(keys_space, columns):
+        if not isinstance(column, np.ndarray):
+            column = np.array(list(column), dtype=object)
+        text = np.char.ljust(column.astype(str), int(space[2:-1]))
+        if lines is None:
+            lines = np.char.add(indent_spacing, text)
+        else:
+            lines = np.char.add(np.char.add(lines, ", "), text)
+
+    return np.char.add(lines, "\n")
 
 
 def tecplot(filename, data_plot, keys_plot=[]):
@@ -188,6 +188,8 @@ class Point:
     ID: ID of the node.
     CP: Coordinate system definition of the position.
     CD: Coordinate system definition of the output coming from Nastran.
+    Once the mesh is read, the nodal vectors are views into the (nPoint,3)
+    arrays of the solver, see Solver.__setNodalArrays.
     """
 
     def __init__(self):
@@ -274,8 +276,8 @@ class Point:
         self.CD = CD
 
     def updateCoordVel(self):
-        self.Coord_n = np.copy(self.Coord)
-        self.Vel_n = np.copy(self.Vel)
+        self.Coord_n[:] = self.Coord
+        self.Vel_n[:] = self.Vel
 
 
 class Solver:
@@ -326,6 +328,13 @@ class Solver:
         self.nRefSys = int()
         self.node = []
         self.markers = {}
+        # Nodal values of all the points, (nPoint,3), shared with self.node
+        self.Coord0 = np.zeros((0, 3))
+        self.Coord = np.zeros((0, 3))
+        self.Coord_n = np.zeros((0, 3))
+        self.Vel = np.zeros((0, 3))
+        self.Vel_n = np.zeros((0, 3))
+        self.Force = np.zeros((0, 3))
         self.refsystems = []
         self.ImposedMotionToSet = True
         self.ImposedMotionFunction = []
@@ -558,6 +567,8 @@ class Solver:
 
         self.markers[self.FSI_marker].sort()
 
+        self.__setNodalArrays()
+
         print("Number of points: {}".format(self.nPoint))
         print("Number of markers: {}".format(self.nMarker))
         print("Number of reference systems: {}".format(self.nRefSys))
@@ -568,6 +579,27 @@ class Solver:
             )
         )
 
+    def __setNodalArrays(self):
+        """
+        This method gathers the nodal values in (nPoint,3) arrays and makes the
+        vectors of each node views into them, so that the whole structure can be
+        updated with array operations.
+        """
+
+        self.Coord0 = np.zeros((self.nPoint, 3))
+        self.Coord = np.zeros((self.nPoint, 3))
+        self.Coord_n = np.zeros((self.nPoint, 3))
+        self.Vel = np.zeros((self.nPoint, 3))
+        self.Vel_n = np.zeros((self.nPoint, 3))
+        self.Force = np.zeros((self.nPoint, 3))
+
+        for iPoint in range(self.nPoint):
+            node = self.node[iPoint]
+            for name in ["Coord0", "Coord", "Coord_n", "Vel", "Vel_n", "Force"]:
+                nodalArray = getattr(self, name)
+                nodalArray[iPoint] = getattr(node, name).ravel()
+                setattr(node, name, nodalArray[iPoint].reshape((3, 1)))
+
     def __checkBlankField(self, string):
         """
         This method considers that Nastran apply 0 when the reference system is not specified
@@ -598,9 +630,8 @@ class Solver:
 
         self.F = np.zeros((self.nDof, 1))
 
-        self.Ux = np.zeros((self.nPoint, self.nDof))
-        self.Uy = np.zeros((self.nPoint, self.nDof))
-        self.Uz = np.zeros((self.nPoint, self.nDof))
+        # Mode shapes, the rows of each point are its x, y and z components
+        self.U = np.zeros((self.nPoint * 3, self.nDof))
 
         with open(self.Punch_file, "r") as punchfile:
             print("Opened punch file " + self.Punch_file + ".")
@@ -651,9 +682,9 @@ class Solver:
                                 ux = RotatedOutput[0]
                                 uy = RotatedOutput[1]
                                 uz = RotatedOutput[2]
-                            self.Ux[iPoint][imode] = ux
-                            self.Uy[iPoint][imode] = uy
-                            self.Uz[iPoint][imode] = uz
+                            self.U[3 * iPoint : 3 * iPoint + 3, imode] = np.ravel(
+                                (ux, uy, uz)
+                            )
                             iPoint = iPoint + 1
                             line = punchfile.readline()
                         if line[1] == "S":
@@ -664,9 +695,7 @@ class Solver:
 
         self.__setNonDiagonalStructuralMatrices()
 
-        self.UxT = self.Ux.transpose()
-        self.UyT = self.Uy.transpose()
-        self.UzT = self.Uz.transpose()
+        self.UT = self.U.transpose()
 
         if n < self.nDof:
             raise Exception(
@@ -811,37 +840,14 @@ class Solver:
         nodal velocities at the interface.
         """
 
-        # Multiply the modal matrices with modal amplitudes
-        X_vel = self.Ux.dot(self.qdot)
-        Y_vel = self.Uy.dot(self.qdot)
-        Z_vel = self.Uz.dot(self.qdot)
+        # Multiply the modal matrix with modal amplitudes
+        self.Vel[:] = self.U.dot(self.qdot).reshape((self.nPoint, 3))
+        self.Coord[:] = self.U.dot(self.q).reshape((self.nPoint, 3))
+        self.Coord += self.Coord0
 
-        X_disp = self.Ux.dot(self.q)
-        Y_disp = self.Uy.dot(self.q)
-        Z_disp = self.Uz.dot(self.q)
-
-        for iPoint in range(self.nPoint):
-            coord0 = self.node[iPoint].GetCoord0()
-            self.node[iPoint].SetCoord(
-                (
-                    X_disp[iPoint] + coord0[0],
-                    Y_disp[iPoint] + coord0[1],
-                    Z_disp[iPoint] + coord0[2],
-                )
-            )
-            self.node[iPoint].SetVel((X_vel[iPoint], Y_vel[iPoint], Z_vel[iPoint]))
-
-            if initialize:
-                self.node[iPoint].SetCoord_n(
-                    (
-                        X_disp[iPoint] + coord0[0],
-                        Y_disp[iPoint] + coord0[1],
-                        Z_disp[iPoint] + coord0[2],
-                    )
-                )
-                self.node[iPoint].SetVel_n(
-                    (X_vel[iPoint], Y_vel[iPoint], Z_vel[iPoint])
-                )
+        if initialize:
+            self.Coord_n[:] = self.Coord
+            self.Vel_n[:] = self.Vel
 
     def __setRestart(self):
         """
@@ -983,16 +989,8 @@ class Solver:
         """
         This method uses the nodal forces and the mode shapes to obtain the modal forces.
         """
-        nodeList = self.markers[self.FSI_marker]
-        FX = np.zeros((self.nPoint, 1))
-        FY = np.zeros((self.nPoint, 1))
-        FZ = np.zeros((self.nPoint, 1))
-        for iPoint in nodeList:
-            Force = self.node[iPoint].GetForce()
-            FX[iPoint] = float(Force[0])
-            FY[iPoint] = float(Force[1])
-            FZ[iPoint] = float(Force[2])
-        self.F = self.UxT.dot(FX) + self.UyT.dot(FY) + self.UzT.dot(FZ)
+        # Only the nodes of the FSI marker are loaded
+        self.F = self.UT.dot(self.Force.reshape((self.nPoint * 3, 1)))
 
     def __ComputeResidual(self):
         """
@@ -1113,15 +1111,23 @@ class Solver:
         self.__reset(self.qddot)
         self.__reset(self.a)
 
-        for iPoint in range(self.nPoint):
-            self.node[iPoint].updateCoordVel()
+        self.Coord_n[:] = self.Coord
+        self.Vel_n[:] = self.Vel
 
     def applyload(self, iVertex, fx, fy, fz):
         """
         This method can be accessed from outside to set the nodal forces.
         """
         iPoint = self.getVertexGlobalIndex(self.FSI_marker, iVertex)
-        self.node[iPoint].SetForce((fx, fy, fz))
+        self.Force[iPoint] = (fx, fy, fz)
+
+    def applyloads(self, vertices, loads):
+        """
+        This method can be accessed from outside to set the nodal forces
+        of several vertices of the interface at once, loads is (nVertex,3).
+        """
+        iPoints = self.getVertexGlobalIndices(self.FSI_marker)[vertices]
+        self.Force[iPoints] = np.reshape(loads, (-1, 3))
 
     def getNumberOfModes(self):
         """
@@ -1176,3 +1182,30 @@ class Solver:
         iPoint = self.markers[markerID][iVertex]
         halo = False
         return halo
+
+    def AreHaloNodes(self, markerID):
+
+        # There are no halo nodes in this solver as it is serial
+        return np.zeros(len(self.markers[markerID]), dtype=bool)
+
+    def getVertexGlobalIndices(self, markerID):
+
+        # This solver is serial, thus global=local
+        return np.array(self.markers[markerID], dtype=int)
+
+    def getInterfaceNodesPosInit(self, markerID):
+
+        return self.Coord0[self.markers[markerID]]
+
+    def getInterfaceNodesDisp(self, markerID):
+
+        iPoints = self.markers[markerID]
+        return self.Coord[iPoints] - self.Coord0[iPoints]
+
+    def getInterfaceNodesVel(self, markerID):
+
+        return self.Vel[self.markers[markerID]]
+
+    def getInterfaceNodesVelNm1(self, markerID):
+
+        return self.Vel_n[self.markers[markerID]]